@@ -0,0 +1,170 @@
+"""
+bench_crypto.py
+Measures the marshalling cost of each qubipy.crypto.utils wrapper.
+
+Usage:
+    python benchmarks/bench_crypto.py
+    python benchmarks/bench_crypto.py --size 4096    # size of the KangarooTwelve input
+
+For each wrapper, three rows are timed:
+    copy        the previous code path: every argument copied into a new ctypes array with
+                from_buffer_copy, and sibling arrays built element by element
+    bytes       the wrapper called with bytes, passed to the library without copying
+    zero-copy   the wrapper called with slices of a preallocated bytearray and an `out` buffer,
+                as in a hashing loop; nothing is allocated but the result
+"""
+
+import argparse
+import ctypes
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qubipy.crypto import utils
+from qubipy.crypto.utils import *
+
+U8 = ctypes.c_uint8
+U8_P = ctypes.POINTER(ctypes.c_uint8)
+
+
+def _copying(name: str, argtypes: list):
+    """
+    Returns a separate binding of `name` declared like the previous code, with typed pointers.
+    """
+    func = utils.lib[name]
+    func.argtypes = argtypes
+    return func
+
+
+def _copy(data: bytes):
+    return (U8 * len(data)).from_buffer_copy(data)
+
+
+def previous_paths() -> dict:
+    """
+    Reproduces the marshalling of the previous wrappers, one function per wrapper.
+    """
+    subseed_fn = _copying('getSubseedFromSeed', [U8_P, U8_P])
+    private_fn = _copying('getPrivateKeyFromSubSeed', [U8_P, U8_P])
+    public_fn = _copying('getPublicKeyFromPrivateKey', [U8_P, U8_P])
+    identity_fn = _copying('getIdentityFromPublicKey', [U8_P, ctypes.POINTER(ctypes.c_char), ctypes.c_bool])
+    tx_hash_fn = _copying('getTxHashFromDigest', [U8_P, ctypes.POINTER(ctypes.c_char)])
+    from_identity_fn = _copying('getPublicKeyFromIdentity', [ctypes.c_char_p, U8_P])
+    k12_fn = _copying('KangarooTwelve', [U8_P, ctypes.c_uint, U8_P, ctypes.c_uint])
+    sign_fn = _copying('sign', [U8_P, U8_P, U8_P, U8_P])
+    sign_k_fn = _copying('signWithNonceK', [U8_P, U8_P, U8_P, U8_P])
+    verify_fn = _copying('verify', [U8_P, U8_P, U8_P])
+
+    def call(func, out_size, *args):
+        output = (U8 * out_size)()
+        func(*args, output)
+        return bytes(output)
+
+    def identity(public_key):
+        output = (ctypes.c_char * 60)()
+        identity_fn(_copy(public_key), output, False)
+        return bytes(output).decode('ascii')
+
+    def tx_hash(digest):
+        output = (ctypes.c_char * 60)()
+        tx_hash_fn(_copy(digest), output)
+        return bytes(output)
+
+    def kangaroo_twelve_copy(data, size, out_size):
+        output = (U8 * out_size)()
+        k12_fn(_copy(data), size, output, out_size)
+        return bytes(output)
+
+    def siblings(depth, input_bytes, siblings):
+        siblings_array = ((U8 * 32) * 32)()
+        for i, sib in enumerate(siblings):
+            siblings_array[i] = (U8 * 32)(*sib)
+        return _copy(input_bytes), siblings_array
+
+    return {
+        'get_subseed_from_seed': lambda seed: call(subseed_fn, 32, _copy(seed)),
+        'get_private_key_from_subseed': lambda subseed: call(private_fn, 32, _copy(subseed)),
+        'get_public_key_from_private_key': lambda private_key: call(public_fn, 32, _copy(private_key)),
+        'get_identity_from_public_key': identity,
+        'get_tx_hash_from_digest': tx_hash,
+        'get_public_key_from_identity': lambda identity: call(from_identity_fn, 32, identity.encode('utf-8')),
+        'kangaroo_twelve': kangaroo_twelve_copy,
+        'sign': lambda subseed, public_key, digest: call(sign_fn, 64, _copy(subseed), _copy(public_key), _copy(digest)),
+        'sign_with_nonce_k': lambda k, public_key, digest: call(sign_k_fn, 64, _copy(k), _copy(public_key), _copy(digest)),
+        'verify': lambda public_key, digest, signature: bool(verify_fn(_copy(public_key), _copy(digest), _copy(signature))),
+        'get_digest_from_siblings32 (marshalling)': siblings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=1024, help='Size in bytes of the KangarooTwelve input')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions, the best one is kept')
+    parser.add_argument('--number', type=int, default=20000, help='Calls per repetition')
+    args = parser.parse_args()
+
+    seed = b'a' * 55
+    subseed = get_subseed_from_seed(seed)
+    private_key = get_private_key_from_subseed(subseed)
+    public_key = get_public_key_from_private_key(private_key)
+    identity = get_identity_from_public_key(public_key)
+    message = os.urandom(args.size)
+    digest = kangaroo_twelve(message, len(message), 32)
+    signature = sign(subseed, public_key, digest)
+    siblings = [os.urandom(32) for _ in range(24)]
+
+    # One arena holding every input and output, as a hashing loop would reuse it.
+    arena = bytearray(seed + subseed + private_key + public_key + digest + signature + message + bytes(32 * 32 + 64))
+    view = memoryview(arena)
+    offsets, position = {}, 0
+    for name, size in (('seed', 55), ('subseed', 32), ('private_key', 32), ('public_key', 32), ('digest', 32),
+                       ('signature', 64), ('message', len(message)), ('siblings', 32 * 32), ('out', 64)):
+        offsets[name] = view[position:position + size]
+        position += size
+    offsets['siblings'][:len(siblings) * 32] = b''.join(siblings)
+    a, out = offsets, offsets['out']
+
+    previous = previous_paths()
+
+    cases = {
+        'get_subseed_from_seed': (lambda: previous['get_subseed_from_seed'](seed), lambda: get_subseed_from_seed(seed), lambda: get_subseed_from_seed(a['seed'], out=out)),
+        'get_private_key_from_subseed': (lambda: previous['get_private_key_from_subseed'](subseed), lambda: get_private_key_from_subseed(subseed), lambda: get_private_key_from_subseed(a['subseed'], out=out)),
+        'get_public_key_from_private_key': (lambda: previous['get_public_key_from_private_key'](private_key), lambda: get_public_key_from_private_key(private_key), lambda: get_public_key_from_private_key(a['private_key'], out=out)),
+        'get_identity_from_public_key': (lambda: previous['get_identity_from_public_key'](public_key), lambda: get_identity_from_public_key(public_key), lambda: get_identity_from_public_key(a['public_key'])),
+        'get_tx_hash_from_digest': (lambda: previous['get_tx_hash_from_digest'](digest), lambda: get_tx_hash_from_digest(digest), lambda: get_tx_hash_from_digest(a['digest'])),
+        'get_public_key_from_identity': (lambda: previous['get_public_key_from_identity'](identity), lambda: get_public_key_from_identity(identity), lambda: get_public_key_from_identity(identity, out=out)),
+        'check_sum_identity': (None, lambda: check_sum_identity(identity), None),
+        f'kangaroo_twelve ({args.size} B)': (lambda: previous['kangaroo_twelve'](message, len(message), 32), lambda: kangaroo_twelve(message, len(message), 32), lambda: kangaroo_twelve(a['message'], len(message), 32, out=out)),
+        'sign': (lambda: previous['sign'](subseed, public_key, digest), lambda: sign(subseed, public_key, digest), lambda: sign(a['subseed'], a['public_key'], a['digest'], out=out)),
+        'sign_with_nonce_k': (lambda: previous['sign_with_nonce_k'](subseed, public_key, digest), lambda: sign_with_nonce_k(subseed, public_key, digest), lambda: sign_with_nonce_k(a['subseed'], a['public_key'], a['digest'], out=out)),
+        'verify': (lambda: previous['verify'](public_key, digest, signature), lambda: verify(public_key, digest, signature), lambda: verify(a['public_key'], a['digest'], a['signature'])),
+    }
+
+    if hasattr(utils.lib, 'getDigestFromSiblings32'):
+        cases['get_digest_from_siblings32'] = (None,
+                                               lambda: get_digest_from_siblings32(len(siblings), digest, 32, 5, siblings),
+                                               lambda: get_digest_from_siblings32(len(siblings), a['digest'], 32, 5, a['siblings'], out=out))
+    else:
+        # The bundled library does not export the function: only the marshalling of its arguments is compared.
+        cases['get_digest_from_siblings32 (marshalling)'] = (lambda: previous['get_digest_from_siblings32 (marshalling)'](len(siblings), digest, siblings),
+                                                             lambda: (utils._input(digest, 32), utils._input(b''.join(siblings).ljust(32 * 32, b'\x00'), 32 * 32)),
+                                                             lambda: (utils._input(a['digest'], 32), utils._input(a['siblings'], 32 * 32)))
+
+    rows = ('copy', 'bytes', 'zero-copy')
+    print(f"{'wrapper':<44}" + ''.join(f'{row:>14}' for row in rows) + f"{'speed-up':>10}")
+
+    for name, calls in cases.items():
+        timings = {}
+        for row, call in zip(rows, calls):
+            if call is not None:
+                timings[row] = min(timeit.repeat(call, number=args.number, repeat=args.repeat)) / args.number
+
+        cells = ''.join(f'{timings[row] * 1e9:>11.0f} ns' if row in timings else f"{'-':>14}" for row in rows)
+        speed_up = f"{timings['copy'] / min(timings.values()):>9.1f}x" if 'copy' in timings else f"{'-':>10}"
+        print(f'{name:<44}{cells}{speed_up}')
+
+
+if __name__ == '__main__':
+    main()
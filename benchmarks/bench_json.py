@@ -0,0 +1,71 @@
+"""
+bench_json.py
+Compares the JSON decoders available to qubipy.json_backend on recorded API payloads.
+
+Usage:
+    python benchmarks/bench_json.py --payloads DIR   # every *.json file recorded in DIR
+
+Record the payloads from the live APIs at the page sizes the client requests (at most PAGE_SIZE_MAX
+entries per page), for example:
+    curl -o DIR/rich_list.json 'https://rpc.qubic.org/v1/rich-list?page=1&pageSize=100'
+    curl -o DIR/approved_transactions.json 'https://rpc.qubic.org/v1/ticks/TICK/approved-transactions'
+
+The "requests" row reproduces the previous code path (`requests.Response.json()`), which first
+decodes the body into a text string and then parses it with the stdlib json module.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qubipy.json_backend import orjson
+
+
+def recorded_payloads(directory: str) -> dict:
+    payloads = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(path, 'rb') as fh:
+            payloads[os.path.basename(path)] = fh.read()
+    return payloads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payloads', required=True, help='Directory of recorded JSON responses')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions, the best one is kept')
+    args = parser.parse_args()
+
+    payloads = recorded_payloads(args.payloads)
+    if not payloads:
+        parser.error(f'no *.json file in {args.payloads}')
+
+    decoders = {
+        'requests (text + json)': lambda data: json.loads(data.decode('utf-8')),
+        'json (bytes)': json.loads,
+    }
+    if orjson is not None:
+        decoders['orjson (bytes)'] = orjson.loads
+    else:
+        print('orjson is not installed (pip install QubiPy[fast]), only the stdlib is measured.\n')
+
+    print(f"{'payload':<38}{'size':>10}  " + ''.join(f'{name:>24}' for name in decoders) + f"{'speed-up':>10}")
+
+    for name, data in payloads.items():
+        timings = {}
+        for decoder_name, decoder in decoders.items():
+            number = max(1, int(2_000_000 / len(data)))
+            timings[decoder_name] = min(timeit.repeat(lambda: decoder(data), number=number, repeat=args.repeat)) / number
+
+        baseline = timings['requests (text + json)']
+        speed_up = baseline / min(timings.values())
+        row = ''.join(f'{timings[decoder_name] * 1000:>21.2f} ms' for decoder_name in decoders)
+        print(f'{name:<38}{len(data) / 1024:>8.0f}KB  {row}{speed_up:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
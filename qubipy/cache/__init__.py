@@ -0,0 +1,5 @@
+"""
+__init__.py
+This file marks this directory as a Python package.
+Imports key classes and functions for easy external use.
+"""
\ No newline at end of file
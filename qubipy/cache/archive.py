@@ -0,0 +1,272 @@
+"""
+archive.py
+Persistent on-disk archive of per-tick data that never changes once a tick is final
+(tick data, quorum data, chain hashes and store hashes), stored in SQLite and indexed by tick number.
+"""
+
+import copy
+import json
+import sqlite3
+import threading
+from typing import Any, Iterable, Iterator, Tuple
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.utils import *
+from qubipy.concurrency import call_with_retries, ordered_map
+
+ARCHIVE_TICK_DATA = 'tick_data'
+
+ARCHIVE_QUORUM_TICK_DATA = 'quorum_tick_data'
+
+ARCHIVE_CHAIN_HASH = 'chain_hash'
+
+ARCHIVE_STORE_HASH = 'store_hash'
+
+ARCHIVE_KINDS = (ARCHIVE_TICK_DATA, ARCHIVE_QUORUM_TICK_DATA, ARCHIVE_CHAIN_HASH, ARCHIVE_STORE_HASH)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ticks (
+    kind TEXT NOT NULL,
+    tick INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, tick)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class Tick_Archive:
+    def __init__(self, path: str = ':memory:'):
+        """
+        Opens (or creates) a tick archive.
+
+        Args:
+            path (str): Path of the SQLite database file. Defaults to an in-memory archive.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            if path != ':memory:':
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+
+        self._final_tick = self._read_final_tick()
+
+    def _read_final_tick(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'final_tick'").fetchone()
+        return row[0] if row else 0
+
+    @property
+    def final_tick(self) -> int:
+        """
+        The highest tick known to be processed by the network. Empty results for ticks up to this
+        one are archived too, since they can no longer change.
+        """
+        return self._final_tick
+
+    def set_final_tick(self, tick: int):
+        """
+        Records that every tick up to `tick` is final. The value never decreases.
+
+        Args:
+            tick (int): The highest processed tick reported by the network.
+        """
+        if tick <= self._final_tick:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('final_tick', ?)", (tick,))
+        self._final_tick = tick
+
+    def _check_kind(self, kind: str):
+        if kind not in ARCHIVE_KINDS:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ARCHIVE_KIND)
+
+    def _is_archivable(self, tick: int, value: Any) -> bool:
+        """
+        An empty response may just mean the tick has not been processed yet, so it is only
+        archived once the tick is known to be final.
+        """
+        return value not in (None, {}, [], '') or tick <= self._final_tick
+
+    def get(self, kind: str, tick: int) -> Any | None:
+        """
+        Reads an archived value.
+
+        Args:
+            kind (str): One of ARCHIVE_KINDS.
+            tick (int): The tick number.
+
+        Returns:
+            Any | None: The archived value, or None if the tick is not archived.
+
+        Raises:
+            QubiPy_Exceptions: If `kind` is unknown.
+        """
+        self._check_kind(kind)
+
+        with self._lock:
+            row = self._connection.execute('SELECT data FROM ticks WHERE kind = ? AND tick = ?', (kind, tick)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, kind: str, tick: int, value: Any) -> bool:
+        """
+        Archives a value. Values already archived are kept as they are.
+
+        Args:
+            kind (str): One of ARCHIVE_KINDS.
+            tick (int): The tick number.
+            value (Any): The value returned by the API for this tick.
+
+        Returns:
+            bool: True if the value was inserted, False if the tick was already archived or the value is an
+                  empty response for a tick that is not final yet.
+
+        Raises:
+            QubiPy_Exceptions: If `kind` is unknown.
+        """
+        return self.put_many(kind, [(tick, value)]) == 1
+
+    def put_many(self, kind: str, items: Iterable[Tuple[int, Any]]) -> int:
+        """
+        Archives several values in a single transaction.
+
+        Args:
+            kind (str): One of ARCHIVE_KINDS.
+            items (Iterable[Tuple[int, Any]]): `(tick, value)` pairs.
+
+        Returns:
+            int: Number of values inserted. Ticks already archived, and empty responses for ticks that are
+                 not final yet, are not counted.
+
+        Raises:
+            QubiPy_Exceptions: If `kind` is unknown.
+        """
+        self._check_kind(kind)
+
+        rows = [(kind, tick, json.dumps(value.to_dict() if hasattr(value, 'to_dict') else value)) for tick, value in items if self._is_archivable(tick, value)]
+
+        if not rows:
+            return 0
+
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany('INSERT OR IGNORE INTO ticks (kind, tick, data) VALUES (?, ?, ?)', rows)
+            return self._connection.total_changes - before
+
+    def missing_ticks(self, kind: str, from_tick: int, to_tick: int) -> Iterator[int]:
+        """
+        Lists the ticks of a range that are not archived yet.
+
+        Args:
+            kind (str): One of ARCHIVE_KINDS.
+            from_tick (int): The first tick of the range (inclusive).
+            to_tick (int): The last tick of the range (inclusive).
+
+        Returns:
+            Iterator[int]: The missing ticks in ascending order.
+
+        Raises:
+            QubiPy_Exceptions: If `kind` is unknown.
+        """
+        self._check_kind(kind)
+
+        with self._lock:
+            archived = {row[0] for row in self._connection.execute(
+                'SELECT tick FROM ticks WHERE kind = ? AND tick BETWEEN ? AND ?', (kind, from_tick, to_tick)
+            )}
+
+        return (tick for tick in range(from_tick, to_tick + 1) if tick not in archived)
+
+    def sync(self, rpc_client, from_tick: int | None = None, to_tick: int | None = None, kinds: Iterable[str] = ARCHIVE_KINDS, max_workers: int = BULK_MAX_WORKERS) -> int:
+        """
+        Fetches every tick of a range that is missing from the archive.
+
+        The range is capped at the last tick processed by the RPC server, which also becomes the
+        archive's `final_tick`. Ticks already archived cost no request, so the routine can be
+        re-run (or resumed after a failure) at any time. Fetched ticks are written in batches, even
+        when `rpc_client` reads through this archive.
+
+        Args:
+            rpc_client (QubiPy_RPC): The client used to fetch missing ticks.
+            from_tick (Optional[int]): The first tick of the range (inclusive).
+            to_tick (Optional[int]): The last tick of the range (inclusive).
+            kinds (Iterable[str]): The kinds of data to synchronise. Defaults to all of them.
+            max_workers (int): Maximum number of requests in flight.
+
+        Returns:
+            int: Number of ticks archived by this run.
+
+        Raises:
+            QubiPy_Exceptions: If the tick range or a kind is invalid.
+            QubiPy_Exceptions: If a tick still fails after its retries. Ticks fetched before it are kept.
+        """
+
+        if not from_tick or not to_tick:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK)
+
+        check_ticks_format(from_tick, to_tick)
+
+        kinds = tuple(kinds)
+        for kind in kinds:
+            self._check_kind(kind)
+
+        if getattr(rpc_client, 'archive', None) is self:
+            # The client would also write every tick on its own, one transaction each.
+            rpc_client = copy.copy(rpc_client)
+            rpc_client.archive = None
+
+        fetchers = {
+            ARCHIVE_TICK_DATA: rpc_client.get_tick_data,
+            ARCHIVE_QUORUM_TICK_DATA: rpc_client.get_quorum_tick_data,
+            ARCHIVE_CHAIN_HASH: rpc_client.get_chain_hash,
+            ARCHIVE_STORE_HASH: rpc_client.get_store_hash
+        }
+
+        last_processed = rpc_client.get_rpc_status().get('lastProcessedTick', {}).get('tickNumber')
+
+        if last_processed:
+            self.set_final_tick(last_processed)
+            to_tick = min(to_tick, last_processed)
+
+        missing = ((kind, tick) for kind in kinds for tick in self.missing_ticks(kind, from_tick, to_tick))
+
+        def fetch(item: Tuple[str, int]) -> Any:
+            kind, tick = item
+            return call_with_retries(fetchers[kind], tick)
+
+        added = 0
+        batch = []
+
+        try:
+            for (kind, tick), value in ordered_map(fetch, missing, max_workers):
+                if batch and batch[0][0] != kind or len(batch) >= ARCHIVE_BATCH_SIZE:
+                    added += self.put_many(batch[0][0], [(t, v) for _, t, v in batch])
+                    batch = []
+                batch.append((kind, tick, value))
+        finally:
+            if batch:
+                added += self.put_many(batch[0][0], [(t, v) for _, t, v in batch])
+
+        return added
+
+    def close(self):
+        """
+        Closes the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'Tick_Archive':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
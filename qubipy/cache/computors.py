@@ -0,0 +1,152 @@
+"""
+computors.py
+Epoch-keyed cache for computor lists. The computors of a closed epoch never change, so
+they are kept forever (and optionally persisted to disk), while the list of the current
+epoch is only kept for a short TTL. An epoch is only considered closed once a later one has
+been confirmed as current, from the tick info or the Core computors endpoint.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from qubipy.config import *
+
+
+class Computors_Cache:
+    def __init__(self, path: str | None = None, current_ttl: float = COMPUTORS_CURRENT_TTL):
+        """
+        Initializes the cache, loading the closed epochs persisted at `path` if it exists.
+
+        Args:
+            path (str | None): Optional JSON file where closed epochs are persisted.
+            current_ttl (float): Seconds the computors of the current epoch, and the confirmation
+                                 that it is still the current epoch, are kept.
+        """
+        self.path = path
+        self.current_ttl = current_ttl
+
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Tuple[Any, float]] = {}
+        self._current_epoch = 0
+        self._confirmed_at: float | None = None
+        self._closed_below = 0
+
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as fh:
+                for epoch, computors in json.load(fh).items():
+                    self._entries[int(epoch)] = (computors, 0.0)
+            # Only closed epochs are ever persisted.
+            self._closed_below = max(self._entries, default=-1) + 1
+
+    @property
+    def current_epoch(self) -> int:
+        """
+        The current epoch, as last confirmed through `set_current_epoch` or `put(..., is_current=True)`.
+        0 until one has been confirmed.
+        """
+        return self._current_epoch
+
+    def set_current_epoch(self, epoch: int):
+        """
+        Confirms the current network epoch, closing every earlier one. The value never decreases.
+
+        Args:
+            epoch (int): The current epoch, for example from `get_tick_info()`.
+        """
+        with self._lock:
+            self._confirm(epoch)
+
+    def _confirm(self, epoch: int):
+        if epoch < self._current_epoch:
+            return
+        self._current_epoch = epoch
+        self._confirmed_at = time.monotonic()
+        if epoch > self._closed_below:
+            self._closed_below = epoch
+            self._persist()
+
+    def _is_confirmed(self) -> bool:
+        return self._confirmed_at is not None and time.monotonic() - self._confirmed_at <= self.current_ttl
+
+    def needs_current_epoch(self, epoch: int) -> bool:
+        """
+        Tells whether the current epoch must be confirmed before the entry of `epoch` can be served:
+        the epoch is not known to be closed and no confirmation was made within the TTL.
+
+        Args:
+            epoch (int): The epoch about to be looked up.
+        """
+        with self._lock:
+            return epoch >= self._closed_below and not self._is_confirmed()
+
+    def get(self, epoch: int) -> Any | None:
+        """
+        Returns the cached computors of an epoch. A closed epoch is always served; the current epoch
+        only while both its entry and the confirmation that it is current are within the TTL.
+
+        Args:
+            epoch (int): The epoch number.
+
+        Returns:
+            Any | None: The cached computors, or None if they are missing, expired or possibly stale.
+        """
+        with self._lock:
+            entry = self._entries.get(epoch)
+            if entry is None:
+                return None
+            if epoch < self._closed_below:
+                return entry[0]
+            if epoch == self._current_epoch and self._is_confirmed() and time.monotonic() - entry[1] <= self.current_ttl:
+                return entry[0]
+            return None
+
+    def get_current(self) -> Any | None:
+        """
+        Returns the cached computors of the current epoch. Only an epoch confirmed as current
+        (through `set_current_epoch` or `put(..., is_current=True)`) within the TTL is returned,
+        so a lookup of an old epoch is never mistaken for the current computor list.
+
+        Returns:
+            Any | None: The cached computors, or None if they are missing, unconfirmed or expired.
+        """
+        return self.get(self._current_epoch) if self._current_epoch else None
+
+    def put(self, epoch: int, computors: Any, is_current: bool = False):
+        """
+        Caches the computors of an epoch. Earlier epochs are only closed once the current epoch is confirmed.
+
+        Args:
+            epoch (int): The epoch number.
+            computors (Any): The computors returned by the API for this epoch.
+            is_current (bool): Whether the API reported these as the computors of the current epoch.
+        """
+        with self._lock:
+            self._entries[epoch] = (computors, time.monotonic())
+            if is_current:
+                self._confirm(epoch)
+            if epoch < self._closed_below:
+                self._persist()
+
+    def _persist(self):
+        """
+        Writes every closed epoch to `path`. The file is replaced atomically so a crash never leaves it truncated.
+        """
+        if not self.path:
+            return
+
+        closed = {str(epoch): entry[0] for epoch, entry in sorted(self._entries.items()) if epoch < self._closed_below}
+        tmp_path = f'{self.path}.tmp'
+
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            json.dump(closed, fh)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """
+        Removes every cached epoch from memory. The persisted file is left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,170 @@
+"""
+ttl.py
+Per-endpoint TTL response cache with request coalescing. While an entry is fresh every
+caller gets the cached response, and when several threads miss the same key at once only
+one request goes out and every waiter receives its result. Expired entries are pruned as
+new ones are stored, so per-identity or per-tick endpoints do not grow the cache forever.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from qubipy.config import *
+from qubipy.utils import endpoint_matches
+from qubipy.endpoints_rpc import LATEST_TICK, TICK_INFO, LATEST_STATS, STATUS
+from qubipy.endpoints_core import CORE_TICK_INFO
+
+
+class TTL_Cache:
+    def __init__(self, ttls: Dict[str, float]):
+        """
+        Initializes the cache.
+
+        Args:
+            ttls (Dict[str, float]): Seconds to cache each endpoint, keyed by endpoint path, placeholders
+                                     included (for example `{LATEST_TICK: 1, WALLET_BALANCE: 2}`). Endpoints
+                                     not listed are never cached.
+        """
+        self.ttls = dict(ttls)
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, tuple] = {}
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._async_in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._prune_at = TTL_CACHE_PRUNE_MIN
+
+    @classmethod
+    def hot_endpoints(cls, ttl: float = HOT_ENDPOINT_TTL) -> 'TTL_Cache':
+        """
+        Creates a cache for the "latest" endpoints that dashboards poll: `get_latest_tick`, `get_tick_info`,
+        `get_latest_stats` and `get_rpc_status` on QubiPy_RPC and `get_tick_info` on QubiPy_Core.
+
+        Args:
+            ttl (float): Seconds each response is shared.
+
+        Returns:
+            TTL_Cache: The configured cache.
+        """
+        return cls({path: ttl for path in (LATEST_TICK, TICK_INFO, LATEST_STATS, STATUS, CORE_TICK_INFO)})
+
+    def ttl_for(self, url: str) -> float | None:
+        """
+        Returns the TTL configured for a request URL.
+
+        Args:
+            url (str): The full request URL.
+
+        Returns:
+            float | None: The TTL in seconds, or None if the endpoint is not cached.
+        """
+        for endpoint, ttl in self.ttls.items():
+            if endpoint_matches(url, endpoint):
+                return ttl
+        return None
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        """
+        Stores an entry; the lock must be held. Once the cache has doubled since the last pruning,
+        expired entries are dropped, which keeps it within twice its live entries at an amortized constant cost.
+        """
+        now = time.monotonic()
+        self._entries[key] = (value, now + ttl)
+
+        if len(self._entries) >= self._prune_at:
+            self._entries = {key: entry for key, entry in self._entries.items() if entry[1] > now}
+            self._prune_at = max(TTL_CACHE_PRUNE_MIN, 2 * len(self._entries))
+
+    def get_or_fetch(self, key: Hashable, ttl: float, fetch: Callable[[], Any], cacheable: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        Returns the cached value for `key`, or calls `fetch` once for every concurrent caller.
+
+        Args:
+            key (Hashable): The cache key.
+            ttl (float): Seconds a fetched value stays fresh.
+            fetch (Callable[[], Any]): Produces the value on a miss.
+            cacheable (Callable[[Any], bool]): Decides whether a fetched value may be stored.
+                                               Values that are not stored are still shared with the waiting callers.
+
+        Returns:
+            Any: The cached or freshly fetched value.
+
+        Raises:
+            Exception: Whatever `fetch` raised, in the fetching caller and in every waiter.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._in_flight[key] = Future()
+
+        if not is_leader:
+            return call.result()
+
+        try:
+            value = fetch()
+        except BaseException as E:
+            with self._lock:
+                del self._in_flight[key]
+            call.set_exception(E)
+            raise
+
+        with self._lock:
+            if cacheable(value):
+                self._store(key, value, ttl)
+            del self._in_flight[key]
+
+        call.set_result(value)
+        return value
+
+    async def get_or_fetch_async(self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]], cacheable: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        The asyncio counterpart of `get_or_fetch`: `fetch` is a coroutine function, awaited once for
+        every coroutine missing the same key at the same time. Entries are shared with blocking callers.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+
+            call = self._async_in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._async_in_flight[key] = asyncio.get_running_loop().create_future()
+
+        if not is_leader:
+            return await asyncio.shield(call)
+
+        try:
+            value = await fetch()
+        except BaseException as E:
+            with self._lock:
+                del self._async_in_flight[key]
+            if isinstance(E, asyncio.CancelledError):
+                call.cancel()
+            else:
+                call.set_exception(E)
+                call.exception()
+            raise
+
+        with self._lock:
+            if cacheable(value):
+                self._store(key, value, ttl)
+            del self._async_in_flight[key]
+
+        call.set_result(value)
+        return value
+
+    def clear(self):
+        """
+        Drops every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
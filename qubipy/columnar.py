@@ -0,0 +1,218 @@
+"""
+columnar.py
+Column batches for bulk transaction and balance data, ready for vectorized analytics.
+
+Lists of transactions (`get_approved_transaction_for_tick`, `QubiPy_Core.get_tick_transactions`),
+transfers (`get_transfer_transactions_per_tick`) and rich list entries are turned into NumPy
+columns: amounts as int64, ticks as uint32 and identities either as fixed-width byte strings or
+as uint32 indices into an Identity_Table shared by every batch. Both dictionaries and the models
+of qubipy.models are accepted.
+
+Requires the optional NumPy dependency: pip install QubiPy[columnar]. `to_arrow` also requires pyarrow.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+IDENTITIES_TABLE = 'table'
+
+IDENTITIES_BYTES = 'bytes'
+
+IDENTITY_LENGTH = 60
+
+IDENTITY_COLUMNS = ('source_id', 'dest_id', 'identity')
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Columnar export requires NumPy, install it with: pip install QubiPy[columnar]")
+
+
+def _get(record: Any, attribute: str, *keys: str) -> Any:
+    """
+    Reads a field from a model (by attribute) or from an API dictionary (by the first key present).
+    """
+    if not isinstance(record, dict):
+        return getattr(record, attribute)
+    for key in keys:
+        if key in record:
+            return record[key]
+    return None
+
+
+class Identity_Table:
+    """
+    Maps identities to dense uint32 indices. Sharing one table across batches keeps the indices
+    comparable, so a column of millions of transfers stores 4 bytes per identity instead of 60.
+    """
+
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+        self.identities: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+    def index(self, identity: str) -> int:
+        """
+        Returns the index of `identity`, adding it to the table if it is new.
+        """
+        index = self._indices.get(identity)
+        if index is None:
+            index = self._indices[identity] = len(self.identities)
+            self.identities.append(identity)
+        return index
+
+    def to_numpy(self) -> 'np.ndarray':
+        """
+        Returns:
+            np.ndarray: The identities as fixed-width bytes, in index order.
+        """
+        _require_numpy()
+        return np.array([identity.encode() for identity in self.identities], dtype=f'S{IDENTITY_LENGTH}')
+
+
+def _identity_column(values: List[str], identities: str, table: Identity_Table | None) -> 'np.ndarray':
+    if identities == IDENTITIES_BYTES:
+        return np.array([value.encode() for value in values], dtype=f'S{IDENTITY_LENGTH}')
+    return np.fromiter((table.index(value) for value in values), dtype=np.uint32, count=len(values))
+
+
+def _check_identities(identities: str, table: Identity_Table | None) -> Identity_Table | None:
+    _require_numpy()
+    if identities not in (IDENTITIES_TABLE, IDENTITIES_BYTES):
+        raise ValueError(f"identities must be '{IDENTITIES_TABLE}' or '{IDENTITIES_BYTES}', not {identities!r}")
+    if identities == IDENTITIES_TABLE and table is None:
+        table = Identity_Table()
+    return table
+
+
+def _with_table(columns: Dict[str, 'np.ndarray'], identities: str, table: Identity_Table | None) -> Dict[str, 'np.ndarray']:
+    if identities == IDENTITIES_TABLE:
+        columns['identities'] = table.to_numpy()
+    return columns
+
+
+def transactions_to_columns(transactions: Iterable[Any], identities: str = IDENTITIES_TABLE, table: Identity_Table | None = None) -> Dict[str, 'np.ndarray']:
+    """
+    Turns a list of transactions into columns.
+
+    Args:
+        transactions (Iterable[Any]): Transactions in the RPC or Core format, as dictionaries or Transaction models.
+        identities (str): IDENTITIES_TABLE to encode `source_id` and `dest_id` as uint32 indices into `table`,
+                          IDENTITIES_BYTES to store them as fixed-width bytes.
+        table (Identity_Table | None): The table to index identities into. A new one is created if omitted;
+                                       pass the same table to several calls to keep the indices comparable.
+
+    Returns:
+        Dict[str, np.ndarray]: The columns `source_id`, `dest_id`, `amount` (int64), `tick_number` (uint32),
+                               `input_type` (uint16), `input_size` (uint16) and `tx_id` (bytes). With
+                               IDENTITIES_TABLE, `identities` holds the whole table as fixed-width bytes.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If `identities` is invalid.
+    """
+    table = _check_identities(identities, table)
+    transactions = list(transactions)
+    count = len(transactions)
+
+    columns = {
+        'source_id': _identity_column([_get(tx, 'source_id', 'sourceId') for tx in transactions], identities, table),
+        'dest_id': _identity_column([_get(tx, 'dest_id', 'destId') for tx in transactions], identities, table),
+        'amount': np.fromiter((int(_get(tx, 'amount', 'amount') or 0) for tx in transactions), dtype=np.int64, count=count),
+        'tick_number': np.fromiter((int(_get(tx, 'tick_number', 'tickNumber', 'tick') or 0) for tx in transactions), dtype=np.uint32, count=count),
+        'input_type': np.fromiter((int(_get(tx, 'input_type', 'inputType') or 0) for tx in transactions), dtype=np.uint16, count=count),
+        'input_size': np.fromiter((int(_get(tx, 'input_size', 'inputSize') or 0) for tx in transactions), dtype=np.uint16, count=count),
+        'tx_id': np.array([(_get(tx, 'tx_id', 'txId') or '').encode() for tx in transactions], dtype=f'S{IDENTITY_LENGTH}'),
+    }
+    return _with_table(columns, identities, table)
+
+
+def transfers_to_columns(transfers: Any, identities: str = IDENTITIES_TABLE, table: Identity_Table | None = None) -> Dict[str, 'np.ndarray']:
+    """
+    Flattens the result of `get_transfer_transactions_per_tick` into transaction columns.
+
+    Args:
+        transfers (Any): The response of `get_transfer_transactions_per_tick`, or its list of Tick_Transfers.
+        identities (str): See `transactions_to_columns`.
+        table (Identity_Table | None): See `transactions_to_columns`.
+
+    Returns:
+        Dict[str, np.ndarray]: The same columns as `transactions_to_columns`, in tick order.
+    """
+    if isinstance(transfers, dict):
+        transfers = transfers.get('transferTransactionsPerTick', [])
+
+    transactions = [tx for entry in transfers for tx in (_get(entry, 'transactions', 'transactions') or ())]
+    return transactions_to_columns(transactions, identities, table)
+
+
+def rich_list_to_columns(rich_list: Any, identities: str = IDENTITIES_TABLE, table: Identity_Table | None = None) -> Dict[str, 'np.ndarray']:
+    """
+    Turns rich list entries into columns.
+
+    Args:
+        rich_list (Any): The response of `get_rich_list`, its `richList` object, or a list of entities.
+        identities (str): IDENTITIES_TABLE to encode `identity` as uint32 indices into `table`,
+                          IDENTITIES_BYTES to store it as fixed-width bytes.
+        table (Identity_Table | None): See `transactions_to_columns`.
+
+    Returns:
+        Dict[str, np.ndarray]: The columns `identity` and `balance` (int64), plus `identities` with IDENTITIES_TABLE.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If `identities` is invalid.
+    """
+    table = _check_identities(identities, table)
+
+    if isinstance(rich_list, dict):
+        rich_list = rich_list.get('richList', rich_list).get('entities', [])
+    entities = list(rich_list)
+
+    columns = {
+        'identity': _identity_column([_get(entity, 'identity', 'identity') for entity in entities], identities, table),
+        'balance': np.fromiter((int(_get(entity, 'balance', 'balance') or 0) for entity in entities), dtype=np.int64, count=len(entities)),
+    }
+    return _with_table(columns, identities, table)
+
+
+def to_arrow(columns: Dict[str, 'np.ndarray']) -> 'pa.RecordBatch':
+    """
+    Converts columns to an Arrow record batch without copying the numeric buffers. Identity indices
+    become dictionary-encoded columns over the identity table.
+
+    Args:
+        columns (Dict[str, np.ndarray]): Columns returned by one of the *_to_columns functions.
+
+    Returns:
+        pa.RecordBatch: The record batch.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow, install it with: pip install QubiPy[columnar]")
+
+    dictionary = pa.array(columns['identities']) if 'identities' in columns else None
+    arrays = {}
+
+    for name, column in columns.items():
+        if name == 'identities':
+            continue
+        if dictionary is not None and name in IDENTITY_COLUMNS:
+            arrays[name] = pa.DictionaryArray.from_arrays(pa.array(column), dictionary)
+        else:
+            arrays[name] = pa.array(column)
+
+    return pa.RecordBatch.from_pydict(arrays)
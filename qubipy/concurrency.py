@@ -0,0 +1,270 @@
+"""
+concurrency.py
+Helpers used by the bulk methods to run many blocking API calls concurrently
+over the client's pooled session while keeping results in input order.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+import requests
+
+from qubipy.config import *
+from qubipy.exceptions import *
+
+
+def _transport_error(error: BaseException) -> BaseException:
+    """
+    Returns the transport error a client method wrapped into a QubiPy_Exceptions (the clients raise
+    `from None`, which hides the cause from tracebacks but keeps it as the context).
+    """
+    return error.__cause__ or error.__context__ or error
+
+
+def error_status(error: BaseException) -> int | None:
+    """
+    Returns the HTTP status of the response that caused `error`, or None if no response was received.
+    """
+    cause = _transport_error(error)
+    status = getattr(getattr(cause, 'response', None), 'status_code', None)
+    return status if status is not None else getattr(cause, 'status', None)
+
+
+def is_timeout(error: BaseException) -> bool:
+    """
+    Tells whether `error` was caused by a request timing out, with requests or aiohttp.
+    """
+    return isinstance(_transport_error(error), (requests.exceptions.Timeout, asyncio.TimeoutError))
+
+
+def is_empty_tick(error: BaseException) -> bool:
+    """
+    Tells whether the transactions of a past tick could not be read because the tick was empty or skipped,
+    which the servers answer with one of EMPTY_TICK_STATUS_CODES. None of its transactions were included.
+    """
+    return error_status(error) in EMPTY_TICK_STATUS_CODES
+
+
+def is_overload(error: BaseException) -> bool:
+    """
+    Tells whether a failed call suggests the request was too heavy for the server: it timed out
+    or was answered with a 5xx status. Other errors would not go away with a smaller request.
+    """
+    if isinstance(error, QubiPy_Circuit_Open):
+        return False
+    return is_timeout(error) or (error_status(error) or 0) >= 500
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Tells whether a failed call is worth retrying. Open circuits fail fast by design and 4xx
+    answers (other than the statuses of RETRY_STATUS_CODES, such as 429) would fail again, so
+    neither is retried; 5xx answers, timeouts and connection errors are.
+    """
+    if isinstance(error, QubiPy_Circuit_Open):
+        return False
+    status = error_status(error)
+    return status is None or status >= 500 or status in RETRY_STATUS_CODES
+
+
+def call_with_retries(func: Callable, *args, retries: int = BULK_RETRIES, delay: float = BULK_RETRY_DELAY) -> Any:
+    """
+    Calls `func(*args)`, retrying it when it raises a transient QubiPy_Exceptions (see `is_transient`).
+
+    Args:
+        func (Callable): The function to call.
+        *args: Positional arguments passed to `func`.
+        retries (int): Number of additional attempts after the first failure.
+        delay (float): Base delay in seconds before a retry, doubled after each attempt.
+
+    Returns:
+        Any: The value returned by `func`.
+
+    Raises:
+        QubiPy_Exceptions: The last error raised by `func` once all retries are exhausted, or at once
+            if it is not transient, such as QubiPy_Circuit_Open or a 4xx answer.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            return func(*args)
+        except QubiPy_Exceptions as E:
+            if attempt == retries or not is_transient(E):
+                raise
+            time.sleep(delay * (2 ** attempt))
+
+
+async def async_call_with_retries(func: Callable, *args, retries: int = BULK_RETRIES, delay: float = BULK_RETRY_DELAY) -> Any:
+    """
+    The asyncio counterpart of `call_with_retries`, for coroutine functions.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            return await func(*args)
+        except QubiPy_Exceptions as E:
+            if attempt == retries or not is_transient(E):
+                raise
+            await asyncio.sleep(delay * (2 ** attempt))
+
+
+def ordered_map(func: Callable, items: Iterable, max_workers: int = BULK_MAX_WORKERS, window: int | None = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    Applies `func` to every item on a thread pool and yields `(item, result)` in input order.
+
+    Only a sliding window of items (`2 * max_workers` by default) is submitted at a time, so arbitrarily
+    long (or infinite) iterables are processed with constant memory. The next item is submitted before
+    each result is handed to the caller, so the pool keeps working while the caller consumes.
+
+    Args:
+        func (Callable): The function called with each item.
+        items (Iterable): The items to process.
+        max_workers (int): Maximum number of concurrent calls.
+        window (int | None): Items pulled from `items` ahead of the caller. Lazily built items that depend
+                             on earlier results, such as Adaptive_Chunks, pass `max_workers`.
+
+    Yields:
+        Tuple[Any, Any]: Each item paired with the value `func` returned for it.
+
+    Raises:
+        Exception: The first error raised by `func`, at the position of the failing item.
+    """
+
+    if window is None:
+        window = 2 * max_workers
+
+    if not isinstance(max_workers, int) or max_workers < 1 or not isinstance(window, int) or window < 1:
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_VALUE)
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+
+    try:
+        for item in itertools.islice(items, window):
+            pending.append((item, executor.submit(func, item)))
+
+        while pending:
+            item, future = pending.popleft()
+            result = future.result()
+
+            for next_item in itertools.islice(items, 1):
+                pending.append((next_item, executor.submit(func, next_item)))
+
+            yield item, result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class Page_Cursor:
+    """
+    Position of a paginated iterator: the page being read and the number of its entries already
+    consumed. The iterator advances it after each entry has been processed by the caller, so
+    persisting `to_dict()` and passing `Page_Cursor.from_dict(...)` back resumes an interrupted
+    walk without skipping anything.
+    """
+    page: int = 1
+    offset: int = 0
+    page_size: int = PAGE_SIZE_MAX
+    epoch: int | None = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Page_Cursor':
+        return cls(**data)
+
+
+def iter_pages(fetch_page: Callable[[int], Dict[str, Any]], entries_of: Callable[[Dict[str, Any]], List[Any]], cursor: Page_Cursor, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Iterator[Any]:
+    """
+    Walks a paginated endpoint from `cursor` and yields its entries in order.
+
+    The first page is fetched alone to learn the total number of pages from its `pagination`
+    object; the remaining pages are then fetched through `ordered_map`, so at most `2 * max_workers`
+    pages are held in memory while the caller consumes entries.
+
+    Args:
+        fetch_page (Callable[[int], Dict[str, Any]]): Returns the response for a page number.
+        entries_of (Callable[[Dict[str, Any]], List[Any]]): Extracts the entries of a response.
+        cursor (Page_Cursor): Where to start. It is updated as entries are consumed.
+        max_workers (int): Maximum number of requests in flight.
+        retries (int): Times a failed page is retried before its error is raised.
+
+    Yields:
+        Any: The entries of every page, in page order.
+
+    Raises:
+        QubiPy_Exceptions: If a page still fails after all its retries. The cursor points at the first
+            entry not consumed yet.
+    """
+
+    def fetch(page: int) -> Dict[str, Any]:
+        return call_with_retries(fetch_page, page, retries=retries)
+
+    first_page = cursor.page
+    first = fetch(first_page)
+    total_pages = (first.get('pagination') or {}).get('totalPages') or first_page
+
+    pages = itertools.chain([(first_page, first)], ordered_map(fetch, range(first_page + 1, total_pages + 1), max_workers))
+
+    for page, data in pages:
+        entries = entries_of(data)
+        cursor.page = page
+
+        for index in range(cursor.offset, len(entries)):
+            yield entries[index]
+            cursor.offset = index + 1
+
+        cursor.page, cursor.offset = page + 1, 0
+
+
+class Adaptive_Chunks:
+    """
+    Splits a tick range into consecutive chunks whose size adapts to the server: a chunk answered
+    in less than half of `target_seconds` doubles the size of the next ones, a failed chunk halves it.
+    Chunks are cut lazily, so the size used is the one current when `ordered_map` submits them; with
+    a window of `max_workers`, each chunk after the first ones is cut once an earlier one has finished.
+    """
+
+    def __init__(self, start: int, end: int, size: int = TRANSFER_SCAN_CHUNK, min_size: int = TRANSFER_SCAN_MIN_CHUNK, max_size: int = TRANSFER_SCAN_MAX_CHUNK, target_seconds: float = TRANSFER_SCAN_TARGET_SECONDS):
+        if not all(isinstance(value, int) and value >= 1 for value in (size, min_size, max_size)) or min_size > max_size:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_VALUE)
+
+        self.start = start
+        self.end = end
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.size = min(max(size, min_size), max_size)
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        tick = self.start
+        while tick <= self.end:
+            with self._lock:
+                size = self.size
+            yield tick, min(self.end, tick + size - 1)
+            tick += size
+
+    def record_success(self, span: int, elapsed: float):
+        """
+        Grows the chunk size after a full-size chunk was answered quickly.
+        """
+        with self._lock:
+            if span >= self.size and elapsed < self.target_seconds / 2:
+                self.size = min(self.max_size, self.size * 2)
+
+    def record_failure(self, span: int):
+        """
+        Shrinks the chunk size below the span that just failed.
+        """
+        with self._lock:
+            self.size = max(self.min_size, min(self.size, span // 2))
@@ -14,4 +14,102 @@ TIMEOUT = 5
 HEADERS = {
     'accept': 'application/json',
     'Content-Type': 'application/json',
-}
\ No newline at end of file
+}
+
+POOL_CONNECTIONS = 10 # Number of per-host connection pools cached by a client session.
+
+POOL_MAXSIZE = 20 # Maximum number of keep-alive connections kept open per host.
+
+KEEP_ALIVE = 60 # Seconds a pooled session may sit idle before its connections are recycled.
+
+ASYNC_POOL_LIMIT = 1000 # Maximum number of simultaneous connections held by an asyncio session.
+
+BULK_MAX_WORKERS = 16 # Default number of concurrent requests issued by bulk helpers.
+
+BULK_RETRIES = 3 # Times a single failed item of a bulk job is retried before giving up.
+
+BULK_RETRY_DELAY = 0.5 # Base delay in seconds between retries of a failed bulk item, doubled each attempt.
+
+ARCHIVE_BATCH_SIZE = 500 # Rows written per transaction when a tick archive is synchronised.
+
+COMPUTORS_CURRENT_TTL = 60 # Seconds the computor list of the current epoch is cached. Closed epochs never expire.
+
+HOT_ENDPOINT_TTL = 1 # Default seconds a "latest" endpoint response is shared when a response cache is enabled.
+
+TTL_CACHE_PRUNE_MIN = 256 # Entries a response cache holds before its expired entries are first pruned.
+
+RETRY_MAX_ATTEMPTS = 3 # Total attempts (first try included) made by a retry policy.
+
+RETRY_BACKOFF_FACTOR = 0.5 # Base backoff in seconds, doubled after each failed attempt.
+
+RETRY_BACKOFF_MAX = 10 # Upper bound in seconds for a single backoff, including Retry-After waits.
+
+RETRY_STATUS_CODES = (429, 502, 503, 504) # HTTP status codes considered transient.
+
+RETRY_BUDGET_RATIO = 0.2 # Retries allowed per request sent, measured over the budget window.
+
+RETRY_BUDGET_MIN_PER_SECOND = 5 # Retries always allowed per second, whatever the request volume.
+
+RETRY_BUDGET_WINDOW = 10 # Seconds over which the retry budget is measured.
+
+RATE_LIMIT_PER_SECOND = 10 # Default sustained requests per second allowed per base URL by a Rate_Limiter.
+
+RATE_LIMIT_BURST = 20 # Default number of requests a Rate_Limiter lets through at once after an idle period.
+
+ENDPOINT_LATENCY_DECAY = 0.3 # Weight of the newest sample in each endpoint's moving average latency.
+
+ENDPOINT_FAILURE_THRESHOLD = 2 # Consecutive failures after which an endpoint is taken out of rotation.
+
+ENDPOINT_COOLDOWN = 30 # Seconds a failing endpoint stays out of rotation before it is tried again.
+
+HEDGE_PERCENTILE = 95 # Latency percentile after which a hedged read sends its duplicate request.
+
+HEDGE_INITIAL_DELAY = 0.5 # Hedge delay in seconds used until enough latencies have been measured.
+
+HEDGE_MIN_DELAY = 0.02 # Lower bound of the hedge delay in seconds, so fast endpoints are not always duplicated.
+
+HEDGE_WINDOW = 256 # Number of recent latencies the hedge delay percentile is computed from.
+
+HEDGE_MIN_SAMPLES = 20 # Latencies required before the percentile replaces HEDGE_INITIAL_DELAY.
+
+CIRCUIT_FAILURE_THRESHOLD = 5 # Consecutive failures that open the circuit of a base URL and endpoint group.
+
+CIRCUIT_RECOVERY_TIMEOUT = 30 # Seconds an open circuit fails fast before letting a trial request through.
+
+CIRCUIT_HALF_OPEN_MAX_CALLS = 1 # Trial requests allowed at once while a circuit is half-open.
+
+PAGE_SIZE_MAX = 100 # Largest page size accepted by the paginated endpoints, used by the paginated iterators.
+
+PAGE_NUMBER_MAX = 100 # Largest page number accepted by the public paginated methods. The paginated iterators are not limited.
+
+TRANSFER_SCAN_CHUNK = 10000 # Initial number of ticks per request when scanning transfer transactions.
+
+TRANSFER_SCAN_MIN_CHUNK = 100 # Smallest chunk the transfer scanner shrinks to before giving up on a failing range.
+
+TRANSFER_SCAN_MAX_CHUNK = 500000 # Largest chunk the transfer scanner grows to while responses are fast.
+
+TRANSFER_SCAN_TARGET_SECONDS = 2 # Chunks answered faster than half this time are grown, slower ones keep their size.
+
+WATCH_INTERVAL = 1 # Seconds between two polls of the current tick by the watchers.
+
+EMPTY_TICK_STATUS_CODES = (400, 404) # HTTP status codes answered for the transactions of a tick that was empty or skipped by the network.
+
+WATCH_FULL_REFRESH_TICKS = 1000 # Ticks after which the balance watcher re-reads every watched balance, catching changes no transaction explains.
+
+WATCH_MAX_TICK_GAP = 100 # Ticks the balance watcher replays one by one; a larger gap triggers a full refresh instead.
+
+FOLLOW_INITIAL_INTERVAL = 1.0 # Tick interval in seconds assumed by the tick followers until one has been observed.
+
+FOLLOW_MIN_DELAY = 0.2 # Shortest wait in seconds between two polls of the latest tick.
+
+FOLLOW_MAX_DELAY = 10 # Longest wait in seconds between two polls of the latest tick, reached while the chain is stalled.
+
+FOLLOW_DECAY = 0.3 # Weight of the newest sample in the moving average of the tick interval.
+
+TX_TICK_OFFSET = 72 # Offset of the target tick in a built transaction, after both public keys and the amount.
+
+BROADCAST_MAX_IN_FLIGHT = 16 # Default number of broadcasts in flight in broadcast_many, kept below POOL_MAXSIZE so every one reuses a pooled connection.
+
+TX_MAX_INPUT_SIZE = 1024 # Largest payload a transaction may carry, in bytes.
+
+BATCH_CHUNKS_PER_WORKER = 4 # Chunks handed to each worker by build_batch, to balance the load without paying a task per transaction.
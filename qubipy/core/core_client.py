@@ -5,19 +5,85 @@ the interaction with the Qubic API, making HTTP requests and handling responses.
 """
 
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 import json
 
 from qubipy.exceptions import *
 from qubipy.config import *
 from qubipy.endpoints_core import *
 from qubipy.utils import *
+from qubipy.models import *
+from qubipy.transport.session import QubiPy_Session
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.transport.retry import Retry_Policy
+from qubipy.transport.rate_limit import Rate_Limiter
+from qubipy.transport.balancer import Endpoint_Pool
+from qubipy.transport.hedging import Hedge_Policy
+from qubipy.transport.circuit import Circuit_Breaker
+from qubipy.cache.computors import Computors_Cache
 import json
 
 class QubiPy_Core:
-    def __init__(self, core_url: str = CORE_URL, timeout=TIMEOUT):
-        self.core_url = core_url
+    def __init__(self, core_url: str | Sequence[str] = CORE_URL, timeout=TIMEOUT, session: requests.Session | None = None, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE, keep_alive: float | None = KEEP_ALIVE, computors_cache: Computors_Cache | None = None, response_cache: TTL_Cache | None = None, retry: Retry_Policy | None = None, rate_limiter: Rate_Limiter | None = None, hedge: Hedge_Policy | None = None, circuit_breaker: Circuit_Breaker | None = None, models: bool = False):
+        """
+        Initializes the client and its pooled HTTP session.
+
+        Args:
+            core_url (str | Sequence[str]): Base URL of the Core API, or the base URLs of several interchangeable
+                                          nodes. Requests are then balanced across the healthy, fastest nodes and
+                                          fail over when a node fails. The first URL is the primary one.
+            timeout (int): Timeout in seconds applied to every request.
+            session (requests.Session | None): An existing session to reuse, for example one shared
+                                               between QubiPy_RPC and QubiPy_Core. When provided, the
+                                               pool settings below are ignored and `close()` leaves it open.
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections per host.
+            keep_alive (float | None): Seconds the pool may sit idle before its connections are recycled.
+            computors_cache (Computors_Cache | None): Optional epoch-keyed cache used by `get_computors`,
+                                                      which can be shared with QubiPy_RPC.
+            response_cache (TTL_Cache | None): Optional per-endpoint TTL cache with request coalescing,
+                                               for example `TTL_Cache.hot_endpoints()`. Ignored when `session` is given.
+            retry (Retry_Policy | None): Optional retry policy with backoff and a retry budget. Ignored when `session` is given.
+            rate_limiter (Rate_Limiter | None): Optional token-bucket limiter per base URL, which can be shared
+                                                between clients. Ignored when `session` is given.
+            hedge (Hedge_Policy | None): Optional hedging of idempotent reads across the nodes of `core_url`,
+                                         for the endpoints listed in the policy. Ignored when `session` is given.
+            circuit_breaker (Circuit_Breaker | None): Optional circuit breakers per base URL and endpoint group. While a
+                                                      circuit is open, calls fail fast with QubiPy_Circuit_Open. Ignored when `session` is given.
+            models (bool): Return the typed, slotted models of qubipy.models (Tick_Info, Tick_Data, Transaction,
+                           Quottery_Bet and lists of Qx_Order) instead of dictionaries.
+        """
+        self.endpoints = Endpoint_Pool(core_url, health_endpoint=CORE_TICK_INFO) if not isinstance(core_url, str) else None
+        self.core_url = self.endpoints.primary if self.endpoints is not None else core_url
         self.timeout = timeout
+        self.models = models
+        self.computors_cache = computors_cache
+        self._owns_session = session is None
+        self.session = session if session is not None else QubiPy_Session(pool_connections, pool_maxsize, keep_alive, response_cache=response_cache, retry=retry, rate_limiter=rate_limiter, hedge=hedge, circuit_breaker=circuit_breaker)
+
+        if self.endpoints is not None:
+            if not isinstance(self.session, QubiPy_Session):
+                raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ENDPOINTS)
+            self.session.add_endpoint_pool(self.endpoints)
+
+    def close(self):
+        """
+        Closes the pooled connections owned by this client. A session passed in by the caller is left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'QubiPy_Core':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _as_model(self, model: type, data: Any) -> Any:
+        """
+        Converts a record, or a list of records, to `model` when the client was created with `models=True`.
+        """
+        return as_model(model, data) if self.models else data
     
     def get_computors(self) -> Dict[str, Any]:
 
@@ -25,18 +91,27 @@ class QubiPy_Core:
         Retrieves the list of computors from the core server.
 
         Returns:
-            Dict[str, Any]: A dictionary containing the computors data from the server. 
-                            If no data is retrieved, an empty dictionary is returned.
+            Dict[str, Any]: A dictionary with the computors data under `computors`, the same whether it was
+                            served from the computors cache or from the server. If no data is retrieved,
+                            an empty dictionary is returned.
 
         Raises:
             QubiPy_Exceptions: If there is an issue with the API request, such as a network error, invalid response, or timeout.
         """
 
+        if self.computors_cache is not None:
+            cached = self.computors_cache.get_current()
+            if cached is not None:
+                return {'computors': cached}
+
         try:
-            response = requests.get(f'{self.core_url}{CORE_COMPUTORS}', timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{CORE_COMPUTORS}', timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data
+            computors = data.get('computors') or {}
+            if self.computors_cache is not None and computors.get('epoch'):
+                self.computors_cache.put(computors['epoch'], computors, is_current=True)
+            return {'computors': computors} if computors else {}
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting computors: {str(E)}') from None
     
@@ -64,7 +139,7 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.post(f'{self.core_url}{ENTITY_INFO}', headers=HEADERS, json=payload, timeout=self.timeout)
+            response = self.session.post(f'{self.core_url}{ENTITY_INFO}', headers=HEADERS, json=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -98,10 +173,10 @@ class QubiPy_Core:
             }
         
         try:
-            response = requests.post(f'{self.core_url}{CORE_TICK_DATA}', headers=HEADERS, json=payload, timeout=self.timeout)
+            response = self.session.post(f'{self.core_url}{CORE_TICK_DATA}', headers=HEADERS, json=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data
+            return self._as_model(Tick_Data, data)
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting tick data: {str(E)}') from None
     
@@ -119,10 +194,10 @@ class QubiPy_Core:
         """
 
         try:
-            response = requests.get(f'{self.core_url}{CORE_TICK_INFO}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{CORE_TICK_INFO}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data
+            return self._as_model(Tick_Info, data)
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting tick info: {str(E)}') from None
     
@@ -152,7 +227,7 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.post(f'{self.core_url}{TICK_QUORUM_VOTE}', headers=HEADERS, json=payload, timeout=self.timeout)
+            response = self.session.post(f'{self.core_url}{TICK_QUORUM_VOTE}', headers=HEADERS, json=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -185,10 +260,10 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.post(f'{self.core_url}{TICK_TRANSACTIONS}', headers=HEADERS, json=payload, timeout=self.timeout)
+            response = self.session.post(f'{self.core_url}{TICK_TRANSACTIONS}', headers=HEADERS, json=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data.get('transactions', {})
+            return self._as_model(Transaction, data.get('transactions', {}))
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting tick transactions: {str(E)}') from None
         
@@ -218,7 +293,7 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.post(f'{self.core_url}{TICK_TRANSACTION_STATUS}', headers=HEADERS, json=payload, timeout=self.timeout)
+            response = self.session.post(f'{self.core_url}{TICK_TRANSACTION_STATUS}', headers=HEADERS, json=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -241,7 +316,7 @@ class QubiPy_Core:
         """
 
         try:
-            response = requests.get(f'{self.core_url}{ACTIVE_BETS}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{ACTIVE_BETS}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -275,7 +350,7 @@ class QubiPy_Core:
 
 
         try:
-            response = requests.get(f'{self.core_url}{ACTIVE_BETS_BY_CREATOR}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{ACTIVE_BETS_BY_CREATOR}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -296,7 +371,7 @@ class QubiPy_Core:
         """
 
         try:
-            response = requests.get(f'{self.core_url}{BASIC_INFO}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{BASIC_INFO}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -330,10 +405,10 @@ class QubiPy_Core:
 
 
         try:
-            response = requests.get(f'{self.core_url}{BET_INFO}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{BET_INFO}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data
+            return self._as_model(Quottery_Bet, data)
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting bet info by id: {str(E)}') from None
         
@@ -367,7 +442,7 @@ class QubiPy_Core:
 
 
         try:
-            response = requests.get(f'{self.core_url}{BETTORS_BY_BET_OPTIONS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{BETTORS_BY_BET_OPTIONS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -407,9 +482,11 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.get(f'{self.core_url}{QX_ASSET_ASK_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{QX_ASSET_ASK_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.models:
+                return self._as_model(Qx_Order, data.get('orders', []))
             return data
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting QX data: {str(E)}') from None
@@ -444,9 +521,11 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.get(f'{self.core_url}{QX_ASSET_BID_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{QX_ASSET_BID_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.models:
+                return self._as_model(Qx_Order, data.get('orders', []))
             return data
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting QX bid orders: {str(E)}') from None
@@ -479,9 +558,11 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.get(f'{self.core_url}{QX_ENTITY_ASK_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{QX_ENTITY_ASK_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.models:
+                return self._as_model(Qx_Order, data.get('orders', []))
             return data
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting QX entity ask orders: {str(E)}') from None
@@ -514,9 +595,11 @@ class QubiPy_Core:
         }
 
         try:
-            response = requests.get(f'{self.core_url}{QX_ENTITY_BID_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{QX_ENTITY_BID_ORDERS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.models:
+                return self._as_model(Qx_Order, data.get('orders', []))
             return data
         except requests.RequestException as E:
             raise QubiPy_Exceptions(f'Error when getting QX entity bid orders: {str(E)}') from None
@@ -535,7 +618,7 @@ class QubiPy_Core:
             QubiPy_Exceptions: If there is an issue with the API request (e.g., network error, invalid response, or timeout).
         """
         try:
-            response = requests.get(f'{self.core_url}{QX_FEES}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.core_url}{QX_FEES}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status() # Raise an exception for bad HTTP status codes
             data = response.json()
             return data
@@ -564,7 +647,7 @@ class QubiPy_Core:
         """
         try:
             REWARD_PER_MONERO_BLOCK = 0.6
-            response = requests.get(f'{MONERO_URL}{MONERO_MINING_STATS}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{MONERO_URL}{MONERO_MINING_STATS}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status() # Raise an exception for bad HTTP status codes
             data = response.json()
             raw_rewards = data.get('pool_blocks_found', 0) * REWARD_PER_MONERO_BLOCK
@@ -6,6 +6,7 @@ This file contains key management and schnorrq signature functions for Qubic Net
 import os
 import ctypes
 import platform
+from typing import Any, Iterable
 
 system = platform.system()
 machine = platform.machine()
@@ -23,31 +24,33 @@ else:
 lib = ctypes.CDLL(os.path.join(os.path.dirname(__file__), lib_name))
 
 # Define argument and return types for ctypes bindings
+# Byte pointers are declared as void pointers, so bytes, ctypes arrays and arrays mapped over
+# caller buffers with from_buffer are all passed to the library without being copied.
 
 # bool getSubseedFromSeed(const uint8_t* seed, uint8_t* subseed)
 lib.getSubseedFromSeed.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.getSubseedFromSeed.restype = ctypes.c_bool
 
 # void getPrivateKeyFromSubSeed(const uint8_t* seed, uint8_t* privateKey)
 lib.getPrivateKeyFromSubSeed.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.getPrivateKeyFromSubSeed.restype = None
 
 # void getPublicKeyFromPrivateKey(const uint8_t* privateKey, uint8_t* publicKey)
 lib.getPublicKeyFromPrivateKey.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.getPublicKeyFromPrivateKey.restype = None
 
 # void getIdentityFromPublicKey(const uint8_t* pubkey, char* identity, bool isLowerCase)
 lib.getIdentityFromPublicKey.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
+    ctypes.c_void_p,
     ctypes.POINTER(ctypes.c_char),
     ctypes.c_bool
 ]
@@ -55,7 +58,7 @@ lib.getIdentityFromPublicKey.restype = None
 
 # void getTxHashFromDigest(const uint8_t* digest, char* txHash)
 lib.getTxHashFromDigest.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
+    ctypes.c_void_p,
     ctypes.POINTER(ctypes.c_char)
 ]
 lib.getTxHashFromDigest.restype = None
@@ -63,7 +66,7 @@ lib.getTxHashFromDigest.restype = None
 # void getPublicKeyFromIdentity(const char* identity, uint8_t* publicKey)
 lib.getPublicKeyFromIdentity.argtypes = [
     ctypes.c_char_p,
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p
 ]
 lib.getPublicKeyFromIdentity.restype = None
 
@@ -75,49 +78,115 @@ lib.checkSumIdentity.restype = ctypes.c_bool
 
 # void signWithNonceK(const unsigned char* k, const unsigned char* publicKey, const unsigned char* messageDigest, unsigned char* signature)
 lib.signWithNonceK.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.signWithNonceK.restype = None
 
 # void sign(const unsigned char* subseed, const unsigned char* publicKey, const unsigned char* messageDigest, unsigned char* signature) 
 lib.sign.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.sign.restype = None
 
 # bool verify(const unsigned char* publicKey, const unsigned char* messageDigest, const unsigned char* signature)
 lib.verify.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8),
-    ctypes.POINTER(ctypes.c_uint8)
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p
 ]
 lib.verify.restype = ctypes.c_bool
 
 # void KangarooTwelve(const uint8_t *input, unsigned int inputByteLen, uint8_t *output, unsigned int outputByteLen)
 lib.KangarooTwelve.argtypes = [
-    ctypes.POINTER(ctypes.c_uint8),
+    ctypes.c_void_p,
     ctypes.c_uint,
-    ctypes.POINTER(ctypes.c_uint8),
+    ctypes.c_void_p,
     ctypes.c_uint
 ]
 lib.KangarooTwelve.restype = None
 
+# void getDigestFromSiblings32(unsigned int depth, const uint8_t* input, unsigned int inputByteLen, unsigned int inputIndex, const uint8_t (*siblings)[32], uint8_t* output)
+# Not exported by every build of the library.
+if hasattr(lib, 'getDigestFromSiblings32'):
+    lib.getDigestFromSiblings32.argtypes = [
+        ctypes.c_uint,
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_uint,
+        ctypes.c_void_p,
+        ctypes.c_void_p
+    ]
+    lib.getDigestFromSiblings32.restype = None
+
+SIBLINGS_MAX_DEPTH = 32
+
+BytesLike = bytes | bytearray | memoryview
+
+# Buffer helpers
+ZERO_COPY_MIN_SIZE = 512 # Below this size, copying an input buffer into bytes is cheaper than mapping a ctypes view over it.
+
+_ARRAY_TYPES = {size: ctypes.c_uint8 * size for size in (32, 64)}
+
+def _array(size: int) -> Any:
+    return _ARRAY_TYPES.get(size) or ctypes.c_uint8 * size
+
+def _input(buffer: BytesLike, size: int) -> Any:
+    """
+    Returns an argument pointing at the first `size` bytes of `buffer`. bytes are passed as is and
+    large writable buffers (bytearray, memoryview, array.array, ctypes or NumPy arrays) are mapped in
+    place; small, read-only or non-contiguous buffers are copied, which costs less than a mapping.
+    """
+    if type(buffer) is bytes:
+        if len(buffer) < size:
+            raise ValueError(f"Buffer is too small: {len(buffer)} bytes instead of at least {size}.")
+        return buffer
+
+    view = buffer if type(buffer) is memoryview else memoryview(buffer)
+    if view.nbytes < size:
+        raise ValueError(f"Buffer is too small: {view.nbytes} bytes instead of at least {size}.")
+    if not view.c_contiguous:
+        return view.tobytes()[:size]
+
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    if size < ZERO_COPY_MIN_SIZE or view.readonly:
+        return bytes(view[:size])
+    return ctypes.byref(ctypes.c_char.from_buffer(view))
+
+def _output(out: BytesLike | None, size: int) -> Any:
+    """
+    Returns a new ctypes array of `size` bytes, or a pointer into the caller's writable `out` buffer.
+    """
+    if out is None:
+        return _array(size)()
+
+    view = out if type(out) is memoryview else memoryview(out)
+    if view.nbytes < size:
+        raise ValueError(f"Output buffer is too small: {view.nbytes} bytes instead of at least {size}.")
+    if view.readonly or not view.c_contiguous:
+        raise ValueError("Output buffer must be writable and contiguous.")
+    return ctypes.byref(ctypes.c_char.from_buffer(view))
+
 # Python wrapper functions
-def get_subseed_from_seed(seed: bytes) -> bytes:
+# Every wrapper accepts bytes or any buffer (bytearray, memoryview...) and passes it to the library
+# without copying it. Wrappers returning bytes also accept a writable `out` buffer: the result is
+# then written into it and `out` is returned, so hashing loops can run without allocations.
+def get_subseed_from_seed(seed: BytesLike, out: BytesLike | None = None) -> bytes:
     """
     Generates a subseed from the provided seed.
 
     Args:
         seed (bytes): A 55-byte seed used to generate the subseed.
+        out (bytes-like, optional): A writable buffer of at least 32 bytes receiving the subseed.
 
     Returns:
-        bytes: A 32-byte subseed.
+        bytes: A 32-byte subseed, or `out` when given.
 
     Raises:
         ValueError: If the seed is not exactly 55 bytes long or contains invalid characters.
@@ -125,43 +194,43 @@ def get_subseed_from_seed(seed: bytes) -> bytes:
 
     if len(seed) != 55:
         raise ValueError("Seed must be exactly 55 bytes long.")
-    subseed = (ctypes.c_uint8 * 32)()
-    seed_array = (ctypes.c_uint8 * len(seed)).from_buffer_copy(seed)
-    success = lib.getSubseedFromSeed(seed_array, subseed)
+    subseed = _output(out, 32)
+    success = lib.getSubseedFromSeed(_input(seed, 55), subseed)
     if not success:
         raise ValueError("Invalid seed: must contain only lowercase letters a-z.")
-    return bytes(subseed)
+    return bytes(subseed) if out is None else out
 
-def get_private_key_from_subseed(subseed: bytes) -> bytes:
+def get_private_key_from_subseed(subseed: BytesLike, out: BytesLike | None = None) -> bytes:
     """
     Derives a private key from the provided subseed.
 
     Args:
         subseed (bytes): A 32-byte subseed used to generate the private key.
+        out (bytes-like, optional): A writable buffer of at least 32 bytes receiving the private key.
 
     Returns:
-        bytes: A 32-byte private key.
+        bytes: A 32-byte private key, or `out` when given.
 
     Raises:
         ValueError: If the subseed is not exactly 32 bytes long.
     """
 
     if len(subseed) != 32:
-        raise ValueError("Subseed must be exactly 55 bytes long.")
-    private_key = (ctypes.c_uint8 * 32)()
-    subseed_array = (ctypes.c_uint8 * len(subseed)).from_buffer_copy(subseed)
-    lib.getPrivateKeyFromSubSeed(subseed_array, private_key)
-    return bytes(private_key)
+        raise ValueError("Subseed must be exactly 32 bytes long.")
+    private_key = _output(out, 32)
+    lib.getPrivateKeyFromSubSeed(_input(subseed, 32), private_key)
+    return bytes(private_key) if out is None else out
 
-def get_public_key_from_private_key(private_key: bytes) -> bytes:
+def get_public_key_from_private_key(private_key: BytesLike, out: BytesLike | None = None) -> bytes:
     """
     Generates a public key from the provided private key.
 
     Args:
         private_key (bytes): A 32-byte private key used to generate the public key.
+        out (bytes-like, optional): A writable buffer of at least 32 bytes receiving the public key.
 
     Returns:
-        bytes: A 32-byte public key.
+        bytes: A 32-byte public key, or `out` when given.
 
     Raises:
         ValueError: If the private key is not exactly 32 bytes long.
@@ -169,12 +238,11 @@ def get_public_key_from_private_key(private_key: bytes) -> bytes:
 
     if len(private_key) != 32:
         raise ValueError("Private key must be exactly 32 bytes long.")
-    public_key = (ctypes.c_uint8 * 32)()
-    private_key_array = (ctypes.c_uint8 * len(private_key)).from_buffer_copy(private_key)
-    lib.getPublicKeyFromPrivateKey(private_key_array, public_key)
-    return bytes(public_key)
+    public_key = _output(out, 32)
+    lib.getPublicKeyFromPrivateKey(_input(private_key, 32), public_key)
+    return bytes(public_key) if out is None else out
 
-def get_identity_from_public_key(public_key: bytes, is_lower_case: bool = False) -> str:
+def get_identity_from_public_key(public_key: BytesLike, is_lower_case: bool = False) -> str:
     """
     Derives an identity string from the provided public key.
 
@@ -192,11 +260,10 @@ def get_identity_from_public_key(public_key: bytes, is_lower_case: bool = False)
     if len(public_key) != 32:
         raise ValueError("Public key must be exactly 32 bytes long.")
     identity = (ctypes.c_char * 60)()
-    public_key_array = (ctypes.c_uint8 * len(public_key)).from_buffer_copy(public_key)
-    lib.getIdentityFromPublicKey(public_key_array, identity, ctypes.c_bool(is_lower_case))
-    return bytes(identity).decode('ascii')
+    lib.getIdentityFromPublicKey(_input(public_key, 32), identity, is_lower_case)
+    return identity.raw.decode('ascii')
 
-def get_tx_hash_from_digest(digest: bytes) -> bytes:
+def get_tx_hash_from_digest(digest: BytesLike) -> bytes:
     """
     Generates a transaction hash from the provided digest.
 
@@ -204,7 +271,7 @@ def get_tx_hash_from_digest(digest: bytes) -> bytes:
         digest (bytes): A 32-byte digest used to generate the transaction hash.
 
     Returns:
-        bytes: A 32-byte transaction hash.
+        bytes: The 60-character lowercase transaction hash, as ASCII bytes.
 
     Raises:
         ValueError: If the digest is not exactly 32 bytes long.
@@ -212,20 +279,20 @@ def get_tx_hash_from_digest(digest: bytes) -> bytes:
 
     if len(digest) != 32:
         raise ValueError("Digest must be exactly 32 bytes long.")
-    tx_hash = (ctypes.c_uint8 * 32)()
-    digest_array = (ctypes.c_uint8 * len(digest)).from_buffer_copy(digest)
-    lib.getTxHashFromDigest(digest_array, tx_hash)
-    return bytes(tx_hash)
+    tx_hash = (ctypes.c_char * 60)()
+    lib.getTxHashFromDigest(_input(digest, 32), tx_hash)
+    return tx_hash.raw
 
-def get_public_key_from_identity(identity: str) -> bytes:
+def get_public_key_from_identity(identity: str, out: BytesLike | None = None) -> bytes:
     """
     Retrieves a public key from the provided identity string.
 
     Args:
         identity (str): A 60-character identity string.
+        out (bytes-like, optional): A writable buffer of at least 32 bytes receiving the public key.
 
     Returns:
-        bytes: A 32-byte public key.
+        bytes: A 32-byte public key, or `out` when given.
 
     Raises:
         ValueError: If the identity string is not exactly 60 characters long.
@@ -233,10 +300,10 @@ def get_public_key_from_identity(identity: str) -> bytes:
 
     if len(identity) != 60:
         raise ValueError("Identity must be exactly 60 characters long.")
-    public_key = (ctypes.c_uint8 * 32)()
+    public_key = _output(out, 32)
     identity_bytes = identity.encode('utf-8')
     lib.getPublicKeyFromIdentity(identity_bytes, public_key)
-    return bytes(public_key)
+    return bytes(public_key) if out is None else out
 
 def check_sum_identity(identity: str) -> bool:
     """
@@ -257,29 +324,34 @@ def check_sum_identity(identity: str) -> bool:
     identity_bytes = identity.encode('utf-8')
     return bool(lib.checkSumIdentity(identity_bytes))
 
-def kangaroo_twelve(input: bytes, input_byte_len: int, output_byte_len: int) -> bytes:
+def kangaroo_twelve(input: BytesLike, input_byte_len: int, output_byte_len: int, out: BytesLike | None = None) -> bytes:
     """
     Generates a KangarooTwelve hash from the provided input.
 
     Args:
         input (bytes): The input bytes for which the KangarooTwelve hash is to be computed.
+                       Only the first `input_byte_len` bytes are hashed, in place.
         input_byte_len (int): The length of the input bytes.
         output_byte_len (int): The length of the output bytes.
+        out (bytes-like, optional): A writable buffer of at least `output_byte_len` bytes receiving the hash.
 
     Returns:
-        bytes: A bytes object representing the KangarooTwelve hash.
+        bytes: A bytes object representing the KangarooTwelve hash, or `out` when given.
+
+    Raises:
+        ValueError: If the input is shorter than `input_byte_len` or `out` is too small.
     """
-    output = (ctypes.c_uint8 * output_byte_len)()
-    input_array = (ctypes.c_uint8 * len(input)).from_buffer_copy(input)
-    lib.KangarooTwelve(input_array, input_byte_len, output, output_byte_len)
-    return bytes(output)
+    output = _output(out, output_byte_len)
+    lib.KangarooTwelve(_input(input, input_byte_len), input_byte_len, output, output_byte_len)
+    return bytes(output) if out is None else out
 
 def get_digest_from_siblings32(
     depth: int,
-    input_bytes: bytes,
+    input_bytes: BytesLike,
     input_byte_len: int,
     input_index: int,
-    siblings: list
+    siblings: Iterable[BytesLike] | BytesLike,
+    out: BytesLike | None = None
 ) -> bytes:
     """
     Computes a digest from the provided input bytes and sibling nodes.
@@ -289,10 +361,13 @@ def get_digest_from_siblings32(
         input_bytes (bytes): The input bytes for which the digest is to be computed.
         input_byte_len (int): The length of the input bytes.
         input_index (int): The index of the input in the tree.
-        siblings (list): A list of sibling node bytes, each 32 bytes long.
+        siblings (list | bytes-like): A list of sibling node bytes, each 32 bytes long, or a single buffer
+                                      holding the siblings back to back, passed without copying when it
+                                      already spans the 32 slots (1024 bytes).
+        out (bytes-like, optional): A writable buffer of at least 32 bytes receiving the digest.
 
     Returns:
-        bytes: A 32-byte digest.
+        bytes: A 32-byte digest, or `out` when given.
 
     Raises:
         ValueError: If the input bytes length does not match input_byte_len or if siblings do not match the depth and required length.
@@ -300,32 +375,32 @@ def get_digest_from_siblings32(
 
     if len(input_bytes) != input_byte_len:
         raise ValueError("Input bytes length does not match input_byte_len.")
-    if len(siblings) != depth or any(len(sib) != 32 for sib in siblings):
-        raise ValueError("Each sibling must be exactly 32 bytes and match the depth.")
-    
-    output = (ctypes.c_uint8 * 32)()
-    input_array = (ctypes.c_uint8 * len(input_bytes)).from_buffer_copy(input_bytes)
-    
-    # Create a 2D array for siblings
-    SiblingsType = ctypes.c_uint8 * 32
-    siblings_array = (SiblingsType * 32)()
-    for i, sib in enumerate(siblings):
-        if i >= 32:
-            break  # Prevent overflow if depth > 32
-        sib_array = SiblingsType(*sib)
-        siblings_array[i] = sib_array
-    
+
+    if isinstance(siblings, (bytes, bytearray, memoryview)):
+        if memoryview(siblings).nbytes not in (depth * 32, SIBLINGS_MAX_DEPTH * 32):
+            raise ValueError("Each sibling must be exactly 32 bytes and match the depth.")
+        siblings_buffer = siblings
+    else:
+        siblings = list(siblings)
+        if len(siblings) != depth or any(len(sib) != 32 for sib in siblings):
+            raise ValueError("Each sibling must be exactly 32 bytes and match the depth.")
+        siblings_buffer = b''.join(siblings[:SIBLINGS_MAX_DEPTH])
+
+    if memoryview(siblings_buffer).nbytes < SIBLINGS_MAX_DEPTH * 32:
+        siblings_buffer = bytes(siblings_buffer).ljust(SIBLINGS_MAX_DEPTH * 32, b'\x00')
+
+    output = _output(out, 32)
     lib.getDigestFromSiblings32(
-        ctypes.c_uint(depth),
-        input_array,
-        ctypes.c_uint(input_byte_len),
-        ctypes.c_uint(input_index),
-        siblings_array,
+        depth,
+        _input(input_bytes, input_byte_len),
+        input_byte_len,
+        input_index,
+        _input(siblings_buffer, SIBLINGS_MAX_DEPTH * 32),
         output
     )
-    return bytes(output)
+    return bytes(output) if out is None else out
 
-def sign_with_nonce_k(k: bytes, public_key: bytes, message_digest: bytes) -> bytes:
+def sign_with_nonce_k(k: BytesLike, public_key: BytesLike, message_digest: BytesLike, out: BytesLike | None = None) -> bytes:
     """
     Generates a signature using a nonce k, public key, and message digest.
 
@@ -333,19 +408,17 @@ def sign_with_nonce_k(k: bytes, public_key: bytes, message_digest: bytes) -> byt
         k (bytes): A nonce value used in signing.
         public_key (bytes): A 32-byte public key.
         message_digest (bytes): A 32-byte message digest to sign.
+        out (bytes-like, optional): A writable buffer of at least 64 bytes receiving the signature.
 
     Returns:
-        bytes: A 64-byte signature.
+        bytes: A 64-byte signature, or `out` when given.
     """
 
-    signature = (ctypes.c_uint8 * 64)()
-    k_array = (ctypes.c_uint8 * len(k)).from_buffer_copy(k)
-    public_key_array = (ctypes.c_uint8 * len(public_key)).from_buffer_copy(public_key)
-    message_digest_array = (ctypes.c_uint8 * len(message_digest)).from_buffer_copy(message_digest)
-    lib.signWithNonceK(k_array, public_key_array, message_digest_array, signature)
-    return bytes(signature)
+    signature = _output(out, 64)
+    lib.signWithNonceK(_input(k, len(k)), _input(public_key, 32), _input(message_digest, 32), signature)
+    return bytes(signature) if out is None else out
 
-def sign(subseed: bytes, public_key: bytes, message_digest: bytes) -> bytes:
+def sign(subseed: BytesLike, public_key: BytesLike, message_digest: BytesLike, out: BytesLike | None = None) -> bytes:
     """
     Generates a signature using a subseed, public key, and message digest.
 
@@ -353,19 +426,17 @@ def sign(subseed: bytes, public_key: bytes, message_digest: bytes) -> bytes:
         subseed (bytes): A 32-byte subseed used in signing.
         public_key (bytes): A 32-byte public key.
         message_digest (bytes): A 32-byte message digest to sign.
+        out (bytes-like, optional): A writable buffer of at least 64 bytes receiving the signature.
 
     Returns:
-        bytes: A 64-byte signature.
+        bytes: A 64-byte signature, or `out` when given.
     """
 
-    signature = (ctypes.c_uint8 * 64)()
-    subseed_array = (ctypes.c_uint8 * len(subseed)).from_buffer_copy(subseed)
-    public_key_array = (ctypes.c_uint8 * len(public_key)).from_buffer_copy(public_key)
-    message_digest_array = (ctypes.c_uint8 * len(message_digest)).from_buffer_copy(message_digest)
-    lib.sign(subseed_array, public_key_array, message_digest_array, signature)
-    return bytes(signature)
+    signature = _output(out, 64)
+    lib.sign(_input(subseed, 32), _input(public_key, 32), _input(message_digest, 32), signature)
+    return bytes(signature) if out is None else out
 
-def verify(public_key: bytes, message_digest: bytes, signature: bytes) -> bool:
+def verify(public_key: BytesLike, message_digest: BytesLike, signature: BytesLike) -> bool:
     """
     Verifies the provided signature against the public key and message digest.
 
@@ -378,7 +449,4 @@ def verify(public_key: bytes, message_digest: bytes, signature: bytes) -> bool:
         bool: True if the signature is valid, False otherwise.
     """
 
-    public_key_array = (ctypes.c_uint8 * len(public_key)).from_buffer_copy(public_key)
-    message_digest_array = (ctypes.c_uint8 * len(message_digest)).from_buffer_copy(message_digest)
-    signature_array = (ctypes.c_uint8 * len(signature)).from_buffer_copy(signature)
-    return bool(lib.verify(public_key_array, message_digest_array, signature_array))
+    return bool(lib.verify(_input(public_key, 32), _input(message_digest, 32), _input(signature, 64)))
@@ -26,6 +26,10 @@ class QubiPy_Exceptions(Exception):
 
     INVALID_PAGES = 'Page size must be between 1 and 100'
 
+    INVALID_TRACKER_SOURCE = 'The transaction tracker needs an RPC client or a Core client'
+
+    STALE_CURSOR = 'The cursor was taken in another epoch, the rich list has changed since and the export must restart'
+
     INVALID_DATA_FORMAT = 'Invalid data format detected, please try again'
 
     INVALID_BET_ID = 'Invalid bet ID, try again'
@@ -46,3 +50,27 @@ class QubiPy_Exceptions(Exception):
 
     INVALID_IDENTITY_ASSET = "You must enter a valid ID and a valid asset name."
 
+    INVALID_POOL_CONFIG = "Pool size and max connections per host must be positive integers."
+
+    INVALID_FETCH_TARGET = "Unknown data requested, use 'tick_data' and/or 'approved_transactions'."
+
+    INVALID_ARCHIVE_KIND = "Unknown archive kind, use 'tick_data', 'quorum_tick_data', 'chain_hash' or 'store_hash'."
+
+    INVALID_RATE_LIMIT = "Rate limits must be positive: requests per second above 0 and a burst of at least 1."
+
+    INVALID_ENDPOINTS = "Endpoints must be a non-empty list of base URLs, served through a QubiPy session."
+
+    INVALID_BATCH_TX = "Every transaction of a batch must be (destination ID, amount, target tick, input type, payload), with a non-negative amount, a tick above 0 and a payload within the maximum input size."
+
+    INVALID_BATCH_EXECUTOR = "Unknown executor, use 'thread' or 'process'."
+
+
+class QubiPy_Circuit_Open(QubiPy_Exceptions):
+
+    """Raised without contacting the server while the circuit of an endpoint is open"""
+
+    def __init__(self, url: str, group: str, retry_in: float):
+        self.url = url
+        self.group = group
+        self.retry_in = retry_in
+        super().__init__(f"The circuit for {url} ({group}) is open after repeated failures, next attempt in {retry_in:.1f} seconds.")
@@ -0,0 +1,76 @@
+"""
+json_backend.py
+Pluggable JSON decoder used for every API response. It decodes straight from the raw response
+bytes with orjson when it is installed (pip install QubiPy[fast]) and with the stdlib json
+module otherwise. Any callable taking bytes can be plugged in with `set_json_decoder`.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND_ORJSON = 'orjson'
+
+JSON_BACKEND_STDLIB = 'json'
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+_default_decoder: Callable[[bytes], Any] = orjson.loads if orjson is not None else _stdlib_loads
+
+_decoder = _default_decoder
+
+
+def set_json_decoder(decoder: Callable[[bytes], Any] | str | None):
+    """
+    Replaces the decoder used for API responses.
+
+    Args:
+        decoder (Callable[[bytes], Any] | str | None): A callable decoding raw bytes (it must raise ValueError
+            on invalid input), JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB, or None to restore the default.
+
+    Raises:
+        ImportError: If JSON_BACKEND_ORJSON is requested but orjson is not installed.
+    """
+    global _decoder
+
+    if decoder is None:
+        _decoder = _default_decoder
+    elif decoder == JSON_BACKEND_ORJSON:
+        if orjson is None:
+            raise ImportError("The orjson backend requires orjson, install it with: pip install QubiPy[fast]")
+        _decoder = orjson.loads
+    elif decoder == JSON_BACKEND_STDLIB:
+        _decoder = _stdlib_loads
+    else:
+        _decoder = decoder
+
+
+def get_json_decoder() -> Callable[[bytes], Any]:
+    """
+    Returns:
+        Callable[[bytes], Any]: The decoder currently used for API responses.
+    """
+    return _decoder
+
+
+def decode_json(data: bytes) -> Any:
+    """
+    Decodes a raw JSON document with the current decoder.
+
+    Args:
+        data (bytes): The raw response body.
+
+    Returns:
+        Any: The decoded document.
+
+    Raises:
+        ValueError: If the document is not valid JSON (json.JSONDecodeError for the built-in backends).
+    """
+    return _decoder(data)
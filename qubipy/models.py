@@ -0,0 +1,380 @@
+"""
+models.py
+Typed, frozen and slotted response models returned by QubiPy_RPC and QubiPy_Core when they are
+created with `models=True`. A slotted instance has no per-object __dict__, so holding millions of
+transactions, balances or asset records costs a fraction of the memory of the raw dictionaries,
+and attribute access is cheaper than a dictionary lookup.
+
+Amounts that the API returns as strings are converted to int. Fields are the snake_case
+versions of the API's camelCase keys.
+"""
+
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+
+def _int(value: Any) -> int:
+    return int(value) if value not in (None, '') else 0
+
+
+def _b64_to_hex(value: str | None) -> str:
+    return base64.b64decode(value).hex() if value else ''
+
+
+def _unwrap(record: Dict[str, Any]) -> Tuple[Dict[str, Any], int | None, int | None]:
+    """
+    Splits an asset record into its body, tick and universe index. The API returns asset records
+    as `{'data': {...}, 'info': {'tick', 'universeIndex'}}`, `{'data': {...}, 'universeIndex'}` or bare.
+    """
+    if 'data' not in record:
+        return record, None, None
+    info = record.get('info', record)
+    return record['data'], info.get('tick'), info.get('universeIndex')
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    source_id: str
+    dest_id: str
+    amount: int
+    tick_number: int
+    input_type: int
+    input_size: int
+    input_hex: str
+    signature_hex: str
+    tx_id: str
+    digest: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
+        """
+        Builds a transaction from the RPC format (`tickNumber`, `inputHex`, `signatureHex`) or the
+        Core format (`tick`, base64 `input` and `signature`, `digest`). Core payloads are converted to hex.
+        """
+        if 'tickNumber' in data or 'signatureHex' in data:
+            input_hex, signature_hex = data.get('inputHex', ''), data.get('signatureHex', '')
+        else:
+            input_hex, signature_hex = _b64_to_hex(data.get('input')), _b64_to_hex(data.get('signature'))
+
+        return cls(
+            source_id=data.get('sourceId', ''),
+            dest_id=data.get('destId', ''),
+            amount=_int(data.get('amount')),
+            tick_number=_int(data.get('tickNumber', data.get('tick'))),
+            input_type=_int(data.get('inputType')),
+            input_size=_int(data.get('inputSize')),
+            input_hex=input_hex,
+            signature_hex=signature_hex,
+            tx_id=data.get('txId', ''),
+            digest=data.get('digest')
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Balance:
+    id: str
+    balance: int
+    valid_for_tick: int
+    latest_incoming_transfer_tick: int
+    latest_outgoing_transfer_tick: int
+    incoming_amount: int
+    outgoing_amount: int
+    number_of_incoming_transfers: int
+    number_of_outgoing_transfers: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Balance':
+        return cls(
+            id=data.get('id', ''),
+            balance=_int(data.get('balance')),
+            valid_for_tick=_int(data.get('validForTick')),
+            latest_incoming_transfer_tick=_int(data.get('latestIncomingTransferTick')),
+            latest_outgoing_transfer_tick=_int(data.get('latestOutgoingTransferTick')),
+            incoming_amount=_int(data.get('incomingAmount')),
+            outgoing_amount=_int(data.get('outgoingAmount')),
+            number_of_incoming_transfers=_int(data.get('numberOfIncomingTransfers')),
+            number_of_outgoing_transfers=_int(data.get('numberOfOutgoingTransfers'))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Tick_Info:
+    tick: int
+    duration: int
+    epoch: int
+    initial_tick: int
+    number_of_aligned_votes: int | None = None
+    number_of_misaligned_votes: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Tick_Info':
+        """
+        Builds tick info from the RPC format (`duration`, `initialTick`) or the Core format
+        (`durationInSeconds`, `initialTickOfEpoch` and vote counts).
+        """
+        return cls(
+            tick=_int(data.get('tick')),
+            duration=_int(data.get('duration', data.get('durationInSeconds'))),
+            epoch=_int(data.get('epoch')),
+            initial_tick=_int(data.get('initialTick', data.get('initialTickOfEpoch'))),
+            number_of_aligned_votes=data.get('numberOfAlignedVotes'),
+            number_of_misaligned_votes=data.get('numberOfMisalignedVotes')
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Tick_Data:
+    computor_index: int
+    epoch: int
+    tick_number: int
+    timestamp: str
+    var_struct: str
+    time_lock: str
+    transaction_ids: Tuple[str, ...]
+    contract_fees: Tuple[Any, ...]
+    signature_hex: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Tick_Data':
+        """
+        Builds tick data from the RPC format (`tickNumber`, `signatureHex`) or the Core format
+        (`tick`, base64 `signature`, converted to hex). The timestamp is kept as returned.
+        """
+        signature_hex = data['signatureHex'] if 'signatureHex' in data else _b64_to_hex(data.get('signature'))
+
+        return cls(
+            computor_index=_int(data.get('computorIndex')),
+            epoch=_int(data.get('epoch')),
+            tick_number=_int(data.get('tickNumber', data.get('tick'))),
+            timestamp=data.get('timestamp', ''),
+            var_struct=data.get('varStruct', ''),
+            time_lock=data.get('timeLock', ''),
+            transaction_ids=tuple(data.get('transactionIds') or ()),
+            contract_fees=tuple(data.get('contractFees') or ()),
+            signature_hex=signature_hex
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the tick data in the RPC format, as stored by the tick archive.
+        """
+        return {
+            'computorIndex': self.computor_index,
+            'epoch': self.epoch,
+            'tickNumber': self.tick_number,
+            'timestamp': self.timestamp,
+            'varStruct': self.var_struct,
+            'timeLock': self.time_lock,
+            'transactionIds': list(self.transaction_ids),
+            'contractFees': list(self.contract_fees),
+            'signatureHex': self.signature_hex
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Asset_Issuance:
+    issuer_identity: str
+    type: int
+    name: str
+    number_of_decimal_places: int
+    unit_of_measurement: Tuple[int, ...]
+    tick: int | None = None
+    universe_index: int | None = None
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Asset_Issuance':
+        data, tick, universe_index = _unwrap(record)
+        return cls(
+            issuer_identity=data.get('issuerIdentity', ''),
+            type=_int(data.get('type')),
+            name=data.get('name', ''),
+            number_of_decimal_places=_int(data.get('numberOfDecimalPlaces')),
+            unit_of_measurement=tuple(data.get('unitOfMeasurement') or ()),
+            tick=tick,
+            universe_index=universe_index
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Asset_Ownership:
+    owner_identity: str
+    type: int
+    managing_contract_index: int
+    issuance_index: int
+    number_of_units: int
+    issued_asset: Asset_Issuance | None
+    tick: int | None = None
+    universe_index: int | None = None
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Asset_Ownership':
+        data, tick, universe_index = _unwrap(record)
+        issued_asset = data.get('issuedAsset')
+        return cls(
+            owner_identity=data.get('ownerIdentity', ''),
+            type=_int(data.get('type')),
+            managing_contract_index=_int(data.get('managingContractIndex')),
+            issuance_index=_int(data.get('issuanceIndex')),
+            number_of_units=_int(data.get('numberOfUnits')),
+            issued_asset=Asset_Issuance.from_dict(issued_asset) if issued_asset else None,
+            tick=tick,
+            universe_index=universe_index
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Asset_Possession:
+    possessor_identity: str
+    type: int
+    managing_contract_index: int
+    issuance_index: int
+    number_of_units: int
+    owned_asset: Asset_Ownership | None
+    tick: int | None = None
+    universe_index: int | None = None
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Asset_Possession':
+        data, tick, universe_index = _unwrap(record)
+        owned_asset = data.get('ownedAsset')
+        return cls(
+            possessor_identity=data.get('possessorIdentity', ''),
+            type=_int(data.get('type')),
+            managing_contract_index=_int(data.get('managingContractIndex')),
+            issuance_index=_int(data.get('issuanceIndex')),
+            number_of_units=_int(data.get('numberOfUnits')),
+            owned_asset=Asset_Ownership.from_dict(owned_asset) if owned_asset else None,
+            tick=tick,
+            universe_index=universe_index
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Qx_Order:
+    price: int
+    number_of_shares: int
+    entity_id: str | None = None
+    issuer_id: str | None = None
+    asset_name: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Qx_Order':
+        """
+        Builds an order from an asset order book (`entityId`) or an entity's orders (`issuerId`, `assetName`).
+        """
+        return cls(
+            price=_int(data.get('price')),
+            number_of_shares=_int(data.get('numberOfShares')),
+            entity_id=data.get('entityId'),
+            issuer_id=data.get('issuerId'),
+            asset_name=data.get('assetName')
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Bet_Option:
+    description: str
+    state: int
+
+
+@dataclass(frozen=True, slots=True)
+class Bet_Oracle:
+    id: str
+    fee_percentage: int
+
+
+@dataclass(frozen=True, slots=True)
+class Quottery_Bet:
+    id: int
+    creator_id: str
+    description: str
+    options: Tuple[Bet_Option, ...]
+    oracles: Tuple[Bet_Oracle, ...]
+    votes: Tuple[Any, ...]
+    minimum_bet_amount: int
+    maximum_bet_slot_per_option: int
+    open_time: str
+    close_time: str
+    end_time: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Quottery_Bet':
+        """
+        Builds a bet from `get_bet_info`. The NUL padding of the fixed-size descriptions is removed.
+        """
+        return cls(
+            id=_int(data.get('id')),
+            creator_id=data.get('creatorId', ''),
+            description=data.get('description', '').rstrip('\x00'),
+            options=tuple(Bet_Option(option.get('description', '').rstrip('\x00'), _int(option.get('state'))) for option in data.get('options') or ()),
+            oracles=tuple(Bet_Oracle(oracle.get('id', ''), _int(oracle.get('feePercentage'))) for oracle in data.get('oracles') or ()),
+            votes=tuple(data.get('votes') or ()),
+            minimum_bet_amount=_int(data.get('minimumBetAmount')),
+            maximum_bet_slot_per_option=_int(data.get('maximumBetSlotPerOption')),
+            open_time=data.get('openTime', ''),
+            close_time=data.get('closeTime', ''),
+            end_time=data.get('endTime', '')
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Tick_Transfers:
+    tick_number: int
+    identity: str
+    transactions: Tuple[Transaction, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Tick_Transfers':
+        """
+        Builds one entry of `get_transfer_transactions_per_tick`.
+        """
+        return cls(
+            tick_number=_int(data.get('tickNumber')),
+            identity=data.get('identity', ''),
+            transactions=tuple(Transaction.from_dict(tx) for tx in data.get('transactions') or ())
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Broadcast_Result:
+    index: int
+    target_tick: int | None
+    response: Dict[str, Any] | None = None
+    error: Exception | None = None
+    expired: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the transaction was accepted by the RPC server.
+        """
+        return self.response is not None
+
+
+def field_of(record: Any, attribute: str, key: str) -> Any:
+    """
+    Reads a field from a model (by attribute) or from an API dictionary (by key), so helpers work
+    whether the client was created with `models=True` or not.
+    """
+    if isinstance(record, dict):
+        return record.get(key)
+    return getattr(record, attribute, None)
+
+
+def as_model(model: type, data: Any) -> Any:
+    """
+    Converts a record, or a list of records, to `model`. Empty responses are returned unchanged.
+
+    Args:
+        model (type): One of the model classes of this module.
+        data (Any): A dictionary or a list of dictionaries returned by the API.
+
+    Returns:
+        Any: The model instance, a list of instances, or `data` itself if it is empty.
+    """
+    if not data:
+        return data
+    if isinstance(data, list):
+        return [model.from_dict(item) for item in data]
+    return model.from_dict(data)
@@ -5,21 +5,94 @@ the interaction with the Qubic API, making HTTP requests and handling responses.
 """
 
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Sequence, Tuple
 import json
 import warnings
+import time
 
 from qubipy.exceptions import *
 from qubipy.config import *
 from qubipy.endpoints_rpc import *
 from qubipy.utils import *
+from qubipy.models import *
+from qubipy.transport.session import QubiPy_Session
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.transport.retry import Retry_Policy
+from qubipy.transport.rate_limit import Rate_Limiter
+from qubipy.transport.balancer import Endpoint_Pool
+from qubipy.transport.hedging import Hedge_Policy
+from qubipy.transport.circuit import Circuit_Breaker
+from qubipy.concurrency import call_with_retries, is_overload, ordered_map, iter_pages, Page_Cursor, Adaptive_Chunks
+from qubipy.cache.archive import *
+from qubipy.cache.computors import Computors_Cache
+from qubipy.watch.ticks import Tick_Pacer, follow_ticks, check_hydrate
 import base64
 import json
 
 class QubiPy_RPC:
-    def __init__(self, rpc_url: str = RPC_URL, timeout=TIMEOUT):
-        self.rpc_url = rpc_url
+    def __init__(self, rpc_url: str | Sequence[str] = RPC_URL, timeout=TIMEOUT, session: requests.Session | None = None, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE, keep_alive: float | None = KEEP_ALIVE, archive: Tick_Archive | None = None, computors_cache: Computors_Cache | None = None, response_cache: TTL_Cache | None = None, retry: Retry_Policy | None = None, rate_limiter: Rate_Limiter | None = None, hedge: Hedge_Policy | None = None, circuit_breaker: Circuit_Breaker | None = None, models: bool = False):
+        """
+        Initializes the client and its pooled HTTP session.
+
+        Args:
+            rpc_url (str | Sequence[str]): Base URL of the RPC API, or the base URLs of several interchangeable
+                                          nodes. Requests are then balanced across the healthy, fastest nodes and
+                                          fail over when a node fails. The first URL is the primary one.
+            timeout (int): Timeout in seconds applied to every request.
+            session (requests.Session | None): An existing session to reuse, for example one shared
+                                               between QubiPy_RPC and QubiPy_Core. When provided, the
+                                               pool settings below are ignored and `close()` leaves it open.
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections per host.
+            keep_alive (float | None): Seconds the pool may sit idle before its connections are recycled.
+            archive (Tick_Archive | None): Optional on-disk archive read through by `get_tick_data`,
+                                           `get_quorum_tick_data`, `get_chain_hash` and `get_store_hash`.
+            computors_cache (Computors_Cache | None): Optional epoch-keyed cache used by `get_computors`.
+            response_cache (TTL_Cache | None): Optional per-endpoint TTL cache with request coalescing,
+                                               for example `TTL_Cache.hot_endpoints()`. Ignored when `session` is given.
+            retry (Retry_Policy | None): Optional retry policy with backoff and a retry budget. Ignored when `session` is given.
+            rate_limiter (Rate_Limiter | None): Optional token-bucket limiter per base URL, which can be shared
+                                                between clients. Ignored when `session` is given.
+            hedge (Hedge_Policy | None): Optional hedging of idempotent reads (`get_balance`, `get_tick_data` and
+                                         `get_transaction` by default) across the nodes of `rpc_url`. Ignored when `session` is given.
+            circuit_breaker (Circuit_Breaker | None): Optional circuit breakers per base URL and endpoint group. While a
+                                                      circuit is open, calls fail fast with QubiPy_Circuit_Open. Ignored when `session` is given.
+            models (bool): Return the typed, slotted models of qubipy.models (Transaction, Balance, Tick_Info,
+                           Tick_Data, Asset_Issuance, Asset_Ownership, Asset_Possession, Tick_Transfers)
+                           instead of dictionaries.
+        """
+        self.endpoints = Endpoint_Pool(rpc_url, health_endpoint=HEALTH_CHECK) if not isinstance(rpc_url, str) else None
+        self.rpc_url = self.endpoints.primary if self.endpoints is not None else rpc_url
         self.timeout = timeout
+        self.models = models
+        self.archive = archive
+        self.computors_cache = computors_cache
+        self._owns_session = session is None
+        self.session = session if session is not None else QubiPy_Session(pool_connections, pool_maxsize, keep_alive, response_cache=response_cache, retry=retry, rate_limiter=rate_limiter, hedge=hedge, circuit_breaker=circuit_breaker)
+
+        if self.endpoints is not None:
+            if not isinstance(self.session, QubiPy_Session):
+                raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ENDPOINTS)
+            self.session.add_endpoint_pool(self.endpoints)
+
+    def close(self):
+        """
+        Closes the pooled connections owned by this client. A session passed in by the caller is left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'QubiPy_RPC':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _as_model(self, model: type, data: Any) -> Any:
+        """
+        Converts a record, or a list of records, to `model` when the client was created with `models=True`.
+        """
+        return as_model(model, data) if self.models else data
 
     
     def get_latest_tick(self) -> Dict[str, Any]:
@@ -34,7 +107,7 @@ class QubiPy_RPC:
         """
 
         try:
-            response = requests.get(f'{self.rpc_url}{LATEST_TICK}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{LATEST_TICK}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
             return data.get('latestTick', {})
@@ -63,7 +136,7 @@ class QubiPy_RPC:
             "encodedTransaction": tx_encoded
         })
         try:
-            response = requests.post(
+            response = self.session.post(
                 f'{self.rpc_url}{BROADCAST_TRANSACTION}',
                 data=payload,
                 headers={'Content-Type': 'application/json'},
@@ -106,10 +179,10 @@ class QubiPy_RPC:
         endpoint = APPROVED_TRANSACTIONS_FOR_TICK.format(tick = tick)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=TIMEOUT)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=TIMEOUT)
             response.raise_for_status()
             data = response.json()
-            return data.get('approvedTransactions', {})
+            return self._as_model(Transaction, data.get('approvedTransactions', {}))
 
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the approved transactions from the API: {str(E)}") from None
@@ -136,10 +209,10 @@ class QubiPy_RPC:
         endpoint = WALLET_BALANCE.format(id = wallet_id.upper())
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()  # Raise an exception for bad HTTP status codes
             data = response.json()
-            return data.get('balance', {})
+            return self._as_model(Balance, data.get('balance', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the balance data from the API, check the address ID and try again: {str(E)}") from None
     
@@ -156,7 +229,7 @@ class QubiPy_RPC:
         """
 
         try:
-            response = requests.get(f'{self.rpc_url}{STATUS}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{STATUS}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data  
@@ -182,13 +255,21 @@ class QubiPy_RPC:
         if not tick_number:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TICK_ERROR)
         
+        if self.archive is not None:
+            archived = self.archive.get(ARCHIVE_CHAIN_HASH, tick_number)
+            if archived is not None:
+                return archived
+
         endpoint = CHAIN_HASH.format(tick = tick_number)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('hexDigest', {})
+            chain_hash = data.get('hexDigest', {})
+            if self.archive is not None:
+                self.archive.put(ARCHIVE_CHAIN_HASH, tick_number, chain_hash)
+            return chain_hash
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the chain hash: {str(E)}") from None
     
@@ -211,12 +292,19 @@ class QubiPy_RPC:
         if not tick_number:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TICK_ERROR)
         
+        if self.archive is not None:
+            archived = self.archive.get(ARCHIVE_QUORUM_TICK_DATA, tick_number)
+            if archived is not None:
+                return archived
+
         endpoint = QUORUM_TICK_DATA.format(tick = tick_number)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.archive is not None:
+                self.archive.put(ARCHIVE_QUORUM_TICK_DATA, tick_number, data)
             return data
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the quorum tick data: {str(E)}") from None
@@ -240,12 +328,19 @@ class QubiPy_RPC:
         if not tick_number:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TICK_ERROR)
         
+        if self.archive is not None:
+            archived = self.archive.get(ARCHIVE_STORE_HASH, tick_number)
+            if archived is not None:
+                return archived
+
         endpoint = STORE_HASH.format(tick = tick_number)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.archive is not None:
+                self.archive.put(ARCHIVE_STORE_HASH, tick_number, data)
             return data
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the store hash: {str(E)}") from None
@@ -272,10 +367,10 @@ class QubiPy_RPC:
         endpoint = TRANSACTION.format(tx_id = tx_id)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('transaction', {})
+            return self._as_model(Transaction, data.get('transaction', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the transaction data: {str(E)}") from None
     
@@ -301,7 +396,7 @@ class QubiPy_RPC:
         endpoint = TRANSACTION_STATUS.format(tx_id = tx_id)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data.get('transactionStatus', {})
@@ -327,13 +422,21 @@ class QubiPy_RPC:
         if not tick:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TICK_ERROR)
         
+        if self.archive is not None:
+            archived = self.archive.get(ARCHIVE_TICK_DATA, tick)
+            if archived is not None:
+                return self._as_model(Tick_Data, archived)
+
         endpoint = TICK_DATA.format(tick = tick)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('tickData', {})  
+            tick_data = data.get('tickData', {})
+            if self.archive is not None:
+                self.archive.put(ARCHIVE_TICK_DATA, tick, tick_data)
+            return self._as_model(Tick_Data, tick_data)
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the tick data: {str(E)}") from None
     
@@ -373,9 +476,11 @@ class QubiPy_RPC:
         }
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
+            if self.models:
+                return self._as_model(Tick_Transfers, data.get('transferTransactionsPerTick', []))
             return data
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the transfer transactions: {str(E)}") from None
@@ -395,7 +500,7 @@ class QubiPy_RPC:
         endpoint = HEALTH_CHECK
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data
@@ -421,14 +526,27 @@ class QubiPy_RPC:
         if not epoch:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_EPOCH)
         
+        if self.computors_cache is not None:
+            if self.computors_cache.needs_current_epoch(epoch):
+                # Confirms the current epoch, so a possibly stale entry is neither served nor closed.
+                current_epoch = field_of(self.get_tick_info(), 'epoch', 'epoch')
+                if current_epoch:
+                    self.computors_cache.set_current_epoch(current_epoch)
+            cached = self.computors_cache.get(epoch)
+            if cached is not None:
+                return cached
+
         endpoint = COMPUTORS.format(epoch = epoch)
         
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('computors', {})
+            computors = data.get('computors', {})
+            if self.computors_cache is not None and computors:
+                self.computors_cache.put(epoch, computors)
+            return computors
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the computors: {str(E)}") from None
     
@@ -465,7 +583,7 @@ class QubiPy_RPC:
         }
         
         try:
-            response = requests.post(f'{self.rpc_url}{QUERY_SC}', headers=HEADERS, json=payload, timeout=TIMEOUT)
+            response = self.session.post(f'{self.rpc_url}{QUERY_SC}', headers=HEADERS, json=payload, timeout=TIMEOUT)
             response.raise_for_status()
             data = response.json()
             return data.get('responseData', {})
@@ -486,10 +604,10 @@ class QubiPy_RPC:
         """
 
         try:
-            response = requests.get(f'{self.rpc_url}{TICK_INFO}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{TICK_INFO}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('tickInfo', {})
+            return self._as_model(Tick_Info, data.get('tickInfo', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the tick info data: {str(E)}") from None
     
@@ -515,10 +633,10 @@ class QubiPy_RPC:
         endpoint = ISSUED_ASSETS.format(identity = identity)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('issuedAssets', {})
+            return self._as_model(Asset_Issuance, data.get('issuedAssets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the list of assets issued by a specific identity: {str(E)}") from None
     
@@ -545,10 +663,10 @@ class QubiPy_RPC:
         endpoint = OWNED_ASSETS.format(identity = identity)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('ownedAssets', {})
+            return self._as_model(Asset_Ownership, data.get('ownedAssets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the owned assets: {str(E)}") from None
     
@@ -575,10 +693,10 @@ class QubiPy_RPC:
         endpoint = POSSESSED_ASSETS.format(identity = identity)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('possessedAssets', {})
+            return self._as_model(Asset_Possession, data.get('possessedAssets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the possessed assets: {str(E)}") from None
 
@@ -605,7 +723,7 @@ class QubiPy_RPC:
         stacklevel=2
         )
         try:
-            response = requests.get(f'{self.rpc_url}{BLOCK_HEIGHT}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{BLOCK_HEIGHT}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data.get('blockHeight', {})
@@ -626,7 +744,7 @@ class QubiPy_RPC:
         """
 
         try:
-            response = requests.get(f'{self.rpc_url}{LATEST_STATS}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{LATEST_STATS}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data.get('data', {})
@@ -655,14 +773,21 @@ class QubiPy_RPC:
             raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_PAGES)
         
         check_pages_format(page_1, page_size)
-        
+
+        return self._fetch_rich_list_page(page_1, page_size)
+
+    def _fetch_rich_list_page(self, page: int, page_size: int) -> Dict[str, Any]:
+        """
+        Fetches one page of the rich list without limiting the page number, for `iter_rich_list`.
+        """
+
         payload = {
-            'page': page_1,
+            'page': page,
             'pageSize': page_size
         }
 
         try:
-            response = requests.get(f'{self.rpc_url}{RICH_LIST}', params=payload, headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{RICH_LIST}', params=payload, headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data
@@ -708,10 +833,10 @@ class QubiPy_RPC:
         }
 
         try:
-            response = requests.get(f'{self.rpc_url}{ASSETS_ISSUANCE}', params=payload, headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{ASSETS_ISSUANCE}', params=payload, headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('assets', {})
+            return self._as_model(Asset_Issuance, data.get('assets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve assets issuances: {str(E)}") from None
         
@@ -748,10 +873,10 @@ class QubiPy_RPC:
         endpoint = ASSETS_ISSUANCE_INDEX.format(index = index)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('data', {})
+            return self._as_model(Asset_Issuance, data.get('data', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve assets issuances by index: {str(E)}") from None
         
@@ -802,10 +927,10 @@ class QubiPy_RPC:
         }
 
         try:
-            response = requests.get(f'{self.rpc_url}{ASSETS_OWNERSHIPS}', params=payload, headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{ASSETS_OWNERSHIPS}', params=payload, headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('assets', {})
+            return self._as_model(Asset_Ownership, data.get('assets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve the ownerships assets: {str(E)}") from None
         
@@ -841,10 +966,10 @@ class QubiPy_RPC:
         endpoint = ASSETS_OWNERSHIPS_INDEX.format(index = index)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('data', {})
+            return self._as_model(Asset_Ownership, data.get('data', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve assets ownerships by index: {str(E)}") from None
         
@@ -904,10 +1029,10 @@ class QubiPy_RPC:
         }
 
         try:
-            response = requests.get(f'{self.rpc_url}{ASSETS_POSSESSIONS}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{ASSETS_POSSESSIONS}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data.get('assets', {})
+            return self._as_model(Asset_Possession, data.get('assets', {}))
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve ownerships assets by index: {str(E)}") from None
         
@@ -944,10 +1069,10 @@ class QubiPy_RPC:
         endpoint = ASSETS_POSSESSIONS_INDEX.format(index = index)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
-            return data
+            return self._as_model(Asset_Possession, data)
         except requests.exceptions.RequestException as E:
             raise QubiPy_Exceptions(f"Failed to retrieve assets possessions by index: {str(E)}") from None
     
@@ -1001,9 +1126,386 @@ class QubiPy_RPC:
         endpoint = ASSETS_OWNERS.format(issuer_identity=issuer_identity, asset_name=asset_name)
 
         try:
-            response = requests.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, params=payload, timeout=self.timeout)
+            response = self.session.get(f'{self.rpc_url}{endpoint}', headers=HEADERS, params=payload, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return data
         except requests.exceptions.RequestException as E:
-            raise QubiPy_Exceptions(f"Failed to retrieve assets owners per asset: {str(E)}") from None
\ No newline at end of file
+            raise QubiPy_Exceptions(f"Failed to retrieve assets owners per asset: {str(E)}") from None
+
+
+    """ BULK OPERATIONS """
+
+    def fetch_tick_range(self, start_tick: int | None = None, end_tick: int | None = None, what: str | Sequence[str] = 'tick_data', max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Iterator[Tuple[int, Any]]:
+
+        """
+        Fetches the data of every tick in a range with bounded concurrency.
+
+        Ticks are requested in parallel over the pooled session, but results are yielded in tick order
+        as soon as each one (and every tick before it) has completed. A tick whose request fails is
+        retried on its own, without restarting the rest of the range.
+
+        Args:
+            start_tick (Optional[int]): The first tick of the range (inclusive).
+            end_tick (Optional[int]): The last tick of the range (inclusive).
+            what (str | Sequence[str]): 'tick_data' (see `get_tick_data`), 'approved_transactions'
+                (see `get_approved_transaction_for_tick`) or a sequence with both.
+            max_workers (int): Maximum number of requests in flight.
+            retries (int): Times a failed tick is retried before its error is raised.
+
+        Returns:
+            Iterator[Tuple[int, Any]]: An iterator of `(tick, result)` pairs in tick order. When `what` is a
+                sequence, `result` is a dictionary keyed by each requested item.
+
+        Raises:
+            QubiPy_Exceptions: If the tick range or `what` is invalid.
+            QubiPy_Exceptions: While iterating, if a tick still fails after all its retries. Every tick before it
+                has already been yielded, so the range can be resumed from the failing tick.
+        """
+
+        if not start_tick or not end_tick:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK)
+
+        check_ticks_format(start_tick, end_tick)
+
+        if start_tick > end_tick:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK)
+
+        fetchers = {
+            'tick_data': self.get_tick_data,
+            'approved_transactions': self.get_approved_transaction_for_tick
+        }
+
+        targets = (what,) if isinstance(what, str) else tuple(what)
+
+        if not targets or any(target not in fetchers for target in targets):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_FETCH_TARGET)
+
+        def fetch(tick: int) -> Any:
+            if isinstance(what, str):
+                return call_with_retries(fetchers[what], tick, retries=retries)
+            return {target: call_with_retries(fetchers[target], tick, retries=retries) for target in targets}
+
+        return ordered_map(fetch, range(start_tick, end_tick + 1), max_workers)
+
+    def iter_rich_list(self, cursor: Page_Cursor | None = None, page_size: int = PAGE_SIZE_MAX, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Iterator[Dict[str, Any]]:
+
+        """
+        Streams the whole rich list, entry by entry, in rank order.
+
+        The following pages are prefetched concurrently within a bounded window, so memory stays
+        constant however long the list is. Progress is kept in `cursor`: persist `cursor.to_dict()`
+        while consuming and pass `Page_Cursor.from_dict(...)` back to continue an interrupted export.
+
+        Args:
+            cursor (Optional[Page_Cursor]): Where to start, and the position updated while iterating.
+                                            Defaults to the first entry. Its page size takes precedence over `page_size`.
+            page_size (int): Entries per request, up to PAGE_SIZE_MAX.
+            max_workers (int): Maximum number of requests in flight.
+            retries (int): Times a failed page is retried before its error is raised.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of rich list entities (`identity` and `balance`).
+
+        Raises:
+            QubiPy_Exceptions: If the cursor or the page size is invalid.
+            QubiPy_Exceptions: While iterating, if a page still fails after all its retries, or if the cursor was
+                taken in another epoch (STALE_CURSOR). The cursor then points at the first entry not consumed yet.
+        """
+
+        if cursor is None:
+            cursor = Page_Cursor(page_size=page_size)
+
+        if not cursor.page or not cursor.page_size:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_PAGES)
+
+        check_pages_format(cursor.page, cursor.page_size, max_page=None)
+
+        def entries_of(data: Dict[str, Any]) -> list:
+            epoch = data.get('epoch')
+            if cursor.epoch is None:
+                cursor.epoch = epoch
+            elif epoch is not None and epoch != cursor.epoch:
+                raise QubiPy_Exceptions(QubiPy_Exceptions.STALE_CURSOR)
+            return (data.get('richList') or {}).get('entities') or []
+
+        return iter_pages(lambda page: self._fetch_rich_list_page(page, cursor.page_size), entries_of, cursor, max_workers, retries)
+
+    def iter_assets_owners(self, issuer_identity: str | None = None, asset_name: str | None = None, cursor: Page_Cursor | None = None, page_size: int = PAGE_SIZE_MAX, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Iterator[Dict[str, Any]]:
+
+        """
+        Streams every owner of an asset, page after page.
+
+        The page count is learned from the first response, then the remaining pages are fetched in
+        parallel (see `get_assets_owners_per_asset`) and owners are yielded lazily in page order, so
+        a widely held asset never has to fit in memory at once.
+
+        Args:
+            issuer_identity (Optional[str]): The identity of the asset's issuer.
+            asset_name (Optional[str]): The name of the asset.
+            cursor (Optional[Page_Cursor]): Where to start, and the position updated while iterating.
+                                            Defaults to the first owner. Its page size takes precedence over `page_size`.
+            page_size (int): Owners per request, up to PAGE_SIZE_MAX.
+            max_workers (int): Maximum number of requests in flight.
+            retries (int): Times a failed page is retried before its error is raised.
+
+        Returns:
+            Iterator[Dict[str, Any]]: An iterator of owners (`identity` and `numberOfUnits`).
+
+        Raises:
+            QubiPy_Exceptions: If the issuer, the asset name, the cursor or the page size is invalid.
+            QubiPy_Exceptions: While iterating, if a page still fails after all its retries. The cursor then
+                points at the first owner not consumed yet.
+        """
+
+        if not issuer_identity or not asset_name:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_IDENTITY_ASSET)
+
+        if cursor is None:
+            cursor = Page_Cursor(page_size=page_size)
+
+        if not cursor.page or not cursor.page_size:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_PAGES)
+
+        check_pages_format(cursor.page, cursor.page_size, max_page=None)
+
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_assets_owners_per_asset(issuer_identity, asset_name, page, cursor.page_size)
+
+        return iter_pages(fetch_page, lambda data: data.get('owners') or [], cursor, max_workers, retries)
+
+    def scan_transfer_transactions(self, identity: str | None = None, start_tick: int | None = None, end_tick: int | None = None, chunk_size: int = TRANSFER_SCAN_CHUNK, min_chunk_size: int = TRANSFER_SCAN_MIN_CHUNK, max_chunk_size: int = TRANSFER_SCAN_MAX_CHUNK, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Iterator[Any]:
+
+        """
+        Streams every transfer of an identity over a wide tick range.
+
+        The range is split into chunks fetched concurrently with `get_transfer_transactions_per_tick`.
+        Chunks grow while the server answers quickly; a chunk that times out or gets a 5xx answer is
+        split in two and the following chunks are made smaller. Any other error is raised at once. Transfers are yielded in
+        tick order, each transaction once.
+
+        Args:
+            identity (Optional[str]): The identity whose transfers are scanned.
+            start_tick (Optional[int]): The first tick of the range (inclusive).
+            end_tick (Optional[int]): The last tick of the range (inclusive).
+            chunk_size (int): Initial number of ticks per request.
+            min_chunk_size (int): Smallest chunk; a failing chunk of this size is retried instead of split.
+            max_chunk_size (int): Largest chunk.
+            max_workers (int): Maximum number of requests in flight.
+            retries (int): Times a failing chunk of the smallest size is retried before its error is raised.
+
+        Returns:
+            Iterator[Any]: An iterator of transactions (dictionaries, or Transaction models with `models=True`) in tick order.
+
+        Raises:
+            QubiPy_Exceptions: If the identity, the tick range or the chunk sizes are invalid.
+            QubiPy_Exceptions: While iterating, if a chunk of the smallest size still fails after all its retries.
+                Every transfer before it has already been yielded.
+        """
+
+        if not identity or is_wallet_id_invalid(identity):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ADDRESS_ID)
+
+        if not start_tick or not end_tick:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK)
+
+        check_ticks_format(start_tick, end_tick)
+
+        if start_tick > end_tick:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK)
+
+        chunks = Adaptive_Chunks(start_tick, end_tick, chunk_size, min_chunk_size, max_chunk_size)
+
+        def entries_of(data: Any) -> list:
+            if isinstance(data, dict):
+                return data.get('transferTransactionsPerTick') or []
+            return data or []
+
+        def fetch(chunk: Tuple[int, int]) -> list:
+            start, end = chunk
+            span = end - start + 1
+            began = time.monotonic()
+
+            try:
+                data = self.get_transfer_transactions_per_tick(identity, start, end)
+            except QubiPy_Exceptions as E:
+                if not is_overload(E):
+                    raise
+                if span <= chunks.min_size:
+                    return entries_of(call_with_retries(self.get_transfer_transactions_per_tick, identity, start, end, retries=retries))
+                chunks.record_failure(span)
+                middle = (start + end) // 2
+                return fetch((start, middle)) + fetch((middle + 1, end))
+
+            chunks.record_success(span, time.monotonic() - began)
+            return entries_of(data)
+
+        def transfers() -> Iterator[Any]:
+            current_tick, seen = None, set()
+
+            for _, entries in ordered_map(fetch, chunks, max_workers, window=max_workers):
+                for entry in sorted(entries, key=lambda entry: entry.tick_number if self.models else entry.get('tickNumber', 0)):
+                    tick = entry.tick_number if self.models else entry.get('tickNumber')
+                    if tick != current_tick:
+                        current_tick, seen = tick, set()
+
+                    for transaction in (entry.transactions if self.models else entry.get('transactions') or []):
+                        tx_id = transaction.tx_id if self.models else transaction.get('txId')
+                        if tx_id in seen:
+                            continue
+                        seen.add(tx_id)
+                        yield transaction
+
+        return transfers()
+
+    def get_balances(self, wallet_ids: Iterable[str] | None = None, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES) -> Tuple[Dict[str, Any], Dict[str, QubiPy_Exceptions]]:
+
+        """
+        Retrieves the balances of many wallets at once.
+
+        Every ID is validated up front; the valid ones are fetched with `get_balance` in parallel over
+        the pooled session. A wallet that fails (after its retries) is reported in the errors instead of
+        failing the whole batch.
+
+        Args:
+            wallet_ids (Optional[Iterable[str]]): The wallet IDs. Duplicates are fetched once.
+            max_workers (int): Maximum number of requests in flight.
+            retries (int): Times a failed wallet is retried before it is reported as an error.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, QubiPy_Exceptions]]: The balances keyed by wallet ID, in input order
+                (see `get_balance`), and the error of every wallet that is missing from them, including invalid IDs.
+
+        Raises:
+            QubiPy_Exceptions: If no wallet IDs are provided or `max_workers` is invalid.
+        """
+
+        if not wallet_ids or isinstance(wallet_ids, str):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ADDRESS_ID)
+
+        balances, errors = {}, {}
+        valid_ids = []
+
+        for wallet_id in dict.fromkeys(wallet_ids):
+            if not wallet_id or is_wallet_id_invalid(wallet_id):
+                errors[wallet_id] = QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ADDRESS_ID)
+            else:
+                valid_ids.append(wallet_id)
+
+        def fetch(wallet_id: str) -> Any:
+            try:
+                return call_with_retries(self.get_balance, wallet_id, retries=retries)
+            except QubiPy_Exceptions as E:
+                return E
+
+        for wallet_id, result in ordered_map(fetch, valid_ids, max_workers):
+            if isinstance(result, QubiPy_Exceptions):
+                errors[wallet_id] = result
+            else:
+                balances[wallet_id] = result
+
+        return balances, errors
+
+    def follow_ticks(self, start_tick: int | None = None, hydrate: str | Sequence[str] | None = None, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES, pacer: Tick_Pacer | None = None) -> Iterator[Any]:
+
+        """
+        Follows the chain: yields every tick processed by the RPC server exactly once and in order, forever.
+
+        The latest tick is polled at a pace adapted to the observed tick interval. Ticks that appeared
+        between two polls are back-filled, as are the ticks between `start_tick` and the latest one.
+        With `hydrate`, each tick comes with its data, fetched concurrently ahead of the consumer.
+
+        Args:
+            start_tick (Optional[int]): The first tick to yield. Defaults to the latest processed tick.
+            hydrate (str | Sequence[str] | None): 'tick_data', 'approved_transactions' or a sequence with both,
+                to yield `(tick, data)` pairs as `fetch_tick_range` does. Defaults to bare tick numbers.
+            max_workers (int): Maximum number of hydration requests in flight.
+            retries (int): Times a failed request is retried before its error is raised.
+            pacer (Optional[Tick_Pacer]): Controls the polling delays.
+
+        Returns:
+            Iterator[Any]: An endless iterator of ticks, or of `(tick, data)` pairs with `hydrate`.
+
+        Raises:
+            QubiPy_Exceptions: If `start_tick` or `hydrate` is invalid.
+            QubiPy_Exceptions: While iterating, if a request still fails after all its retries. Every tick before it
+                has already been yielded, so following can resume from the failing tick.
+        """
+
+        if start_tick is not None:
+            check_ticks_format(start_tick, start_tick)
+
+        check_hydrate(hydrate)
+
+        return follow_ticks(self, start_tick, hydrate, max_workers, retries, pacer)
+
+    def broadcast_many(self, txs: Iterable[bytes] | None = None, max_in_flight: int = BROADCAST_MAX_IN_FLIGHT) -> List[Broadcast_Result]:
+
+        """
+        Broadcasts many transactions, keeping up to `max_in_flight` of them in flight.
+
+        Transactions are grouped by target tick and sent soonest tick first. Before a group goes out
+        the current tick is read once: transactions whose target tick has already passed are flagged
+        as expired instead of being sent. Each transaction gets its own result, so a failure never
+        stops the rest of the run.
+
+        Args:
+            txs (Optional[Iterable[bytes]]): The built transactions.
+            max_in_flight (int): Maximum number of broadcasts in flight.
+
+        Returns:
+            List[Broadcast_Result]: One result per transaction, in input order, with the API response, the error,
+                or `expired=True`.
+
+        Raises:
+            QubiPy_Exceptions: If `txs` is not an iterable of transactions or `max_in_flight` is invalid.
+        """
+
+        if txs is None or isinstance(txs, (bytes, bytearray, str)):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TX_BYTES)
+
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_VALUE)
+
+        txs = list(txs)
+        results: List[Broadcast_Result | None] = [None] * len(txs)
+        groups: Dict[int, List[int]] = {}
+
+        for index, tx in enumerate(txs):
+            target_tick = get_tx_target_tick(tx)
+            if target_tick is None:
+                results[index] = Broadcast_Result(index, None, error=QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TX_BYTES))
+            else:
+                groups.setdefault(target_tick, []).append(index)
+
+        current_tick = None
+
+        def sendable() -> Iterator[int]:
+            nonlocal current_tick
+
+            for target_tick in sorted(groups):
+                try:
+                    current_tick = field_of(self.get_tick_info(), 'tick', 'tick')
+                except QubiPy_Exceptions:
+                    pass
+
+                if current_tick is not None and target_tick <= current_tick:
+                    for index in groups[target_tick]:
+                        results[index] = Broadcast_Result(index, target_tick, error=QubiPy_Exceptions(f"{QubiPy_Exceptions.TICK_NOT_COMPATIBLE}: {current_tick}"), expired=True)
+                    continue
+
+                yield from groups[target_tick]
+
+        def send(index: int) -> Any:
+            try:
+                return self.broadcast_transaction(txs[index])
+            except QubiPy_Exceptions as E:
+                return E
+
+        for index, result in ordered_map(send, sendable(), max_in_flight):
+            if isinstance(result, QubiPy_Exceptions):
+                results[index] = Broadcast_Result(index, get_tx_target_tick(txs[index]), error=result)
+            else:
+                results[index] = Broadcast_Result(index, get_tx_target_tick(txs[index]), response=result)
+
+        return results
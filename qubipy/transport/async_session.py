@@ -0,0 +1,439 @@
+"""
+async_session.py
+Pooled asyncio HTTP session used by AsyncQubiPy_RPC and AsyncQubiPy_Core.
+Requires the optional `aiohttp` dependency: pip install QubiPy[async]
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Any, List
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError("The asyncio clients require aiohttp, install it with: pip install QubiPy[async]") from None
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.json_backend import decode_json
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.transport.rate_limit import Rate_Limiter
+from qubipy.transport.balancer import Endpoint, Endpoint_Pool
+from qubipy.transport.hedging import Hedge_Policy
+from qubipy.transport.circuit import Circuit_Breaker
+from qubipy.transport.retry import Retry_Policy, is_idempotent
+
+# Errors that the async clients turn into QubiPy_Exceptions, mirroring requests.RequestException
+# in the blocking clients (invalid JSON bodies surface as json.JSONDecodeError).
+ASYNC_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError)
+
+# Errors raised before any response was received, which a retry policy may retry.
+ASYNC_RETRYABLE_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+ASYNC_HTTP_ERROR = aiohttp.ClientResponseError
+
+
+def answered(task: asyncio.Future) -> bool:
+    """
+    Whether a completed request got a response below 500.
+    """
+    return not task.cancelled() and task.exception() is None and task.result().status_code < 500
+
+
+class QubiPy_AsyncResponse:
+    __slots__ = ('status_code', 'reason', 'headers', 'url', 'content', '_request_info', '_history')
+
+    def __init__(self, response: 'aiohttp.ClientResponse', content: bytes):
+        """
+        Holds a fully read aiohttp response so it can be inspected after the connection
+        has been released back to the pool.
+
+        Args:
+            response (aiohttp.ClientResponse): The response whose metadata is kept.
+            content (bytes): The raw response body.
+        """
+        self.status_code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.content = content
+        self._request_info = response.request_info
+        self._history = response.history
+
+    def raise_for_status(self):
+        """
+        Raises:
+            aiohttp.ClientResponseError: If the response has a 4xx or 5xx status code.
+        """
+        if self.status_code >= 400:
+            raise aiohttp.ClientResponseError(
+                self._request_info,
+                self._history,
+                status=self.status_code,
+                message=self.reason or '',
+                headers=self.headers
+            )
+
+    def json(self) -> Any:
+        """
+        Decodes the response body with the pluggable JSON decoder, straight from the raw bytes.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        try:
+            return decode_json(self.content)
+        except json.JSONDecodeError:
+            raise
+        except ValueError as E:
+            raise json.JSONDecodeError(getattr(E, 'msg', str(E)), getattr(E, 'doc', ''), getattr(E, 'pos', 0)) from None
+
+
+class QubiPy_AsyncSession:
+    def __init__(self, pool_limit: int = ASYNC_POOL_LIMIT, pool_maxsize: int = ASYNC_POOL_LIMIT, keep_alive: float | None = KEEP_ALIVE, rate_limiter: Rate_Limiter | None = None, hedge: Hedge_Policy | None = None, circuit_breaker: Circuit_Breaker | None = None, response_cache: TTL_Cache | None = None, retry: Retry_Policy | None = None):
+        """
+        Initializes an asyncio session backed by a shared keep-alive connection pool.
+        The underlying aiohttp session is created lazily inside the running event loop.
+
+        Args:
+            pool_limit (int): Maximum number of simultaneous connections across all hosts.
+            pool_maxsize (int): Maximum number of simultaneous connections per host.
+            keep_alive (float | None): Seconds an idle connection is kept open. None keeps it until the server closes it.
+            rate_limiter (Rate_Limiter | None): Optional token-bucket limiter applied per base URL to every request.
+            hedge (Hedge_Policy | None): Optional hedging of idempotent reads. When the first request is slower than
+                                         the policy's latency percentile, a duplicate is sent to the next node of
+                                         the endpoint pool, the first answer is returned and the other is cancelled.
+            circuit_breaker (Circuit_Breaker | None): Optional circuit breakers per base URL and endpoint group.
+                                                      Requests to an open circuit raise QubiPy_Circuit_Open at once.
+            response_cache (TTL_Cache | None): Optional per-endpoint cache for GET requests, which can be shared with a
+                                               blocking session. Concurrent identical requests are coalesced into one.
+            retry (Retry_Policy | None): Optional retry policy. Connection errors, timeouts and retryable status codes
+                                         are retried with backoff. Broadcasts are only retried when the request
+                                         provably never reached the server.
+
+        Raises:
+            QubiPy_Exceptions: If `pool_limit` or `pool_maxsize` is not a positive integer.
+        """
+
+        if not isinstance(pool_limit, int) or not isinstance(pool_maxsize, int) or pool_limit < 1 or pool_maxsize < 1:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_POOL_CONFIG)
+
+        self.pool_limit = pool_limit
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.retry = retry
+        self.endpoint_pools: List[Endpoint_Pool] = []
+        self._session = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Returns the aiohttp session, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_limit, limit_per_host=self.pool_maxsize, keepalive_timeout=self.keep_alive)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        """
+        Sends a request through the pooled connections, serving it from the response cache when enabled.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+            **kwargs: The request options accepted by `_transmit`.
+
+        Returns:
+            QubiPy_AsyncResponse: The fully read response.
+        """
+
+        ttl = self.response_cache.ttl_for(url) if self.response_cache is not None and method.upper() == 'GET' else None
+
+        if ttl is None:
+            return await self._send(method, url, **kwargs)
+
+        params = kwargs.get('params') or {}
+        key = (url, tuple(sorted(params.items())) if isinstance(params, dict) else params)
+
+        return await self.response_cache.get_or_fetch_async(
+            key,
+            ttl,
+            lambda: self._send(method, url, **kwargs),
+            cacheable=lambda response: response.status_code < 400
+        )
+
+    async def _send(self, method: str, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        """
+        Sends a request, retrying it according to the retry policy.
+
+        Returns:
+            QubiPy_AsyncResponse: The last response returned by the server.
+
+        Raises:
+            aiohttp.ClientError | asyncio.TimeoutError: The error of the last attempt.
+        """
+
+        policy = self.retry.for_url(url) if self.retry is not None else None
+
+        if policy is None:
+            return await self._send_once(method, url, **kwargs)
+
+        idempotent = is_idempotent(method, url)
+        policy.budget.record_request()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                response = await self._send_once(method, url, **kwargs)
+            except ASYNC_RETRYABLE_ERRORS as E:
+                if not policy.should_retry_failure(attempt, idempotent, isinstance(E, aiohttp.ClientConnectorError)):
+                    raise
+                delay = policy.backoff(attempt)
+                if delay is None or not policy.budget.try_acquire():
+                    raise
+            else:
+                if not policy.should_retry_response(response, attempt, idempotent):
+                    return response
+                delay = policy.backoff(attempt, response)
+                if delay is None or not policy.budget.try_acquire():
+                    return response
+
+            await asyncio.sleep(delay)
+
+    async def _send_once(self, method: str, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        """
+        Sends a request to the best node of its endpoint pool, failing over to the next nodes on
+        connection errors and 5xx responses. Requests that are not idempotent only fail over when
+        the connection to the failing node could not be established. Hedged reads go to the two best
+        nodes when at least two are healthy, and fail over to the remaining nodes if both fail.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+            **kwargs: The request options accepted by `_transmit`.
+
+        Returns:
+            QubiPy_AsyncResponse: The fully read response.
+        """
+
+        pool = self._pool_for(url)
+
+        if pool is None:
+            return await self._transmit(method, url, **kwargs)
+
+        idempotent = is_idempotent(method, url)
+        candidates = pool.ranked()
+
+        if self.hedge is not None and self.hedge.applies(method, url):
+            targets = pool.healthy()[:2]
+
+            if len(targets) == 2:
+                outcome = await self._request_hedged(pool, targets, method, url, **kwargs)
+                candidates = [endpoint for endpoint in candidates if endpoint not in targets]
+
+                if answered(outcome) or not candidates:
+                    return outcome.result()
+
+        for index, endpoint in enumerate(candidates):
+            is_last = index == len(candidates) - 1
+
+            try:
+                response = await self._send_to(pool, endpoint, method, url, **kwargs)
+            except QubiPy_Circuit_Open:
+                if is_last:
+                    raise
+                continue
+            except ASYNC_REQUEST_ERRORS as E:
+                if is_last or not (idempotent or isinstance(E, aiohttp.ClientConnectorError)):
+                    raise
+                continue
+
+            if response.status_code < 500 or is_last or not idempotent:
+                return response
+
+    async def _send_to(self, pool: Endpoint_Pool | None, endpoint: Endpoint | None, method: str, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        """
+        Sends a request to one node of a pool, recording its latency and outcome.
+        Without a pool the request is sent to `url` as it is.
+        """
+
+        if pool is None:
+            return await self._transmit(method, url, **kwargs)
+
+        started = pool.start(endpoint)
+
+        try:
+            response = await self._transmit(method, pool.rewrite(url, endpoint), **kwargs)
+        except BaseException:
+            pool.finish(endpoint, started, ok=False)
+            raise
+
+        pool.finish(endpoint, started, response.status_code < 500)
+        return response
+
+    async def _request_hedged(self, pool: Endpoint_Pool, targets: List[Endpoint], method: str, url: str, **kwargs) -> asyncio.Task:
+        """
+        Sends a read to the best node and, if it has not answered within the hedge delay (or failed),
+        a duplicate to the second best node. The first successful answer wins and the other request
+        is cancelled.
+
+        Args:
+            pool (Endpoint_Pool): The pool of the URL.
+            targets (List[Endpoint]): Two healthy nodes, best first.
+
+        Returns:
+            asyncio.Task: The completed request of the winner, or of the hedge if both failed.
+        """
+
+        started = time.monotonic()
+
+        def record_latency(task: asyncio.Task):
+            if answered(task):
+                self.hedge.record_latency(time.monotonic() - started)
+
+        primary = asyncio.ensure_future(self._send_to(pool, targets[0], method, url, **kwargs))
+        primary.add_done_callback(record_latency)
+
+        await asyncio.wait([primary], timeout=self.hedge.delay())
+
+        if primary.done() and answered(primary):
+            self.hedge.record_request(fired=False, won=False)
+            return primary
+
+        hedge = asyncio.ensure_future(self._send_to(pool, targets[1], method, url, **kwargs))
+        pending = {primary, hedge}
+        winner = None
+
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in (primary, hedge) if task in done and answered(task)), None)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        winner = winner or hedge
+        self.hedge.record_request(fired=True, won=winner is hedge and answered(hedge))
+
+        return winner
+
+    def add_endpoint_pool(self, pool: Endpoint_Pool):
+        """
+        Balances every request whose URL starts with the pool's primary URL across its nodes.
+
+        Args:
+            pool (Endpoint_Pool): The nodes serving the same API.
+        """
+        self.endpoint_pools = [existing for existing in self.endpoint_pools if existing.primary != pool.primary] + [pool]
+
+    def _pool_for(self, url: str) -> Endpoint_Pool | None:
+        for pool in self.endpoint_pools:
+            if pool.matches(url):
+                return pool
+        return None
+
+    async def check_endpoints(self):
+        """
+        Probes the health endpoint of every balanced node concurrently, refreshing its latency and
+        taking the nodes that fail out of rotation.
+        """
+
+        async def probe(pool: Endpoint_Pool, endpoint):
+            started = time.monotonic()
+            try:
+                response = await self._transmit('GET', f'{endpoint.url}{pool.health_endpoint}', headers=HEADERS, timeout=TIMEOUT)
+                ok = response.status_code < 400
+            except ASYNC_REQUEST_ERRORS:
+                ok = False
+
+            if ok:
+                pool.record(endpoint, time.monotonic() - started, True)
+            else:
+                pool.mark_down(endpoint)
+
+        await asyncio.gather(*(
+            probe(pool, endpoint)
+            for pool in self.endpoint_pools if pool.health_endpoint is not None
+            for endpoint in pool.endpoints
+        ))
+
+    async def _transmit(self, method: str, url: str, headers: Dict[str, str] | None = None, params: Dict[str, Any] | None = None, json: Any = None, data: Any = None, timeout: float | None = None) -> QubiPy_AsyncResponse:
+        """
+        Sends a request through the pooled connections and reads the whole body.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+            headers (Dict[str, str] | None): Request headers.
+            params (Dict[str, Any] | None): Query parameters. Entries set to None are dropped, as requests does.
+            json (Any): A JSON-serializable request body.
+            data (Any): A raw request body.
+            timeout (float | None): Total timeout in seconds for the request.
+
+        Returns:
+            QubiPy_AsyncResponse: The fully read response.
+
+        Raises:
+            QubiPy_Circuit_Open: If the circuit of the URL is open. Nothing is sent.
+        """
+
+        kwargs = {'headers': headers, 'json': json, 'data': data}
+
+        if params:
+            kwargs['params'] = {key: value for key, value in params.items() if value is not None}
+
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        circuit = self.circuit_breaker.acquire(url) if self.circuit_breaker is not None else None
+
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+
+            async with self._get_session().request(method, url, **kwargs) as response:
+                content = await response.read()
+                result = QubiPy_AsyncResponse(response, content)
+        except ASYNC_REQUEST_ERRORS:
+            if circuit is not None:
+                circuit.record_failure()
+            raise
+        except BaseException:
+            if circuit is not None:
+                circuit.release()
+            raise
+
+        if circuit is not None:
+            if result.status_code < 500:
+                circuit.record_success()
+            else:
+                circuit.record_failure()
+
+        return result
+
+    async def get(self, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> QubiPy_AsyncResponse:
+        return await self.request('POST', url, **kwargs)
+
+    async def close(self):
+        """
+        Closes every pooled connection.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'QubiPy_AsyncSession':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
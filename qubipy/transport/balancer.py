@@ -0,0 +1,152 @@
+"""
+balancer.py
+Failover and latency-aware load balancing across several nodes serving the same API.
+Each request goes to the healthy node with the lowest expected latency, and nodes that
+keep failing are taken out of rotation until their cooldown expires.
+"""
+
+import threading
+import time
+from typing import List, Sequence
+
+from qubipy.config import *
+from qubipy.exceptions import *
+
+
+class Endpoint:
+    __slots__ = ('url', 'latency', 'in_flight', 'failures', 'down_until')
+
+    def __init__(self, url: str):
+        """
+        Health and latency statistics of a single node.
+
+        Args:
+            url (str): The node's base URL, for example 'https://rpc.qubic.org/v1'.
+        """
+        self.url = url
+        self.latency: float | None = None
+        self.in_flight = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+    def is_up(self, now: float) -> bool:
+        return self.down_until <= now
+
+    def score(self) -> float:
+        """
+        Expected latency of the next request: the moving average scaled by the requests already
+        queued on the node. Nodes never measured score 0 so they are tried early.
+        """
+        return (self.latency or 0.0) * (self.in_flight + 1)
+
+
+class Endpoint_Pool:
+    def __init__(self, urls: Sequence[str], health_endpoint: str | None = None, decay: float = ENDPOINT_LATENCY_DECAY, failure_threshold: int = ENDPOINT_FAILURE_THRESHOLD, cooldown: float = ENDPOINT_COOLDOWN):
+        """
+        Initializes a pool of interchangeable nodes.
+
+        Args:
+            urls (Sequence[str]): Base URLs of the nodes. The first one is the primary URL the clients build requests with.
+            health_endpoint (str | None): Endpoint probed by `check_endpoints()`, for example HEALTH_CHECK.
+            decay (float): Weight of the newest sample in the moving average latency.
+            failure_threshold (int): Consecutive failures after which a node is taken out of rotation.
+            cooldown (float): Seconds a failing node stays out of rotation.
+
+        Raises:
+            QubiPy_Exceptions: If `urls` is empty or is not a sequence of strings.
+        """
+        if isinstance(urls, str) or not urls or not all(isinstance(url, str) and url for url in urls):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ENDPOINTS)
+
+        self.endpoints = [Endpoint(url.rstrip('/')) for url in urls]
+        self.health_endpoint = health_endpoint
+        self.decay = decay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> str:
+        """
+        The base URL the clients build requests with. Requests starting with it are balanced.
+        """
+        return self.endpoints[0].url
+
+    def matches(self, url: str) -> bool:
+        return url.startswith(self.primary)
+
+    def rewrite(self, url: str, endpoint: Endpoint) -> str:
+        """
+        Points a request built with the primary URL at another node.
+        """
+        return endpoint.url + url[len(self.primary):]
+
+    def healthy(self) -> List[Endpoint]:
+        """
+        Returns the nodes in rotation, best first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sorted((endpoint for endpoint in self.endpoints if endpoint.is_up(now)), key=Endpoint.score)
+
+    def ranked(self) -> List[Endpoint]:
+        """
+        Orders the nodes to try for a request: healthy nodes by score, then the nodes out of
+        rotation, soonest back first, so a request is still attempted when every node is failing.
+
+        Returns:
+            List[Endpoint]: Every node of the pool, best first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            up = sorted((endpoint for endpoint in self.endpoints if endpoint.is_up(now)), key=Endpoint.score)
+            down = sorted((endpoint for endpoint in self.endpoints if not endpoint.is_up(now)), key=lambda endpoint: endpoint.down_until)
+        return up + down
+
+    def start(self, endpoint: Endpoint) -> float:
+        """
+        Records a request sent to `endpoint`.
+
+        Returns:
+            float: The start time to pass to `finish`.
+        """
+        with self._lock:
+            endpoint.in_flight += 1
+        return time.monotonic()
+
+    def finish(self, endpoint: Endpoint, started: float, ok: bool):
+        """
+        Records the outcome of a request started with `start`.
+
+        Args:
+            endpoint (Endpoint): The node the request was sent to.
+            started (float): The value returned by `start`.
+            ok (bool): False for connection errors, timeouts and 5xx responses.
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+        self.record(endpoint, time.monotonic() - started, ok)
+
+    def record(self, endpoint: Endpoint, latency: float, ok: bool):
+        """
+        Updates a node's moving average latency and health with one observation.
+        """
+        with self._lock:
+            endpoint.latency = latency if endpoint.latency is None else self.decay * latency + (1 - self.decay) * endpoint.latency
+
+            if ok:
+                endpoint.failures = 0
+                endpoint.down_until = 0.0
+                return
+
+            endpoint.failures += 1
+            if endpoint.failures >= self.failure_threshold:
+                endpoint.down_until = time.monotonic() + self.cooldown
+
+    def mark_down(self, endpoint: Endpoint):
+        """
+        Takes a node out of rotation for `cooldown` seconds, for example after a failed health check.
+        """
+        with self._lock:
+            endpoint.failures = max(endpoint.failures, self.failure_threshold)
+            endpoint.down_until = time.monotonic() + self.cooldown
@@ -0,0 +1,166 @@
+"""
+circuit.py
+Circuit breakers per base URL and endpoint group. After repeated failures a circuit opens
+and requests fail fast with QubiPy_Circuit_Open instead of waiting for the full timeout,
+until a trial request shows the endpoint has recovered.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.utils import endpoint_matches
+from qubipy.transport.rate_limit import base_url
+
+CIRCUIT_CLOSED = 'closed'
+
+CIRCUIT_OPEN = 'open'
+
+CIRCUIT_HALF_OPEN = 'half_open'
+
+# Group of the endpoints not listed in any group of a Circuit_Breaker.
+DEFAULT_GROUP = 'default'
+
+
+class Circuit:
+    def __init__(self, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int):
+        """
+        State machine of a single circuit: closed, open after `failure_threshold` consecutive
+        failures, then half-open after `recovery_timeout` seconds, letting `half_open_max_calls`
+        trial requests through. A successful trial closes the circuit, a failed one reopens it.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        """
+        One of CIRCUIT_CLOSED, CIRCUIT_OPEN and CIRCUIT_HALF_OPEN.
+        """
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    def _refresh(self, now: float):
+        if self._state == CIRCUIT_OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = CIRCUIT_HALF_OPEN
+            self._trials = 0
+
+    def try_acquire(self) -> float | None:
+        """
+        Asks whether a request may be sent.
+
+        Returns:
+            float | None: None if the request may be sent, otherwise the seconds left before the next trial.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._refresh(now)
+
+            if self._state == CIRCUIT_CLOSED:
+                return None
+
+            if self._state == CIRCUIT_HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return None
+
+            return max(0.0, self._opened_at + self.recovery_timeout - now)
+
+    def record_success(self):
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._trials = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == CIRCUIT_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self._trials = 0
+
+    def release(self):
+        """
+        Frees the trial slot of a request that was abandoned (for example a cancelled hedge) without an outcome.
+        """
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN and self._trials:
+                self._trials -= 1
+
+
+class Circuit_Breaker:
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT, half_open_max_calls: int = CIRCUIT_HALF_OPEN_MAX_CALLS, groups: Dict[str, Iterable[str]] | None = None):
+        """
+        Keeps one circuit per base URL and endpoint group.
+
+        Args:
+            failure_threshold (int): Consecutive failures (connection errors, timeouts and 5xx responses) that open a circuit.
+            recovery_timeout (float): Seconds an open circuit fails fast before letting a trial request through.
+            half_open_max_calls (int): Trial requests allowed at once while a circuit is half-open.
+            groups (Dict[str, Iterable[str]] | None): Endpoint paths grouped under a name, for example
+                `{'ticks': [TICK_DATA, QUORUM_TICK_DATA]}`. Endpoints not listed share the DEFAULT_GROUP
+                circuit of their base URL.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.groups = {name: tuple(endpoints) for name, endpoints in (groups or {}).items()}
+
+        self._lock = threading.Lock()
+        self._circuits: Dict[Tuple[str, str], Circuit] = {}
+
+    def group_for(self, url: str) -> str:
+        for name, endpoints in self.groups.items():
+            if any(endpoint_matches(url, endpoint) for endpoint in endpoints):
+                return name
+        return DEFAULT_GROUP
+
+    def circuit_for(self, url: str) -> Tuple[Circuit, str]:
+        """
+        Returns the circuit a request URL belongs to, creating it on first use.
+
+        Returns:
+            Tuple[Circuit, str]: The circuit and the name of its endpoint group.
+        """
+        group = self.group_for(url)
+        key = (base_url(url), group)
+
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = Circuit(self.failure_threshold, self.recovery_timeout, self.half_open_max_calls)
+            return circuit, group
+
+    def acquire(self, url: str) -> Circuit:
+        """
+        Lets a request through its circuit.
+
+        Returns:
+            Circuit: The circuit, on which the outcome must be recorded.
+
+        Raises:
+            QubiPy_Circuit_Open: If the circuit is open.
+        """
+        circuit, group = self.circuit_for(url)
+        retry_in = circuit.try_acquire()
+
+        if retry_in is not None:
+            raise QubiPy_Circuit_Open(base_url(url), group, retry_in)
+
+        return circuit
+
+    def state(self, url: str) -> str:
+        """
+        Returns the state of the circuit a request URL belongs to.
+        """
+        return self.circuit_for(url)[0].state
@@ -0,0 +1,90 @@
+"""
+hedging.py
+Hedged requests for idempotent reads: when the first request is slower than a recent latency
+percentile, a duplicate is sent to another endpoint and the first answer wins.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Iterable
+
+from qubipy.config import *
+from qubipy.utils import endpoint_matches
+from qubipy.endpoints_rpc import WALLET_BALANCE, TICK_DATA, TRANSACTION
+
+# Reads hedged by default: `get_balance`, `get_tick_data` and `get_transaction`.
+HEDGED_ENDPOINTS = (WALLET_BALANCE, TICK_DATA, TRANSACTION)
+
+
+class Hedge_Policy:
+    def __init__(self, percentile: float = HEDGE_PERCENTILE, initial_delay: float = HEDGE_INITIAL_DELAY, min_delay: float = HEDGE_MIN_DELAY, window: int = HEDGE_WINDOW, min_samples: int = HEDGE_MIN_SAMPLES, endpoints: Iterable[str] = HEDGED_ENDPOINTS):
+        """
+        Describes which requests are hedged and when, and counts how hedges perform.
+
+        Args:
+            percentile (float): Latency percentile (0-100) of recent requests after which the duplicate is sent.
+            initial_delay (float): Delay in seconds used until `min_samples` latencies have been measured.
+            min_delay (float): Lower bound of the delay in seconds.
+            window (int): Number of recent latencies kept.
+            min_samples (int): Latencies required before the percentile is used.
+            endpoints (Iterable[str]): Endpoint paths that are hedged. Only GET requests are ever hedged.
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.endpoints = tuple(endpoints)
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._requests = 0
+        self._fired = 0
+        self._won = 0
+
+    def applies(self, method: str, url: str) -> bool:
+        """
+        Whether a request is hedged.
+        """
+        return method.upper() == 'GET' and any(endpoint_matches(url, endpoint) for endpoint in self.endpoints)
+
+    def delay(self) -> float:
+        """
+        Returns:
+            float: Seconds to wait for the first request before sending the duplicate.
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            ordered = sorted(self._latencies)
+
+        index = min(len(ordered) - 1, max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1))
+        return max(self.min_delay, ordered[index])
+
+    def record_latency(self, latency: float):
+        """
+        Adds the latency of a successful request to the window the delay is computed from.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def record_request(self, fired: bool, won: bool):
+        """
+        Counts a hedged request.
+
+        Args:
+            fired (bool): Whether the duplicate request was sent.
+            won (bool): Whether the duplicate answered first.
+        """
+        with self._lock:
+            self._requests += 1
+            self._fired += fired
+            self._won += won
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters since the policy was created: hedgeable `requests`, hedges `fired` and hedges `won`.
+        """
+        with self._lock:
+            return {'requests': self._requests, 'fired': self._fired, 'won': self._won}
@@ -0,0 +1,137 @@
+"""
+rate_limit.py
+Client-side token-bucket rate limiting per base URL (for example RPC_URL, CORE_URL and MONERO_URL),
+shared by the blocking and asyncio sessions so bulk jobs stay just under the public API limits.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+from qubipy.config import *
+from qubipy.exceptions import *
+
+
+def _check_limit(rate: float, burst: int):
+    if not isinstance(rate, (int, float)) or not isinstance(burst, int) or rate <= 0 or burst < 1:
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_RATE_LIMIT)
+
+
+def base_url(url: str) -> str:
+    """
+    Returns the scheme and host of a URL, for example 'https://rpc.qubic.org'.
+    """
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+class Token_Bucket:
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Tokens added per second, that is the sustained requests per second.
+            burst (int): Capacity of the bucket, that is the requests allowed at once after an idle period.
+
+        Raises:
+            QubiPy_Exceptions: If `rate` or `burst` is not positive.
+        """
+        _check_limit(rate, burst)
+
+        self.rate = rate
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """
+        Takes a token, borrowing it from the future when the bucket is empty. Callers are served
+        in the order they reserve, whether they wait in a thread or in the event loop.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Blocks the calling thread until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """
+        Suspends the calling coroutine until a request may be sent.
+        """
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class Rate_Limiter:
+    def __init__(self, rate: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST, limits: Dict[str, Tuple[float, int]] | None = None):
+        """
+        Initializes a limiter keeping one token bucket per base URL. Sharing one limiter between
+        several clients (or a blocking and an async client) makes them share the same budget.
+
+        Args:
+            rate (float): Default requests per second for each base URL.
+            burst (int): Default burst size for each base URL.
+            limits (Dict[str, Tuple[float, int]] | None): `(rate, burst)` overrides keyed by base URL,
+                for example `{MONERO_URL: (1, 2)}`.
+
+        Raises:
+            QubiPy_Exceptions: If a rate or a burst is not positive.
+        """
+        _check_limit(rate, burst)
+        for limit in (limits or {}).values():
+            _check_limit(*limit)
+
+        self.rate = rate
+        self.burst = burst
+        self.limits = {base_url(url): limit for url, limit in (limits or {}).items()}
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Token_Bucket] = {}
+
+    def bucket_for(self, url: str) -> Token_Bucket:
+        """
+        Returns the bucket of the base URL a request is sent to, creating it on first use.
+
+        Args:
+            url (str): The full request URL.
+
+        Returns:
+            Token_Bucket: The bucket shared by every request to that base URL.
+        """
+        key = base_url(url)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = Token_Bucket(*self.limits.get(key, (self.rate, self.burst)))
+            return bucket
+
+    def acquire(self, url: str):
+        """
+        Blocks the calling thread until a request to `url` may be sent.
+        """
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str):
+        """
+        Suspends the calling coroutine until a request to `url` may be sent.
+        """
+        await self.bucket_for(url).acquire_async()
@@ -0,0 +1,212 @@
+"""
+retry.py
+Retry policies used by QubiPy_Session and QubiPy_AsyncSession: exponential backoff with full jitter, Retry-After
+support, per-endpoint overrides and a shared retry budget that stops retry storms.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from qubipy.config import *
+from qubipy.utils import endpoint_matches
+from qubipy.endpoints_rpc import BROADCAST_TRANSACTION
+
+# Endpoints whose requests change state on the network. They are only retried when the
+# request provably never reached the server (connection failures, 429 Too Many Requests).
+NON_IDEMPOTENT_ENDPOINTS = (BROADCAST_TRANSACTION,)
+
+
+def is_idempotent(method: str, url: str) -> bool:
+    """
+    GET requests are always idempotent. The POST endpoints of the Qubic APIs are read-only
+    queries, except those listed in NON_IDEMPOTENT_ENDPOINTS.
+    """
+    if method.upper() in ('GET', 'HEAD', 'OPTIONS'):
+        return True
+    return not any(endpoint_matches(url, endpoint) for endpoint in NON_IDEMPOTENT_ENDPOINTS)
+
+
+def never_sent(error: requests.RequestException) -> bool:
+    """
+    True when the connection could not be established, so the server never saw the request.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+class Retry_Budget:
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND, window: float = RETRY_BUDGET_WINDOW):
+        """
+        Limits retries to a fraction of the recent request volume. When an upstream is down,
+        every request fails and would otherwise be multiplied by the number of attempts.
+
+        Args:
+            ratio (float): Retries allowed per request sent during the window.
+            min_per_second (float): Retries always allowed per second, so low-traffic clients can still retry.
+            window (float): Seconds over which requests and retries are counted.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._requests = deque()
+        self._retries = deque()
+
+    def _prune(self, now: float):
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def record_request(self):
+        """
+        Records a first attempt, which earns `ratio` retries.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """
+        Takes one retry from the budget.
+
+        Returns:
+            bool: True if the retry may be sent, False if the budget is exhausted.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            allowed = max(self.min_per_second * self.window, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class Retry_Policy:
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, backoff_factor: float = RETRY_BACKOFF_FACTOR, backoff_max: float = RETRY_BACKOFF_MAX, jitter: bool = True, status_forcelist: Iterable[int] = RETRY_STATUS_CODES, respect_retry_after: bool = True, budget: Retry_Budget | None = None, endpoints: Dict[str, 'Retry_Policy | None'] | None = None):
+        """
+        Describes how failed requests are retried.
+
+        Args:
+            max_attempts (int): Total attempts, first try included.
+            backoff_factor (float): Base delay in seconds, doubled after each attempt.
+            backoff_max (float): Upper bound for a single delay. A Retry-After longer than this stops retrying.
+            jitter (bool): Use "full jitter" (a random delay between 0 and the backoff) to spread retries out.
+            status_forcelist (Iterable[int]): HTTP status codes that are retried.
+            respect_retry_after (bool): Wait at least the delay requested by a Retry-After header.
+            budget (Retry_Budget | None): Budget shared by every request using this policy.
+            endpoints (Dict[str, Retry_Policy | None] | None): Per-endpoint overrides keyed by endpoint path
+                (for example `{WALLET_BALANCE: Retry_Policy(max_attempts=5)}`). None disables retries for that
+                endpoint. Overrides without their own budget share this one.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget if budget is not None else Retry_Budget()
+        self._own_budget = budget is not None
+        self.endpoints = dict(endpoints or {})
+
+        for policy in self.endpoints.values():
+            if policy is not None and not policy._own_budget:
+                policy.budget = self.budget
+
+    def for_url(self, url: str) -> 'Retry_Policy | None':
+        """
+        Returns the policy that applies to a request URL.
+
+        Args:
+            url (str): The full request URL.
+
+        Returns:
+            Retry_Policy | None: The matching override, this policy, or None if retries are disabled for the endpoint.
+        """
+        for endpoint, policy in self.endpoints.items():
+            if endpoint_matches(url, endpoint):
+                return policy
+        return self
+
+    def _retry_after(self, response: requests.Response | None) -> float | None:
+        if response is None or not self.respect_retry_after:
+            return None
+
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt: int, response: requests.Response | None = None) -> float | None:
+        """
+        Computes the delay before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts already made (1 after the first failure).
+            response (requests.Response | None): The failed response, if any.
+
+        Returns:
+            float | None: Seconds to wait, or None if the server asked for a longer wait than `backoff_max`.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** (attempt - 1)))
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = self._retry_after(response)
+
+        if retry_after is not None:
+            if retry_after > self.backoff_max:
+                return None
+            delay = max(delay, retry_after)
+
+        return delay
+
+    def should_retry_error(self, error: requests.RequestException, attempt: int, idempotent: bool) -> bool:
+        """
+        Decides whether a request that raised `error` on attempt number `attempt` is retried.
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return False
+
+        return self.should_retry_failure(attempt, idempotent, never_sent(error))
+
+    def should_retry_failure(self, attempt: int, idempotent: bool, never_sent: bool) -> bool:
+        """
+        Decides whether a request that got no response (connection error or timeout) on attempt number
+        `attempt` is retried. The asyncio session classifies its aiohttp errors and calls this directly.
+        """
+        return attempt < self.max_attempts and (idempotent or never_sent)
+
+    def should_retry_response(self, response: requests.Response, attempt: int, idempotent: bool) -> bool:
+        """
+        Decides whether a response received on attempt number `attempt` is retried.
+        A 429 means the request was rejected before being processed, so it is safe for any endpoint.
+        """
+        if attempt >= self.max_attempts or response.status_code not in self.status_forcelist:
+            return False
+
+        return idempotent or response.status_code == 429
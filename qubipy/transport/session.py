@@ -0,0 +1,406 @@
+"""
+session.py
+Pooled keep-alive HTTP session used by the QubiPy clients.
+A single session can be shared between QubiPy_RPC and QubiPy_Core so that
+every call reuses warm TCP/TLS connections instead of opening new ones.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.json_backend import decode_json
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.transport.retry import Retry_Policy, is_idempotent, never_sent
+from qubipy.transport.rate_limit import Rate_Limiter
+from qubipy.transport.balancer import Endpoint, Endpoint_Pool
+from qubipy.transport.hedging import Hedge_Policy
+from qubipy.transport.circuit import Circuit_Breaker
+
+
+def answered(future: Future) -> bool:
+    """
+    Whether a completed request got a response below 500.
+    """
+    return future.exception() is None and future.result().status_code < 500
+
+
+class QubiPy_Response(requests.Response):
+    def json(self, **kwargs) -> Any:
+        """
+        Decodes the body with the pluggable JSON decoder (orjson when installed), straight from
+        the raw bytes without building an intermediate text string.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON, as `requests.Response.json` does.
+        """
+        if kwargs:
+            return super().json(**kwargs)
+
+        try:
+            return decode_json(self.content)
+        except ValueError as E:
+            raise requests.exceptions.JSONDecodeError(getattr(E, 'msg', str(E)), getattr(E, 'doc', ''), getattr(E, 'pos', 0)) from None
+
+
+class QubiPy_Session(requests.Session):
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE, keep_alive: float | None = KEEP_ALIVE, pool_block: bool = False, response_cache: TTL_Cache | None = None, retry: Retry_Policy | None = None, rate_limiter: Rate_Limiter | None = None, hedge: Hedge_Policy | None = None, circuit_breaker: Circuit_Breaker | None = None):
+        """
+        Initializes a thread-safe session backed by a keep-alive connection pool.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of connections kept open per host.
+            keep_alive (float | None): Seconds the session may sit idle before its pooled connections
+                                       are discarded. None keeps connections until the server closes them.
+            pool_block (bool): If True, callers wait for a free connection instead of opening
+                               extra short-lived connections once `pool_maxsize` is reached.
+            response_cache (TTL_Cache | None): Optional per-endpoint cache for GET requests. Concurrent
+                                               identical requests to a cached endpoint are coalesced into one.
+            retry (Retry_Policy | None): Optional retry policy. Connection errors, timeouts and retryable
+                                         status codes are retried with backoff. Broadcasts are only retried
+                                         when the request provably never reached the server.
+            rate_limiter (Rate_Limiter | None): Optional token-bucket limiter applied per base URL to every
+                                                request sent, retries included. Cached responses are not limited.
+            hedge (Hedge_Policy | None): Optional hedging of idempotent reads. When the first request is slower
+                                         than the policy's latency percentile, a duplicate is sent to the next
+                                         node of the endpoint pool and the first answer is returned.
+            circuit_breaker (Circuit_Breaker | None): Optional circuit breakers per base URL and endpoint group.
+                                                      Requests to an open circuit raise QubiPy_Circuit_Open at once.
+
+        Raises:
+            QubiPy_Exceptions: If `pool_connections` or `pool_maxsize` is not a positive integer.
+        """
+
+        if not isinstance(pool_connections, int) or not isinstance(pool_maxsize, int) or pool_connections < 1 or pool_maxsize < 1:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_POOL_CONFIG)
+
+        super().__init__()
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.response_cache = response_cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self._hedge_executor = None
+        self.endpoint_pools: List[Endpoint_Pool] = []
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = time.monotonic()
+
+        adapter = self._build_adapter(pool_block)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def _build_adapter(self, pool_block: bool) -> HTTPAdapter:
+        """
+        Creates the transport adapter mounted for both HTTP and HTTPS.
+
+        Args:
+            pool_block (bool): Whether the pool blocks when all connections are busy.
+
+        Returns:
+            HTTPAdapter: The adapter holding the connection pools.
+        """
+        return HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=pool_block)
+
+    def _recycle_idle_connections(self):
+        """
+        Drops every pooled connection if the session has been idle longer than `keep_alive`.
+        Servers silently close idle keep-alive sockets, so reusing them after a long pause
+        only produces a failed request followed by a reconnect.
+        """
+
+        if self.keep_alive is None or self._in_flight:
+            return
+
+        if time.monotonic() - self._last_used > self.keep_alive:
+            for adapter in set(self.adapters.values()):
+                adapter.poolmanager.clear()
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request through the pooled connections, serving it from the response cache when enabled.
+
+        Returns:
+            requests.Response: The response returned by the server.
+        """
+
+        ttl = self.response_cache.ttl_for(url) if self.response_cache is not None and method.upper() == 'GET' else None
+
+        if ttl is None:
+            return self._send(method, url, *args, **kwargs)
+
+        params = kwargs.get('params') or {}
+        key = (url, tuple(sorted(params.items())) if isinstance(params, dict) else params)
+
+        return self.response_cache.get_or_fetch(
+            key,
+            ttl,
+            lambda: self._send(method, url, *args, **kwargs),
+            cacheable=lambda response: response.ok
+        )
+
+    def _send(self, method, url, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request, retrying it according to the retry policy.
+
+        Returns:
+            requests.Response: The last response returned by the server.
+
+        Raises:
+            requests.RequestException: The error of the last attempt.
+        """
+
+        policy = self.retry.for_url(url) if self.retry is not None else None
+
+        if policy is None:
+            return self._send_once(method, url, *args, **kwargs)
+
+        idempotent = is_idempotent(method, url)
+        policy.budget.record_request()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                response = self._send_once(method, url, *args, **kwargs)
+            except requests.RequestException as E:
+                if not policy.should_retry_error(E, attempt, idempotent):
+                    raise
+                delay = policy.backoff(attempt)
+                if delay is None or not policy.budget.try_acquire():
+                    raise
+            else:
+                if not policy.should_retry_response(response, attempt, idempotent):
+                    return response
+                delay = policy.backoff(attempt, response)
+                if delay is None or not policy.budget.try_acquire():
+                    return response
+                response.close()
+
+            time.sleep(delay)
+
+    def add_endpoint_pool(self, pool: Endpoint_Pool):
+        """
+        Balances every request whose URL starts with the pool's primary URL across its nodes.
+
+        Args:
+            pool (Endpoint_Pool): The nodes serving the same API.
+        """
+        self.endpoint_pools = [existing for existing in self.endpoint_pools if existing.primary != pool.primary] + [pool]
+
+    def _pool_for(self, url: str) -> Endpoint_Pool | None:
+        for pool in self.endpoint_pools:
+            if pool.matches(url):
+                return pool
+        return None
+
+    def check_endpoints(self):
+        """
+        Probes the health endpoint of every balanced node, refreshing its latency and taking the
+        nodes that fail out of rotation. Call it periodically, for example from a background thread.
+        """
+        for pool in self.endpoint_pools:
+            if pool.health_endpoint is None:
+                continue
+
+            for endpoint in pool.endpoints:
+                started = time.monotonic()
+                try:
+                    response = self._transmit('GET', f'{endpoint.url}{pool.health_endpoint}', headers=HEADERS, timeout=TIMEOUT)
+                    ok = response.ok
+                    response.close()
+                except requests.RequestException:
+                    ok = False
+
+                if ok:
+                    pool.record(endpoint, time.monotonic() - started, True)
+                else:
+                    pool.mark_down(endpoint)
+
+    def _send_once(self, method, url, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request to the best node of its endpoint pool, failing over to the next nodes
+        on connection errors and 5xx responses. Requests that are not idempotent only fail over
+        when they provably never reached the failing node. Hedged reads go to the two best nodes
+        when at least two are healthy, and fail over to the remaining nodes if both fail.
+
+        Returns:
+            requests.Response: The response returned by the server.
+        """
+
+        pool = self._pool_for(url)
+
+        if pool is None:
+            return self._transmit(method, url, *args, **kwargs)
+
+        idempotent = is_idempotent(method, url)
+        candidates = pool.ranked()
+
+        if self.hedge is not None and self.hedge.applies(method, url):
+            targets = pool.healthy()[:2]
+
+            if len(targets) == 2:
+                outcome = self._send_hedged(pool, targets, method, url, *args, **kwargs)
+                candidates = [endpoint for endpoint in candidates if endpoint not in targets]
+
+                if answered(outcome) or not candidates:
+                    return outcome.result()
+                if outcome.exception() is None:
+                    outcome.result().close()
+
+        for index, endpoint in enumerate(candidates):
+            is_last = index == len(candidates) - 1
+
+            try:
+                response = self._send_to(pool, endpoint, method, url, *args, **kwargs)
+            except QubiPy_Circuit_Open:
+                if is_last:
+                    raise
+                continue
+            except requests.RequestException as E:
+                if is_last or not (idempotent or never_sent(E)):
+                    raise
+                continue
+
+            if response.status_code < 500 or is_last or not idempotent:
+                return response
+            response.close()
+
+    def _send_to(self, pool: Endpoint_Pool | None, endpoint: Endpoint | None, method, url, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request to one node of a pool, recording its latency and outcome.
+        Without a pool the request is sent to `url` as it is.
+        """
+
+        if pool is None:
+            return self._transmit(method, url, *args, **kwargs)
+
+        started = pool.start(endpoint)
+
+        try:
+            response = self._transmit(method, pool.rewrite(url, endpoint), *args, **kwargs)
+        except requests.RequestException:
+            pool.finish(endpoint, started, ok=False)
+            raise
+
+        pool.finish(endpoint, started, response.status_code < 500)
+        return response
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=2 * self.pool_maxsize, thread_name_prefix='qubipy-hedge')
+            return self._hedge_executor
+
+    def _send_hedged(self, pool: Endpoint_Pool, targets: List[Endpoint], method, url, *args, **kwargs) -> Future:
+        """
+        Sends a read to the best node and, if it has not answered within the hedge delay (or failed),
+        a duplicate to the second best node. The first successful answer wins and the other one is
+        discarded when it arrives.
+
+        Args:
+            pool (Endpoint_Pool): The pool of the URL.
+            targets (List[Endpoint]): Two healthy nodes, best first.
+
+        Returns:
+            Future: The completed request of the winner, or of the hedge if both failed.
+        """
+
+        executor = self._get_hedge_executor()
+        started = time.monotonic()
+
+        def record_latency(future: Future):
+            if answered(future):
+                self.hedge.record_latency(time.monotonic() - started)
+
+        primary = executor.submit(self._send_to, pool, targets[0], method, url, *args, **kwargs)
+        primary.add_done_callback(record_latency)
+
+        wait([primary], timeout=self.hedge.delay())
+
+        if primary.done() and answered(primary):
+            self.hedge.record_request(fired=False, won=False)
+            return primary
+
+        hedge = executor.submit(self._send_to, pool, targets[1], method, url, *args, **kwargs)
+        pending = {primary, hedge}
+        winner = None
+
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in (primary, hedge) if future in done and answered(future)), None)
+
+        winner = winner or hedge
+        self.hedge.record_request(fired=True, won=winner is hedge and answered(hedge))
+
+        for future in (primary, hedge):
+            if future is not winner:
+                future.add_done_callback(lambda loser: loser.exception() is None and loser.result().close())
+
+        return winner
+
+    def _transmit(self, method, url, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request through the pooled connections, recycling stale ones first.
+
+        Returns:
+            requests.Response: The response returned by the server.
+
+        Raises:
+            QubiPy_Circuit_Open: If the circuit of the URL is open. Nothing is sent.
+        """
+
+        circuit = self.circuit_breaker.acquire(url) if self.circuit_breaker is not None else None
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+
+        with self._lock:
+            self._recycle_idle_connections()
+            self._in_flight += 1
+
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            if type(response) is requests.Response:
+                response.__class__ = QubiPy_Response
+        except requests.RequestException:
+            if circuit is not None:
+                circuit.record_failure()
+            raise
+        except BaseException:
+            if circuit is not None:
+                circuit.release()
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+        if circuit is not None:
+            if response.status_code < 500:
+                circuit.record_success()
+            else:
+                circuit.record_failure()
+
+        return response
+
+    def close(self):
+        """
+        Closes every pooled connection and stops the hedging threads.
+        """
+        super().close()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
@@ -3,7 +3,8 @@ builder.py
 Qubic Transaction Builder
 """
 
-from qubipy.crypto.utils import sign, kangaroo_twelve, get_private_key_from_subseed, get_subseed_from_seed, get_public_key_from_private_key, get_identity_from_public_key
+from qubipy.crypto.utils import kangaroo_twelve, get_identity_from_public_key
+from qubipy.tx.signer import Signer
 
 class Tx_Builder:
     def __init__(self):
@@ -99,12 +100,27 @@ class Tx_Builder:
         self.input_size = input_size
         return self
     
-    def build(self, seed: str) -> bytes:
+    def set_payload(self, payload: bytes) -> 'Tx_Builder':
+        """
+        Sets the payload (input) of the transaction and its input size.
+
+        Args:
+            payload (bytes): The input data of the transaction.
+
+        Returns:
+            Tx_Builder: The current instance of the transaction builder.
+        """
+        self.payload = bytes(payload)
+        self.input_size = len(self.payload)
+        return self
+
+    def build(self, seed: 'str | Signer') -> bytes:
         """
         Builds the transaction and signs it.
 
         Args:
-            seed (str): The seed used to derive keys for signing.
+            seed (str | Signer): The seed used to derive keys for signing, or a Signer holding the keys
+                                 already derived. Pass a Signer when signing many transactions.
 
         Returns:
             tuple: A tuple containing the first 80 bytes of the built data, the full built data, the signature, and the transaction hash.
@@ -130,17 +146,17 @@ class Tx_Builder:
         
         self.built_data[offset:offset+2] = self.input_size.to_bytes(2, byteorder='little')
         offset += 2
+
+        if self.payload:
+            self.built_data[offset:offset+len(self.payload)] = self.payload
+            offset += len(self.payload)
         
         # Sign the transaction
-        seed_bytes = bytes(seed, 'utf-8')
-
-        subseed = get_subseed_from_seed(seed_bytes)
-        private_key = get_private_key_from_subseed(subseed)
-        public_key = get_public_key_from_private_key(private_key)
+        signer = seed if isinstance(seed, Signer) else Signer(seed)
 
         tx_digest = kangaroo_twelve(self.built_data, offset, 32)
 
-        signature = sign(subseed, public_key, tx_digest)
+        signature = signer.sign(tx_digest)
 
         self.built_data[offset:offset+len(signature)] = signature
         offset += len(signature)
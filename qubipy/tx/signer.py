@@ -0,0 +1,40 @@
+"""
+signer.py
+Reusable signing keys for Qubic transactions
+"""
+
+from qubipy.crypto.utils import sign, get_private_key_from_subseed, get_subseed_from_seed, get_public_key_from_private_key, get_identity_from_public_key
+
+class Signer:
+    __slots__ = ('subseed', 'private_key', 'public_key', 'identity')
+
+    def __init__(self, seed: str):
+        """
+        Derives the subseed, private key, public key and identity of a seed once, so that every
+        transaction signed with this signer only costs its digest and its signature.
+
+        Args:
+            seed (str): The 55-character seed, lowercase letters a-z.
+
+        Raises:
+            ValueError: If the seed is not 55 lowercase letters.
+        """
+        self.subseed = get_subseed_from_seed(bytes(seed, 'utf-8'))
+        self.private_key = get_private_key_from_subseed(self.subseed)
+        self.public_key = get_public_key_from_private_key(self.private_key)
+        self.identity = get_identity_from_public_key(self.public_key)
+
+    def sign(self, message_digest: bytes) -> bytes:
+        """
+        Signs a 32-byte message digest.
+
+        Args:
+            message_digest (bytes): The digest to sign.
+
+        Returns:
+            bytes: A 64-byte signature.
+        """
+        return sign(self.subseed, self.public_key, message_digest)
+
+    def __repr__(self) -> str:
+        return f"Signer(identity={self.identity!r})"
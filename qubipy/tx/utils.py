@@ -3,20 +3,33 @@ utils.py
 Qubic Transaction Utilities
 """
 
-from qubipy.crypto.utils import get_private_key_from_subseed, get_subseed_from_seed, get_public_key_from_private_key, get_public_key_from_identity
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Tuple
+
+from qubipy.crypto.utils import get_public_key_from_identity
 from qubipy.tx.builder import Tx_Builder
+from qubipy.tx.signer import Signer
 from qubipy.rpc.rpc_client import QubiPy_RPC
+from qubipy.concurrency import ordered_map
+from qubipy.config import *
 from qubipy.exceptions import QubiPy_Exceptions
 
-def create_tx(seed: str, dest_id: str, amount: int, target_tick: int) -> tuple[bytes, bytes, bytes, bytes]:
+BATCH_THREADS = 'thread'
+
+BATCH_PROCESSES = 'process'
+
+def create_tx(seed: 'str | Signer', dest_id: str, amount: int, target_tick: int, rpc_client: QubiPy_RPC | None = None) -> tuple[bytes, bytes, bytes, bytes]:
     """
     Creates a transaction using the provided parameters.
 
     Args:
-        seed (str): The seed used to derive keys for signing.
+        seed (str | Signer): The seed used to derive keys for signing, or a Signer holding the keys already derived.
         dest_id (bytes): The destination identity for the transaction.
         amount (int): The amount to be transferred.
         target_tick (int): The target tick for the transaction.
+        rpc_client (QubiPy_RPC | None): The client used to read the latest tick. Pass one when creating many
+                                        transactions; without it, a client is opened and closed for this call.
 
     Returns:
         tuple: A tuple containing the first 80 bytes of the built data, the full built data, the signature, and the transaction hash.
@@ -27,7 +40,11 @@ def create_tx(seed: str, dest_id: str, amount: int, target_tick: int) -> tuple[b
     """
 
     try:
-        tick = QubiPy_RPC().get_latest_tick()
+        if rpc_client is not None:
+            tick = rpc_client.get_latest_tick()
+        else:
+            with QubiPy_RPC() as rpc:
+                tick = rpc.get_latest_tick()
 
         formatted_tick = int(tick)
         formatted_target_tick = int(target_tick)
@@ -38,16 +55,112 @@ def create_tx(seed: str, dest_id: str, amount: int, target_tick: int) -> tuple[b
     except ValueError:
         raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_VALUE) from None
 
-    source_private_key = get_private_key_from_subseed(get_subseed_from_seed(bytes(seed, 'utf-8')))
-    source_public_key = get_public_key_from_private_key(source_private_key)
+    signer = seed if isinstance(seed, Signer) else Signer(seed)
     destination_public_key = get_public_key_from_identity(dest_id)
 
     tx = Tx_Builder()
-    tx.set_source_public_key(source_public_key)
+    tx.set_source_public_key(signer.public_key)
     tx.set_destination_public_key(destination_public_key)
     tx.set_amount(amount)
     tx.set_target_tick(target_tick)
     tx.set_input_type(0)
     tx.set_input_size(0)
     
-    return tx.build(seed)
+    return tx.build(signer)
+
+
+def _check_batch_tx(tx: tuple) -> tuple:
+    try:
+        dest_id, amount, target_tick, input_type, payload = tx
+    except (TypeError, ValueError):
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_BATCH_TX) from None
+
+    payload = bytes(payload or b'') if isinstance(payload, (bytes, bytearray, memoryview, type(None))) else None
+
+    if (not isinstance(dest_id, str) or len(dest_id) != 60
+            or not isinstance(amount, int) or amount < 0
+            or not isinstance(target_tick, int) or target_tick <= 0
+            or not isinstance(input_type, int) or not 0 <= input_type <= 0xFFFF
+            or payload is None or len(payload) > TX_MAX_INPUT_SIZE):
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_BATCH_TX)
+
+    return dest_id, amount, target_tick, input_type, payload
+
+
+def _build_chunk(signer: Signer, chunk: List[tuple]) -> List[Tuple[bytes, str]]:
+    """
+    Builds and signs a chunk of checked batch transactions. Most of the time is spent in the
+    ctypes calls, which release the GIL, so chunks built on different threads run in parallel.
+    """
+    built = []
+    for dest_id, amount, target_tick, input_type, payload in chunk:
+        tx = (Tx_Builder()
+              .set_source_public_key(signer.public_key)
+              .set_destination_public_key(get_public_key_from_identity(dest_id))
+              .set_amount(amount)
+              .set_target_tick(target_tick)
+              .set_input_type(input_type)
+              .set_payload(payload))
+        _, signed_tx, _, tx_hash = tx.build(signer)
+        built.append((bytes(signed_tx), tx_hash))
+    return built
+
+
+_process_signer = None
+
+def _init_process(signer: Signer):
+    global _process_signer
+    _process_signer = signer
+
+def _build_chunk_in_process(chunk: List[tuple]) -> List[Tuple[bytes, str]]:
+    return _build_chunk(_process_signer, chunk)
+
+
+def build_batch(signer: 'str | Signer', txs: Iterable[tuple], max_workers: int | None = None, executor: str = BATCH_THREADS) -> List[Tuple[bytes, str]]:
+    """
+    Builds and signs many transactions from the same source on a pool of threads or processes.
+
+    The keys are derived once, and the transactions are split into about `BATCH_CHUNKS_PER_WORKER`
+    chunks per worker, so each worker pays one task per chunk rather than per transaction.
+
+    Args:
+        signer (str | Signer): The seed used to derive keys for signing, or a Signer holding the keys already derived.
+        txs (Iterable[tuple]): The transactions, as (destination ID, amount, target tick, input type, payload) tuples.
+                               The payload is a bytes-like object or None; the input size is its length.
+        max_workers (int | None): Number of threads or processes. Defaults to the number of CPUs.
+        executor (str): BATCH_THREADS to sign on threads of this process, BATCH_PROCESSES to sign on a process pool.
+                        Threads start instantly; processes also parallelize the Python work around the ctypes calls.
+
+    Returns:
+        List[Tuple[bytes, str]]: The signed transaction bytes, ready for broadcasting, and the transaction ID, in input order.
+
+    Raises:
+        QubiPy_Exceptions: If a transaction, the executor or the number of workers is invalid.
+        ValueError: If the seed is invalid.
+    """
+    if executor not in (BATCH_THREADS, BATCH_PROCESSES):
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_BATCH_EXECUTOR)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_VALUE)
+
+    signer = signer if isinstance(signer, Signer) else Signer(signer)
+    txs = [_check_batch_tx(tx) for tx in txs]
+
+    if not txs:
+        return []
+
+    chunk_size = -(-len(txs) // (max_workers * BATCH_CHUNKS_PER_WORKER))
+    chunks = [txs[start:start + chunk_size] for start in range(0, len(txs), chunk_size)]
+    max_workers = min(max_workers, len(chunks))
+
+    if executor == BATCH_PROCESSES:
+        with ProcessPoolExecutor(max_workers, initializer=_init_process, initargs=(signer,)) as pool:
+            built = list(pool.map(_build_chunk_in_process, chunks))
+    else:
+        built = [result for _, result in ordered_map(lambda chunk: _build_chunk(signer, chunk), chunks, max_workers)]
+
+    return [tx for chunk in built for tx in chunk]
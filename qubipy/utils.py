@@ -3,25 +3,31 @@ utils.py
 Auxiliary functions for validations, data formatting, response handling, etc.
 Example: input parameter validation or API response cleanup.
 """
+import re
+from urllib.parse import urlsplit
+
 from qubipy.exceptions import *
+from qubipy.config import *
 
-def check_pages_format(page_1: int, page_2: int):
+def check_pages_format(page_1: int, page_2: int, max_page: int | None = PAGE_NUMBER_MAX):
 
     """
-    Validates the format and range of the given page numbers.
+    Validates the format and range of a page number and a page size.
 
     Args:
-        page_1 (int): The first page number to validate. Must be an integer between 0 and 100.
-        page_2 (int): The second page number to validate. Must be an integer between 0 and 100.
+        page_1 (int): The page number to validate. Must be an integer between 0 and `max_page`.
+        page_2 (int): The page size to validate. Must be an integer between 0 and PAGE_SIZE_MAX.
+        max_page (int | None): The largest page number accepted, or None for no limit. The paginated
+                               iterators pass None to walk past the pages the public methods accept.
 
     Raises:
-        QubiPy_Exceptions: If either page_1 or page_2 is not an integer or falls outside the allowed range (0-100).
+        QubiPy_Exceptions: If either value is not an integer or falls outside its allowed range.
     """
 
     if not isinstance(page_1, int) or not isinstance(page_2, int):
         raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_DATA_FORMAT)
 
-    if page_1 < 0 or page_2 < 0 or page_1 > 100 or page_2 > 100:
+    if page_1 < 0 or page_2 < 0 or page_2 > PAGE_SIZE_MAX or (max_page is not None and page_1 > max_page):
         raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_PAGES)
 
 def check_ticks_format(start_tick: int, end_tick: int):
@@ -83,6 +89,22 @@ def is_tx_bytes_invalid(tx: bytes) -> bool:
     """
     return not isinstance(tx, (bytes, bytearray)) or len(tx) == 0
 
+
+def get_tx_target_tick(tx: bytes) -> int | None:
+    """
+    Reads the target tick of a built transaction: a little-endian uint32 following the source and
+    destination public keys (32 bytes each) and the amount (8 bytes).
+
+    Args:
+        tx (bytes): The transaction bytes, as returned by Tx_Builder.build.
+
+    Returns:
+        int | None: The target tick, or None if `tx` is too short to contain one.
+    """
+    if is_tx_bytes_invalid(tx) or len(tx) < TX_TICK_OFFSET + 4:
+        return None
+    return int.from_bytes(tx[TX_TICK_OFFSET:TX_TICK_OFFSET + 4], byteorder='little')
+
    
 def is_wallet_id_invalid(wallet_id: str) -> bool:
     """
@@ -94,4 +116,20 @@ def is_wallet_id_invalid(wallet_id: str) -> bool:
     Returns:
         bool: True if the wallet ID is invalid, False if valid
     """
-    return not isinstance(wallet_id, str) or len(wallet_id) != 60 or not wallet_id.isalpha()
\ No newline at end of file
+    return not isinstance(wallet_id, str) or len(wallet_id) != 60 or not wallet_id.isalpha()
+
+def endpoint_matches(url: str, endpoint: str) -> bool:
+    """
+    Checks whether a request URL targets an endpoint path, which may contain placeholders
+    such as '/balances/{id}'. The query string is ignored.
+
+    Args:
+        url (str): The full request URL.
+        endpoint (str): An endpoint path from endpoints_rpc.py or endpoints_core.py.
+
+    Returns:
+        bool: True if the path of `url` ends with `endpoint`.
+    """
+    path = urlsplit(url).path
+    pattern = re.sub(r'\\\{[^}]*\\\}', '[^/]+', re.escape(endpoint))
+    return re.search(f'{pattern}$', path) is not None
@@ -0,0 +1,303 @@
+"""
+balances.py
+Watchers that report balance changes of a list of wallets as ticks go by, without polling
+every balance every tick. After an initial snapshot, each new tick's approved transactions
+tell which watched wallets may have changed, and only those are re-read. Every
+`full_refresh_ticks` (or after a gap too long to replay) every balance is re-read, and the
+latest incoming/outgoing transfer ticks reveal which ones actually changed.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.utils import is_wallet_id_invalid
+from qubipy.concurrency import is_empty_tick, ordered_map
+from qubipy.models import field_of
+
+
+def _fingerprint(balance: Any) -> tuple:
+    return (
+        str(field_of(balance, 'balance', 'balance')),
+        field_of(balance, 'latest_incoming_transfer_tick', 'latestIncomingTransferTick'),
+        field_of(balance, 'latest_outgoing_transfer_tick', 'latestOutgoingTransferTick')
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Balance_Change:
+    identity: str
+    tick: int
+    previous: Any
+    current: Any
+
+    @property
+    def delta(self) -> int:
+        """
+        The change of the balance, in QUs.
+        """
+        return int(field_of(self.current, 'balance', 'balance') or 0) - int(field_of(self.previous, 'balance', 'balance') or 0)
+
+
+class _Balance_Watch:
+    """
+    State shared by the blocking and asyncio watchers: the watched wallets, their last known
+    balances and the last tick whose transactions were taken into account.
+    """
+
+    def __init__(self, wallet_ids: Iterable[str], callback: Callable[[Balance_Change], Any] | None, interval: float, full_refresh_ticks: int, max_tick_gap: int):
+        self.callback = callback
+        self.interval = interval
+        self.full_refresh_ticks = full_refresh_ticks
+        self.max_tick_gap = max_tick_gap
+
+        self.balances: Dict[str, Any] = {}
+        self.last_tick: int | None = None
+        self._refreshed_at: int | None = None
+        self._watched: Set[str] = set()
+        self._pending: Set[str] = set()
+
+        self.watch(wallet_ids)
+
+    @property
+    def wallet_ids(self) -> Set[str]:
+        return set(self._watched)
+
+    def watch(self, wallet_ids: Iterable[str]):
+        """
+        Adds wallets to the watch list. Their balance is read at the next poll, without emitting a change.
+
+        Raises:
+            QubiPy_Exceptions: If a wallet ID is invalid.
+        """
+        wallet_ids = list(wallet_ids)
+        if any(not wallet_id or is_wallet_id_invalid(wallet_id) for wallet_id in wallet_ids):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_ADDRESS_ID)
+
+        new_ids = set(wallet_ids) - self._watched
+        self._watched |= new_ids
+        self._pending |= new_ids
+
+    def unwatch(self, wallet_ids: Iterable[str]):
+        """
+        Removes wallets from the watch list.
+        """
+        for wallet_id in wallet_ids:
+            self._watched.discard(wallet_id)
+            self._pending.discard(wallet_id)
+            self.balances.pop(wallet_id, None)
+
+    def _needs_full_refresh(self, tick: int) -> bool:
+        return (self.last_tick is None
+                or tick - self.last_tick > self.max_tick_gap
+                or tick - self._refreshed_at >= self.full_refresh_ticks)
+
+    def _touched(self, transactions: Iterable[Any]) -> Set[str]:
+        touched = set()
+        for transaction in transactions or ():
+            for identity in (field_of(transaction, 'source_id', 'sourceId'), field_of(transaction, 'dest_id', 'destId')):
+                if identity in self._watched:
+                    touched.add(identity)
+        return touched
+
+    def _apply(self, balances: Dict[str, Any], errors: Dict[str, Any], tick: int, full_refresh: bool) -> List[Balance_Change]:
+        """
+        Stores the balances read at `tick` and returns the changes. Wallets that failed, or whose balance
+        was not yet valid for a replayed tick, are re-read at the next poll.
+        """
+        changes = []
+        stale = set()
+
+        for wallet_id, balance in balances.items():
+            if wallet_id not in self._watched:
+                continue
+            previous = self.balances.get(wallet_id)
+            self.balances[wallet_id] = balance
+            if previous is not None and _fingerprint(previous) != _fingerprint(balance):
+                changes.append(Balance_Change(wallet_id, tick, previous, balance))
+            valid_for_tick = field_of(balance, 'valid_for_tick', 'validForTick')
+            if not full_refresh and valid_for_tick is not None and int(valid_for_tick) < tick:
+                stale.add(wallet_id)
+
+        self._pending = (self._pending - set(balances)) | stale | (set(errors) & self._watched)
+        self.last_tick = tick
+        if full_refresh:
+            self._refreshed_at = tick
+
+        return changes
+
+
+class Balance_Watcher(_Balance_Watch):
+    def __init__(self, rpc_client, wallet_ids: Iterable[str], callback: Callable[[Balance_Change], Any] | None = None, interval: float = WATCH_INTERVAL, full_refresh_ticks: int = WATCH_FULL_REFRESH_TICKS, max_tick_gap: int = WATCH_MAX_TICK_GAP, max_workers: int = BULK_MAX_WORKERS):
+        """
+        Initializes a watcher over a QubiPy_RPC client.
+
+        Args:
+            rpc_client (QubiPy_RPC): The client used for tick info, approved transactions and balances.
+            wallet_ids (Iterable[str]): The wallets to watch.
+            callback (Callable[[Balance_Change], Any] | None): Called with every change found by `poll` and `run`.
+            interval (float): Seconds between two polls in `run` and when iterating.
+            full_refresh_ticks (int): Ticks after which every watched balance is re-read.
+            max_tick_gap (int): Largest number of ticks replayed one by one; a larger gap triggers a full refresh.
+            max_workers (int): Maximum number of requests in flight.
+
+        Raises:
+            QubiPy_Exceptions: If a wallet ID is invalid.
+        """
+        super().__init__(wallet_ids, callback, interval, full_refresh_ticks, max_tick_gap)
+        self.rpc_client = rpc_client
+        self.max_workers = max_workers
+
+    def _approved_transactions(self, tick: int, current_tick: int) -> Any:
+        """
+        Returns the approved transactions of a tick, an empty list if the tick has passed and was empty
+        or skipped, or None if they are not available yet.
+        """
+        try:
+            return self.rpc_client.get_approved_transaction_for_tick(tick)
+        except QubiPy_Circuit_Open:
+            raise
+        except QubiPy_Exceptions as E:
+            return [] if tick < current_tick and is_empty_tick(E) else None
+
+    def poll(self) -> List[Balance_Change]:
+        """
+        Reads the current tick and re-reads the balances that may have changed since the last poll.
+
+        Ticks whose approved transactions are not available yet are left for the next poll. Ticks that
+        have passed and were empty or skipped are replayed as having no transactions.
+
+        Returns:
+            List[Balance_Change]: The changes found, also passed to the callback.
+
+        Raises:
+            QubiPy_Exceptions: If the current tick cannot be read.
+        """
+        tick = field_of(self.rpc_client.get_tick_info(), 'tick', 'tick')
+
+        if not tick or (self.last_tick is not None and tick <= self.last_tick and not self._pending):
+            return []
+
+        full_refresh = self._needs_full_refresh(tick)
+
+        if full_refresh:
+            wallet_ids, processed = set(self._watched), tick
+        else:
+            wallet_ids, processed = set(self._pending), self.last_tick
+            ticks = range(self.last_tick + 1, tick + 1)
+
+            with contextlib.closing(ordered_map(lambda replayed: self._approved_transactions(replayed, tick), ticks, self.max_workers)) as results:
+                for replayed, transactions in results:
+                    if transactions is None:
+                        break
+                    wallet_ids |= self._touched(transactions)
+                    processed = replayed
+
+        balances, errors = self.rpc_client.get_balances(wallet_ids, self.max_workers) if wallet_ids else ({}, {})
+        changes = self._apply(balances, errors, processed, full_refresh)
+
+        if self.callback is not None:
+            for change in changes:
+                self.callback(change)
+
+        return changes
+
+    def run(self, stop: threading.Event | None = None):
+        """
+        Polls until `stop` is set, passing every change to the callback.
+
+        Args:
+            stop (threading.Event | None): Set it to stop the watcher. Without it, the watcher runs forever.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll()
+            stop.wait(self.interval)
+
+    def __iter__(self) -> Iterator[Balance_Change]:
+        """
+        Yields changes as they are found, polling forever.
+        """
+        while True:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+
+class Async_Balance_Watcher(_Balance_Watch):
+    def __init__(self, rpc_client, wallet_ids: Iterable[str], callback: Callable[[Balance_Change], Any] | None = None, interval: float = WATCH_INTERVAL, full_refresh_ticks: int = WATCH_FULL_REFRESH_TICKS, max_tick_gap: int = WATCH_MAX_TICK_GAP, max_workers: int = BULK_MAX_WORKERS):
+        """
+        Initializes a watcher over an AsyncQubiPy_RPC client. The callback may be a coroutine function.
+        The other arguments are those of Balance_Watcher.
+        """
+        super().__init__(wallet_ids, callback, interval, full_refresh_ticks, max_tick_gap)
+        self.rpc_client = rpc_client
+        self.max_workers = max_workers
+
+    async def _approved_transactions(self, semaphore: asyncio.Semaphore, tick: int, current_tick: int) -> Any:
+        async with semaphore:
+            try:
+                return await self.rpc_client.get_approved_transaction_for_tick(tick)
+            except QubiPy_Circuit_Open:
+                raise
+            except QubiPy_Exceptions as E:
+                return [] if tick < current_tick and is_empty_tick(E) else None
+
+    async def poll(self) -> List[Balance_Change]:
+        """
+        The asyncio counterpart of `Balance_Watcher.poll`.
+        """
+        tick = field_of(await self.rpc_client.get_tick_info(), 'tick', 'tick')
+
+        if not tick or (self.last_tick is not None and tick <= self.last_tick and not self._pending):
+            return []
+
+        full_refresh = self._needs_full_refresh(tick)
+
+        if full_refresh:
+            wallet_ids, processed = set(self._watched), tick
+        else:
+            wallet_ids, processed = set(self._pending), self.last_tick
+            ticks = range(self.last_tick + 1, tick + 1)
+            semaphore = asyncio.Semaphore(self.max_workers)
+            results = await asyncio.gather(*(self._approved_transactions(semaphore, replayed, tick) for replayed in ticks))
+
+            for replayed, transactions in zip(ticks, results):
+                if transactions is None:
+                    break
+                wallet_ids |= self._touched(transactions)
+                processed = replayed
+
+        balances, errors = await self.rpc_client.get_balances(wallet_ids, self.max_workers) if wallet_ids else ({}, {})
+        changes = self._apply(balances, errors, processed, full_refresh)
+
+        if self.callback is not None:
+            for change in changes:
+                result = self.callback(change)
+                if asyncio.iscoroutine(result):
+                    await result
+
+        return changes
+
+    async def run(self, stop: asyncio.Event | None = None):
+        """
+        Polls until `stop` is set, passing every change to the callback.
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            await self.poll()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), self.interval)
+
+    async def __aiter__(self):
+        """
+        Yields changes as they are found, polling forever.
+        """
+        while True:
+            for change in await self.poll():
+                yield change
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,156 @@
+"""
+ticks.py
+Followers that yield every new tick exactly once and in order, back-filling ticks that were
+skipped between two polls. Polls are paced on the observed tick interval: the next poll is
+scheduled for when the next tick is expected, then retried at a shorter and growing delay until
+it shows up, instead of sleeping a fixed time that either lags or hammers the API.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.concurrency import call_with_retries, async_call_with_retries
+
+HYDRATE_TARGETS = ('tick_data', 'approved_transactions')
+
+
+def check_hydrate(hydrate: str | Sequence[str] | None):
+    """
+    Validates the data a follower is asked to attach to each tick.
+
+    Raises:
+        QubiPy_Exceptions: If `hydrate` names unknown data.
+    """
+    if hydrate is None:
+        return
+
+    targets = (hydrate,) if isinstance(hydrate, str) else tuple(hydrate)
+
+    if not targets or any(target not in HYDRATE_TARGETS for target in targets):
+        raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_FETCH_TARGET)
+
+
+class Tick_Pacer:
+    def __init__(self, initial_interval: float = FOLLOW_INITIAL_INTERVAL, min_delay: float = FOLLOW_MIN_DELAY, max_delay: float = FOLLOW_MAX_DELAY, decay: float = FOLLOW_DECAY):
+        """
+        Estimates the tick interval from the observed progression and tells how long to wait before the next poll.
+
+        Args:
+            initial_interval (float): Tick interval in seconds assumed until one has been observed.
+            min_delay (float): Shortest wait between two polls.
+            max_delay (float): Longest wait between two polls.
+            decay (float): Weight of the newest sample in the moving average of the interval.
+        """
+        self.interval = initial_interval
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.decay = decay
+
+        self._last_time: float | None = None
+        self._misses = 0
+
+    def observe(self, new_ticks: int, now: float | None = None):
+        """
+        Records the result of a poll: the number of ticks that appeared since the previous one.
+        Only polls that found a single new tick are sampled: several ticks at once mean the caller
+        fell behind (or is back-filling), and the time spent processing them would inflate the interval.
+        """
+        now = time.monotonic() if now is None else now
+
+        if new_ticks <= 0:
+            self._misses += 1
+            return
+
+        self._misses = 0
+
+        if new_ticks > 1:
+            self._last_time = None
+            return
+
+        if self._last_time is not None:
+            self.interval = (1 - self.decay) * self.interval + self.decay * (now - self._last_time)
+
+        self._last_time = now
+
+    def delay(self) -> float:
+        """
+        Returns:
+            float: Seconds to wait before the next poll. After a new tick this is the expected tick interval;
+                after an empty poll the next tick is imminent, so the wait starts at a quarter of it and doubles
+                with every further empty poll.
+        """
+        if not self._misses:
+            delay = self.interval
+        else:
+            delay = self.interval / 4 * 2 ** (self._misses - 1)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+
+def follow_ticks(rpc_client, start_tick: int | None = None, hydrate: str | Sequence[str] | None = None, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES, pacer: Tick_Pacer | None = None) -> Iterator[Any]:
+    """
+    Yields every tick processed by the RPC server from `start_tick` on, forever. See `QubiPy_RPC.follow_ticks`.
+    """
+    pacer = pacer or Tick_Pacer()
+    next_tick = start_tick
+
+    while True:
+        latest_tick = call_with_retries(rpc_client.get_latest_tick, retries=retries)
+        if next_tick is None:
+            next_tick = latest_tick
+
+        new_ticks = latest_tick - next_tick + 1
+        pacer.observe(new_ticks)
+
+        if new_ticks > 0:
+            if hydrate is None:
+                yield from range(next_tick, latest_tick + 1)
+            else:
+                yield from rpc_client.fetch_tick_range(next_tick, latest_tick, hydrate, max_workers, retries)
+            next_tick = latest_tick + 1
+
+        time.sleep(pacer.delay())
+
+
+async def async_follow_ticks(rpc_client, start_tick: int | None = None, hydrate: str | Sequence[str] | None = None, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES, pacer: Tick_Pacer | None = None) -> AsyncIterator[Any]:
+    """
+    The asyncio counterpart of `follow_ticks`, over an AsyncQubiPy_RPC client. Hydration requests run
+    concurrently in windows of `2 * max_workers` ticks.
+    """
+    pacer = pacer or Tick_Pacer()
+    next_tick = start_tick
+
+    fetchers = {
+        'tick_data': rpc_client.get_tick_data,
+        'approved_transactions': rpc_client.get_approved_transaction_for_tick
+    }
+
+    async def fetch(tick: int) -> Any:
+        if isinstance(hydrate, str):
+            return await async_call_with_retries(fetchers[hydrate], tick, retries=retries)
+        return {target: await async_call_with_retries(fetchers[target], tick, retries=retries) for target in hydrate}
+
+    while True:
+        latest_tick = await async_call_with_retries(rpc_client.get_latest_tick, retries=retries)
+        if next_tick is None:
+            next_tick = latest_tick
+
+        new_ticks = latest_tick - next_tick + 1
+        pacer.observe(new_ticks)
+
+        while next_tick <= latest_tick:
+            window = range(next_tick, min(latest_tick, next_tick + 2 * max_workers - 1) + 1)
+
+            if hydrate is None:
+                for tick in window:
+                    yield tick
+            else:
+                results = await asyncio.gather(*(fetch(tick) for tick in window))
+                for tick, result in zip(window, results):
+                    yield tick, result
+
+            next_tick = window[-1] + 1
+
+        await asyncio.sleep(pacer.delay())
@@ -0,0 +1,292 @@
+"""
+transactions.py
+Trackers that confirm broadcast transactions per target tick instead of per transaction.
+Pending transactions are grouped by the tick they target; once the network has gone past a
+tick (the source reports a later tick), the whole group is resolved with a single request (the tick's approved transactions on
+the RPC server, or the tick's transaction statuses on the Core server) and the futures handed
+out by `track` are completed.
+"""
+
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set
+
+from qubipy.config import *
+from qubipy.exceptions import *
+from qubipy.concurrency import is_empty_tick, ordered_map
+from qubipy.models import field_of
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction_Status:
+    tx_id: str
+    target_tick: int
+    included: bool
+    money_flew: bool | None = None
+
+
+def _statuses(data: Any) -> Dict[str, Any]:
+    """
+    Maps the transaction IDs of a tick to their Core status (`moneyFlew`), or to None for RPC approved transactions.
+    """
+    if isinstance(data, dict):
+        data = data.get('transactions', data.get('transactionsStatus', []))
+        if isinstance(data, dict):
+            data = data.get('transactions', [])
+
+    return {field_of(entry, 'tx_id', 'txId'): entry.get('moneyFlew') if isinstance(entry, dict) else None for entry in data or ()}
+
+
+class _Transaction_Track:
+    """
+    State shared by the blocking and asyncio trackers: the futures of the pending transactions,
+    grouped by target tick, and the failed attempts of each tick.
+    """
+
+    def __init__(self, rpc_client, core_client, interval: float, max_workers: int, retries: int):
+        if rpc_client is None and core_client is None:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TRACKER_SOURCE)
+
+        self.rpc_client = rpc_client
+        self.core_client = core_client
+        self.interval = interval
+        self.max_workers = max_workers
+        self.retries = retries
+
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, List[Any]]] = {}
+        self._failures: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(group) for group in self._pending.values())
+
+    @property
+    def pending_ticks(self) -> List[int]:
+        with self._lock:
+            return sorted(self._pending)
+
+    def _add(self, tx_id: str, target_tick: int, future: Any) -> Any:
+        if not tx_id or not isinstance(tx_id, str):
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TX_ID)
+
+        if not isinstance(target_tick, int) or target_tick <= 0:
+            raise QubiPy_Exceptions(QubiPy_Exceptions.INVALID_TICK_ERROR)
+
+        with self._lock:
+            self._pending.setdefault(target_tick, {}).setdefault(tx_id, []).append(future)
+        return future
+
+    def _due(self, tick: int) -> List[int]:
+        """
+        Returns the target ticks the network has gone past: those before the tick reported by the
+        source, whichever client it is, so a tick is only resolved once a later one exists.
+        """
+        with self._lock:
+            return sorted(target for target in self._pending if target < tick)
+
+    def _resolve(self, target_tick: int, data: Any) -> int:
+        with self._lock:
+            group = self._pending.pop(target_tick, {})
+            self._failures.pop(target_tick, None)
+
+        statuses = _statuses(data)
+
+        for tx_id, futures in group.items():
+            status = Transaction_Status(tx_id, target_tick, tx_id in statuses, statuses.get(tx_id))
+            for future in futures:
+                if not future.done():
+                    future.set_result(status)
+
+        return len(group)
+
+    def _fail(self, target_tick: int, error: QubiPy_Exceptions):
+        """
+        Counts a failed attempt for a tick; after `retries` further attempts its futures get the error.
+        """
+        with self._lock:
+            self._failures[target_tick] = self._failures.get(target_tick, 0) + 1
+            if self._failures[target_tick] <= self.retries:
+                return
+            group = self._pending.pop(target_tick, {})
+            self._failures.pop(target_tick, None)
+
+        for futures in group.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+
+
+class Transaction_Tracker(_Transaction_Track):
+    def __init__(self, rpc_client=None, core_client=None, interval: float = WATCH_INTERVAL, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES):
+        """
+        Initializes a tracker over a QubiPy_RPC or a QubiPy_Core client.
+
+        With a Core client, each tick is resolved with `get_tick_transactions_status`, which also tells
+        whether money flew. Otherwise it is resolved with the RPC `get_approved_transaction_for_tick`.
+
+        Args:
+            rpc_client (QubiPy_RPC | None): Client used when no Core client is given.
+            core_client (QubiPy_Core | None): Client used in priority.
+            interval (float): Seconds between two polls in `run` and `start`.
+            max_workers (int): Maximum number of ticks resolved at the same time.
+            retries (int): Failed polls of a tick tolerated before its futures get the error.
+
+        Raises:
+            QubiPy_Exceptions: If neither client is given.
+        """
+        super().__init__(rpc_client, core_client, interval, max_workers, retries)
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def track(self, tx_id: str, target_tick: int) -> 'Future[Transaction_Status]':
+        """
+        Starts tracking a broadcast transaction.
+
+        Args:
+            tx_id (str): The transaction ID.
+            target_tick (int): The tick the transaction was built for.
+
+        Returns:
+            Future[Transaction_Status]: Completed once the target tick is resolved, or with the error of its last attempt.
+
+        Raises:
+            QubiPy_Exceptions: If the transaction ID or the target tick is invalid.
+        """
+        return self._add(tx_id, target_tick, Future())
+
+    def _current_tick(self) -> int:
+        if self.core_client is not None:
+            return field_of(self.core_client.get_tick_info(), 'tick', 'tick')
+        return self.rpc_client.get_latest_tick()
+
+    def _fetch(self, target_tick: int) -> Any:
+        try:
+            if self.core_client is not None:
+                return self.core_client.get_tick_transactions_status(target_tick)
+            return self.rpc_client.get_approved_transaction_for_tick(target_tick)
+        except QubiPy_Exceptions as E:
+            return [] if is_empty_tick(E) else E
+
+    def poll(self) -> int:
+        """
+        Resolves every group whose target tick has passed, with one request per tick. The transactions
+        of an empty or skipped tick are resolved as not included.
+
+        Returns:
+            int: The number of transactions resolved.
+
+        Raises:
+            QubiPy_Exceptions: If the current tick cannot be read.
+        """
+        if not len(self):
+            return 0
+
+        resolved = 0
+
+        with contextlib.closing(ordered_map(self._fetch, self._due(self._current_tick()), self.max_workers)) as results:
+            for target_tick, data in results:
+                if isinstance(data, QubiPy_Exceptions):
+                    self._fail(target_tick, data)
+                else:
+                    resolved += self._resolve(target_tick, data)
+
+        return resolved
+
+    def run(self, stop: threading.Event | None = None):
+        """
+        Polls until `stop` is set. Errors reading the current tick are retried at the next poll.
+        """
+        stop = stop or self._stop
+        while not stop.is_set():
+            with contextlib.suppress(QubiPy_Exceptions):
+                self.poll()
+            stop.wait(self.interval)
+
+    def start(self) -> 'Transaction_Tracker':
+        """
+        Runs the tracker in a background thread until `close` is called.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name='qubipy-tx-tracker', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """
+        Stops the background thread, if any. Transactions still pending keep their futures.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class Async_Transaction_Tracker(_Transaction_Track):
+    def __init__(self, rpc_client=None, core_client=None, interval: float = WATCH_INTERVAL, max_workers: int = BULK_MAX_WORKERS, retries: int = BULK_RETRIES):
+        """
+        Initializes a tracker over an AsyncQubiPy_RPC or an AsyncQubiPy_Core client. The arguments are
+        those of Transaction_Tracker.
+        """
+        super().__init__(rpc_client, core_client, interval, max_workers, retries)
+
+    def track(self, tx_id: str, target_tick: int) -> 'asyncio.Future[Transaction_Status]':
+        """
+        The asyncio counterpart of `Transaction_Tracker.track`. Must be called from the running event loop.
+        """
+        return self._add(tx_id, target_tick, asyncio.get_running_loop().create_future())
+
+    async def _current_tick(self) -> int:
+        if self.core_client is not None:
+            return field_of(await self.core_client.get_tick_info(), 'tick', 'tick')
+        return await self.rpc_client.get_latest_tick()
+
+    async def _fetch(self, semaphore: asyncio.Semaphore, target_tick: int) -> Any:
+        async with semaphore:
+            try:
+                if self.core_client is not None:
+                    return await self.core_client.get_tick_transactions_status(target_tick)
+                return await self.rpc_client.get_approved_transaction_for_tick(target_tick)
+            except QubiPy_Exceptions as E:
+                return [] if is_empty_tick(E) else E
+
+    async def poll(self) -> int:
+        """
+        The asyncio counterpart of `Transaction_Tracker.poll`.
+        """
+        if not len(self):
+            return 0
+
+        due = self._due(await self._current_tick())
+        semaphore = asyncio.Semaphore(self.max_workers)
+        results = await asyncio.gather(*(self._fetch(semaphore, target_tick) for target_tick in due))
+        resolved = 0
+
+        for target_tick, data in zip(due, results):
+            if isinstance(data, QubiPy_Exceptions):
+                self._fail(target_tick, data)
+            else:
+                resolved += self._resolve(target_tick, data)
+
+        return resolved
+
+    async def run(self, stop: asyncio.Event | None = None):
+        """
+        Polls until `stop` is set. Errors reading the current tick are retried at the next poll.
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            with contextlib.suppress(QubiPy_Exceptions):
+                await self.poll()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), self.interval)
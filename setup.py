@@ -11,6 +11,12 @@ install_requires = [
     'urllib3>=2.2.3',
 ]
 
+extras_require = {
+    'async': ['aiohttp>=3.9.0'],
+    'fast': ['orjson>=3.8.0'],
+    'columnar': ['numpy>=1.24.0', 'pyarrow>=12.0.0'],
+}
+
 setup(
     name="QubiPy",
     version=__version__,
@@ -19,6 +25,7 @@ setup(
         'qubipy.crypto': ['*.dll', '*.dylib', '*.so'],
     },
     install_requires=install_requires,
+    extras_require=extras_require,
     include_package_data=True,
     description="QubiPy, a Python Library for the QUBIC RPC API",
     long_description=long_description,
@@ -0,0 +1,147 @@
+import pytest
+from unittest.mock import patch, Mock
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.cache.archive import *
+from ..conftest import *
+
+""" TICK ARCHIVE TESTS """
+
+@pytest.fixture
+def archive():
+    with Tick_Archive() as archive:
+        yield archive
+
+def build_response(payload):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    return response
+
+def test_archive_put_and_get(archive):
+    """
+    Test that archived values are returned unchanged and unknown ticks return None.
+    """
+    assert archive.put(ARCHIVE_TICK_DATA, 100, {'epoch': 150, 'tickNumber': 100})
+    assert archive.get(ARCHIVE_TICK_DATA, 100) == {'epoch': 150, 'tickNumber': 100}
+    assert archive.get(ARCHIVE_TICK_DATA, 101) is None
+    assert archive.get(ARCHIVE_CHAIN_HASH, 100) is None
+
+def test_archive_skips_empty_values_until_final(archive):
+    """
+    Test that empty responses are only archived for ticks that are known to be final.
+    """
+    assert not archive.put(ARCHIVE_TICK_DATA, 100, {})
+    assert archive.get(ARCHIVE_TICK_DATA, 100) is None
+
+    archive.set_final_tick(100)
+    assert archive.put(ARCHIVE_TICK_DATA, 100, {})
+    assert archive.get(ARCHIVE_TICK_DATA, 100) == {}
+
+def test_archive_persists_to_disk(tmp_path):
+    """
+    Test that archived ticks and the final tick survive reopening the database.
+    """
+    path = str(tmp_path / 'ticks.db')
+
+    with Tick_Archive(path) as archive:
+        archive.put(ARCHIVE_CHAIN_HASH, 7, 'abcdef')
+        archive.set_final_tick(9)
+
+    with Tick_Archive(path) as archive:
+        assert archive.get(ARCHIVE_CHAIN_HASH, 7) == 'abcdef'
+        assert archive.final_tick == 9
+
+def test_archive_invalid_kind(archive):
+    """
+    Test that unknown kinds raise a QubiPy_Exceptions with INVALID_ARCHIVE_KIND.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        archive.get('balances', 1)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_ARCHIVE_KIND
+
+def test_rpc_reads_through_archive(archive, rpc_client):
+    """
+    Test that the RPC client serves archived ticks without any request and archives fetched ticks.
+    """
+    rpc_client.archive = archive
+    archive.put(ARCHIVE_TICK_DATA, 100, {'tickNumber': 100})
+
+    with patch('requests.Session.get', return_value=build_response({'hexDigest': 'ff00'})) as mock_get:
+        assert rpc_client.get_tick_data(100) == {'tickNumber': 100}
+        mock_get.assert_not_called()
+
+        assert rpc_client.get_chain_hash(100) == 'ff00'
+        assert rpc_client.get_chain_hash(100) == 'ff00'
+        mock_get.assert_called_once()
+
+    assert archive.get(ARCHIVE_CHAIN_HASH, 100) == 'ff00'
+
+def test_archive_sync_fetches_only_missing_ticks(archive, rpc_client):
+    """
+    Test that sync only requests missing ticks, stops at the last processed tick and
+    archives empty ticks below it.
+    """
+    archive.put(ARCHIVE_TICK_DATA, 2, {'tickNumber': 2})
+    fetched = []
+
+    def fake_tick_data(tick):
+        fetched.append(tick)
+        return {} if tick == 3 else {'tickNumber': tick}
+
+    with patch.object(rpc_client, 'get_rpc_status', return_value={'lastProcessedTick': {'tickNumber': 4}}), \
+         patch.object(rpc_client, 'get_tick_data', side_effect=fake_tick_data):
+        added = archive.sync(rpc_client, 1, 10, kinds=[ARCHIVE_TICK_DATA])
+
+    assert sorted(fetched) == [1, 3, 4]
+    assert added == 3
+    assert archive.final_tick == 4
+    assert archive.get(ARCHIVE_TICK_DATA, 3) == {}
+    assert list(archive.missing_ticks(ARCHIVE_TICK_DATA, 1, 6)) == [5, 6]
+
+    with patch.object(rpc_client, 'get_rpc_status', return_value={'lastProcessedTick': {'tickNumber': 4}}), \
+         patch.object(rpc_client, 'get_tick_data') as mock_tick_data:
+        assert archive.sync(rpc_client, 1, 4, kinds=[ARCHIVE_TICK_DATA]) == 0
+        mock_tick_data.assert_not_called()
+
+def test_archive_put_many_counts_inserted_rows(archive):
+    """
+    Test that put_many only counts the values it inserted, not the ticks already archived.
+    """
+    archive.put(ARCHIVE_TICK_DATA, 1, {'tickNumber': 1})
+
+    assert archive.put_many(ARCHIVE_TICK_DATA, [(1, {'tickNumber': 1}), (2, {'tickNumber': 2}), (3, {})]) == 1
+    assert not archive.put(ARCHIVE_TICK_DATA, 2, {'tickNumber': 2})
+
+def test_archive_sync_batches_with_an_archiving_client(archive, rpc_client):
+    """
+    Test that a client reading through the archive does not write each synced tick on its own.
+    """
+    rpc_client.archive = archive
+
+    with patch.object(rpc_client, 'get_rpc_status', return_value={'lastProcessedTick': {'tickNumber': 5}}), \
+         patch('requests.Session.get', return_value=build_response({'tickData': {'tickNumber': 1}})), \
+         patch.object(archive, 'put', wraps=archive.put) as mock_put:
+        assert archive.sync(rpc_client, 1, 5, kinds=[ARCHIVE_TICK_DATA]) == 5
+
+    mock_put.assert_not_called()
+    assert rpc_client.archive is archive
+    assert list(archive.missing_ticks(ARCHIVE_TICK_DATA, 1, 5)) == []
+
+def test_archive_sync_keeps_progress_on_failure(archive, rpc_client):
+    """
+    Test that ticks fetched before a failing tick are kept in the archive.
+    """
+    def fake_store_hash(tick):
+        if tick == 3:
+            raise QubiPy_Exceptions("Failed to retrieve the store hash")
+        return {'digest': tick}
+
+    with patch.object(rpc_client, 'get_rpc_status', return_value={}), \
+         patch.object(rpc_client, 'get_store_hash', side_effect=fake_store_hash), \
+         patch('qubipy.concurrency.time.sleep'):
+        with pytest.raises(QubiPy_Exceptions):
+            archive.sync(rpc_client, 1, 5, kinds=[ARCHIVE_STORE_HASH], max_workers=1)
+
+    assert archive.get(ARCHIVE_STORE_HASH, 2) == {'digest': 2}
+    assert list(archive.missing_ticks(ARCHIVE_STORE_HASH, 1, 5))[0] == 3
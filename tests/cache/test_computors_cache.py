@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import patch, Mock
+from qubipy.cache.computors import Computors_Cache
+from ..conftest import *
+
+""" COMPUTORS CACHE TESTS """
+
+def build_response(payload):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    return response
+
+def test_closed_epochs_never_expire():
+    """
+    Test that the current epoch expires after its TTL while closed epochs are kept forever.
+    """
+    cache = Computors_Cache(current_ttl=10)
+
+    with patch('qubipy.cache.computors.time.monotonic', return_value=1000):
+        cache.put(150, {'epoch': 150})
+        cache.put(151, {'epoch': 151})
+        cache.set_current_epoch(151)
+        assert cache.get(151) == {'epoch': 151}
+
+    with patch('qubipy.cache.computors.time.monotonic', return_value=1011):
+        assert cache.get(150) == {'epoch': 150}
+        assert cache.get(151) is None
+
+def test_unconfirmed_epochs_are_not_served_or_closed():
+    """
+    Test that the highest epoch seen is not assumed to be current: without a confirmation it is
+    neither served nor used to close earlier epochs.
+    """
+    cache = Computors_Cache()
+    cache.put(150, {'epoch': 150})
+    cache.put(151, {'epoch': 151})
+
+    assert cache.needs_current_epoch(150)
+    assert cache.get(150) is None and cache.get(151) is None
+
+    cache.set_current_epoch(152)
+
+    assert not cache.needs_current_epoch(151)
+    assert cache.get(150) == {'epoch': 150} and cache.get(151) == {'epoch': 151}
+
+def test_current_requires_confirmation():
+    """
+    Test that get_current only returns an epoch confirmed as current by the API or the caller.
+    """
+    cache = Computors_Cache()
+    cache.put(140, {'epoch': 140})
+    assert cache.get_current() is None
+
+    cache.set_current_epoch(150)
+    assert cache.get(140) == {'epoch': 140}
+    assert cache.get_current() is None
+
+    cache.put(150, {'epoch': 150}, is_current=True)
+    assert cache.get_current() == {'epoch': 150}
+
+def test_closed_epochs_persist_to_disk(tmp_path):
+    """
+    Test that closed epochs are written to disk and reloaded, and the current one is not.
+    """
+    path = str(tmp_path / 'computors.json')
+
+    cache = Computors_Cache(path)
+    cache.put(150, {'epoch': 150})
+    cache.put(151, {'epoch': 151}, is_current=True)
+
+    reloaded = Computors_Cache(path)
+    assert reloaded.get(150) == {'epoch': 150}
+    assert reloaded.get(151) is None
+    assert reloaded.current_epoch == 0
+    assert reloaded.needs_current_epoch(151) and not reloaded.needs_current_epoch(150)
+
+def test_rpc_get_computors_uses_cache(rpc_client, mock_computors_response, sample_computors_data):
+    """
+    Test that QubiPy_RPC.get_computors only hits the network once per epoch.
+    """
+    rpc_client.computors_cache = Computors_Cache()
+
+    with patch('requests.Session.get', return_value=mock_computors_response) as mock_get, \
+         patch.object(rpc_client, 'get_tick_info', return_value={'tick': 15000000, 'epoch': 135}) as mock_tick_info:
+        assert rpc_client.get_computors(134) == sample_computors_data
+        assert rpc_client.get_computors(134) == sample_computors_data
+        mock_get.assert_called_once()
+
+    mock_tick_info.assert_called_once()
+
+def test_rpc_get_computors_confirms_the_current_epoch(rpc_client, mock_computors_response, sample_computors_data):
+    """
+    Test that the current epoch's entry is refetched once its TTL expires, and served for good once the epoch is closed.
+    """
+    rpc_client.computors_cache = Computors_Cache(current_ttl=10)
+
+    with patch('requests.Session.get', return_value=mock_computors_response) as mock_get, \
+         patch.object(rpc_client, 'get_tick_info', return_value={'tick': 15000000, 'epoch': 134}) as mock_tick_info:
+        with patch('qubipy.cache.computors.time.monotonic', return_value=1000):
+            rpc_client.get_computors(134)
+            rpc_client.get_computors(134)
+        assert mock_get.call_count == 1
+
+        with patch('qubipy.cache.computors.time.monotonic', return_value=1011):
+            rpc_client.get_computors(134)
+        assert mock_get.call_count == 2
+
+        mock_tick_info.return_value = {'tick': 15100000, 'epoch': 135}
+        with patch('qubipy.cache.computors.time.monotonic', return_value=1030):
+            rpc_client.get_computors(134)
+            rpc_client.get_computors(134)
+
+    assert mock_get.call_count == 2
+    assert mock_tick_info.call_count == 3
+    assert rpc_client.computors_cache.current_epoch == 135
+
+def test_core_get_computors_shares_cache(core_client, rpc_client, sample_computors_data):
+    """
+    Test that QubiPy_Core.get_computors caches the current epoch and fills the cache shared with QubiPy_RPC.
+    """
+    cache = Computors_Cache()
+    core_client.computors_cache = cache
+    rpc_client.computors_cache = cache
+
+    with patch('requests.Session.get', return_value=build_response({'computors': sample_computors_data})) as mock_get:
+        assert core_client.get_computors() == {'computors': sample_computors_data}
+        assert core_client.get_computors() == {'computors': sample_computors_data}
+        assert rpc_client.get_computors(134) == sample_computors_data
+        mock_get.assert_called_once()
+
+def test_core_get_computors_same_shape_on_hit_and_miss(core_client, sample_computors_data):
+    """
+    Test that QubiPy_Core.get_computors returns the same dictionary from the server and from the cache.
+    """
+    core_client.computors_cache = Computors_Cache()
+    payload = {'computors': sample_computors_data, 'extra': 'dropped'}
+
+    with patch('requests.Session.get', return_value=build_response(payload)) as mock_get:
+        miss = core_client.get_computors()
+        hit = core_client.get_computors()
+
+    mock_get.assert_called_once()
+    assert miss == hit == {'computors': sample_computors_data}
@@ -0,0 +1,122 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch, Mock
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.config import TTL_CACHE_PRUNE_MIN
+from qubipy.endpoints_rpc import LATEST_TICK, TICK_INFO
+from qubipy.endpoints_core import CORE_TICK_INFO
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.transport.session import QubiPy_Session
+from ..conftest import *
+
+""" TTL CACHE TESTS """
+
+def test_ttl_cache_expires_entries():
+    """
+    Test that a cached value is served until its TTL elapses and fetched again afterwards.
+    """
+    cache = TTL_Cache({LATEST_TICK: 1})
+    fetch = Mock(side_effect=[1, 2])
+
+    with patch('qubipy.cache.ttl.time.monotonic', return_value=100):
+        assert cache.get_or_fetch('key', 1, fetch) == 1
+        assert cache.get_or_fetch('key', 1, fetch) == 1
+
+    with patch('qubipy.cache.ttl.time.monotonic', return_value=101.5):
+        assert cache.get_or_fetch('key', 1, fetch) == 2
+
+    assert fetch.call_count == 2
+
+def test_ttl_cache_prunes_expired_entries():
+    """
+    Test that expired entries are dropped as new keys are stored, while fresh ones are kept.
+    """
+    cache = TTL_Cache({LATEST_TICK: 1})
+
+    with patch('qubipy.cache.ttl.time.monotonic', return_value=100):
+        cache.get_or_fetch('expired', 1, lambda: 'old')
+        cache.get_or_fetch('fresh', 60, lambda: 'kept')
+
+    with patch('qubipy.cache.ttl.time.monotonic', return_value=110):
+        for index in range(TTL_CACHE_PRUNE_MIN):
+            cache.get_or_fetch(('tick', index), 1, lambda: index)
+
+    assert 'expired' not in cache._entries
+    assert cache._entries['fresh'][0] == 'kept'
+    assert len(cache._entries) == TTL_CACHE_PRUNE_MIN + 1
+
+def test_ttl_cache_coalesces_concurrent_requests():
+    """
+    Test that concurrent misses on the same key trigger a single fetch shared by every caller.
+    """
+    cache = TTL_Cache({})
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return 'latest'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch('key', 1, fetch))) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['latest'] * 20
+    assert len(calls) == 1
+
+def test_ttl_cache_shares_errors_without_caching_them():
+    """
+    Test that an error is raised for the fetching caller and that the next call fetches again.
+    """
+    cache = TTL_Cache({})
+    fetch = Mock(side_effect=[QubiPy_Exceptions("Network error"), 'ok'])
+
+    with pytest.raises(QubiPy_Exceptions):
+        cache.get_or_fetch('key', 1, fetch)
+
+    assert cache.get_or_fetch('key', 1, fetch) == 'ok'
+
+def test_ttl_cache_matches_endpoint_paths():
+    """
+    Test that TTLs are looked up by endpoint path and ignore the query string.
+    """
+    cache = TTL_Cache.hot_endpoints(ttl=2)
+
+    assert cache.ttl_for(f'{RPC_URL}{LATEST_TICK}') == 2
+    assert cache.ttl_for(f'{RPC_URL}{TICK_INFO}?x=1') == 2
+    assert cache.ttl_for(f'{CORE_URL}{CORE_TICK_INFO}') == 2
+    assert cache.ttl_for(f'{RPC_URL}/balances/ABC') is None
+
+def test_session_serves_cached_endpoints():
+    """
+    Test that the session only caches successful GET requests to configured endpoints.
+    """
+    session = QubiPy_Session(response_cache=TTL_Cache({LATEST_TICK: 60}))
+    ok_response = Mock(ok=True)
+
+    with patch.object(QubiPy_Session, '_send', return_value=ok_response) as mock_send:
+        assert session.get(f'{RPC_URL}{LATEST_TICK}') is ok_response
+        assert session.get(f'{RPC_URL}{LATEST_TICK}') is ok_response
+        assert mock_send.call_count == 1
+
+        session.get(f'{RPC_URL}/balances/ABC')
+        session.get(f'{RPC_URL}/balances/ABC')
+        assert mock_send.call_count == 3
+
+        session.post(f'{RPC_URL}{LATEST_TICK}')
+        assert mock_send.call_count == 4
+
+    error_response = Mock(ok=False)
+    session.response_cache.clear()
+
+    with patch.object(QubiPy_Session, '_send', return_value=error_response) as mock_send:
+        session.get(f'{RPC_URL}{LATEST_TICK}')
+        session.get(f'{RPC_URL}{LATEST_TICK}')
+        assert mock_send.call_count == 2
@@ -0,0 +1,94 @@
+import pytest
+import asyncio
+import inspect
+from unittest.mock import patch, Mock, AsyncMock
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.core.async_core_client import AsyncQubiPy_Core
+from qubipy.transport.async_session import QubiPy_AsyncSession
+from ..conftest import *
+
+CORE_CALLS = [
+    ('get', 'get_computors', ()),
+    ('post', 'get_entity_info', ('ENTITY',)),
+    ('post', 'get_tick_data', (17021024,)),
+    ('get', 'get_tick_info', ()),
+    ('post', 'get_tick_quorum_vote', (17021024,)),
+    ('post', 'get_tick_transactions', (17021024,)),
+    ('post', 'get_tick_transactions_status', (17021024,)),
+    ('get', 'get_active_bets', ()),
+    ('get', 'get_active_bets_by_creator', ('CREATOR',)),
+    ('get', 'get_basic_info', ()),
+    ('get', 'get_bet_info', (1,)),
+    ('get', 'get_bettors_by_bet_options', (1, 1)),
+    ('get', 'get_qx_asset_ask_orders', ('QX', 'ISSUER', '0')),
+    ('get', 'get_qx_asset_bid_orders', ('QX', 'ISSUER', '0')),
+    ('get', 'get_qx_entity_ask_orders', ('ENTITY', '0')),
+    ('get', 'get_qx_entity_bid_orders', ('ENTITY', '0')),
+    ('get', 'get_qx_fees', ()),
+    ('get', 'get_monero_mining_stats', ()),
+]
+
+@pytest.fixture
+def async_core_client():
+    return AsyncQubiPy_Core(core_url=CORE_URL)
+
+def build_mock_response():
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.side_effect = lambda: {'transactions': [{'txId': 'abc'}], 'pool_blocks_found': 5}
+    return response
+
+def test_async_client_exposes_every_core_method():
+    """
+    Test that every public method of QubiPy_Core has a coroutine counterpart on AsyncQubiPy_Core.
+    """
+    for name, member in inspect.getmembers(QubiPy_Core, inspect.isfunction):
+        if name.startswith('get_'):
+            assert inspect.iscoroutinefunction(getattr(AsyncQubiPy_Core, name)), name
+
+@pytest.mark.parametrize("http_method, method_name, args", CORE_CALLS)
+def test_async_core_matches_sync_client(http_method, method_name, args, core_client, async_core_client):
+    """
+    Test that each async method sends the same request and returns the same
+    result as its blocking counterpart.
+    """
+    with patch(f'requests.Session.{http_method}', return_value=build_mock_response()) as mock_sync:
+        expected = getattr(core_client, method_name)(*args)
+
+    with patch.object(QubiPy_AsyncSession, http_method, new_callable=AsyncMock, return_value=build_mock_response()) as mock_async:
+        result = asyncio.run(getattr(async_core_client, method_name)(*args))
+
+    assert result == expected
+    assert mock_async.call_args == mock_sync.call_args
+
+@pytest.mark.parametrize("method_name, args, expected_error", [
+    ('get_entity_info', (None,), QubiPy_Exceptions.INVALID_ADDRESS_ID),
+    ('get_tick_transactions', (None,), QubiPy_Exceptions.INVALID_TICK_ERROR),
+    ('get_bettors_by_bet_options', (1, None), QubiPy_Exceptions.INVALID_BET_OPTIONS),
+    ('get_qx_asset_ask_orders', ('QX', None, '0'), QubiPy_Exceptions.INVALID_QX_ASSET_DATA),
+])
+def test_async_core_validation(method_name, args, expected_error, async_core_client):
+    """
+    Test that the async client validates input before sending any request.
+    """
+    with patch.object(QubiPy_AsyncSession, 'get', new_callable=AsyncMock) as mock_get, \
+         patch.object(QubiPy_AsyncSession, 'post', new_callable=AsyncMock) as mock_post:
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            asyncio.run(getattr(async_core_client, method_name)(*args))
+
+    assert str(exc_info.value) == expected_error
+    mock_get.assert_not_called()
+    mock_post.assert_not_called()
+
+def test_async_core_request_error(async_core_client):
+    """
+    Test that aiohttp errors are raised as QubiPy_Exceptions.
+    """
+    with patch.object(QubiPy_AsyncSession, 'post', new_callable=AsyncMock, side_effect=aiohttp.ClientConnectionError("Network error")):
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            asyncio.run(async_core_client.get_tick_data(17021024))
+
+    assert str(exc_info.value) == "Error when getting tick data: Network error"
@@ -18,7 +18,7 @@ def test_get_tick_data_success(mock_tick_data_core_response, sample_tick_data_co
     Verifies that the function returns the expected tick data when the API
     responds successfully.
     """
-    with patch('requests.post', return_value=mock_tick_data_core_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_tick_data_core_response) as mock_post:
         result = core_client.get_tick_data(sample_tick)
         
         assert result == sample_tick_data_core
@@ -52,7 +52,7 @@ def test_get_tick_data_http_error(mock_http_error_response, core_client, sample_
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.post', return_value=mock_http_error_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_http_error_response) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_data(sample_tick)
         
@@ -73,7 +73,7 @@ def test_get_tick_data_request_exception(core_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.post', side_effect=requests.RequestException("Network error")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.RequestException("Network error")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_data(sample_tick)
         
@@ -94,7 +94,7 @@ def test_get_tick_data_timeout(core_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_data(sample_tick)
         
@@ -117,7 +117,7 @@ def test_get_tick_info_success(mock_tick_info_response, sample_tick_info_data, c
     Verifies that the function returns the expected tick info when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_tick_info_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_tick_info_response) as mock_get:
         result = core_client.get_tick_info()
         
         assert result == sample_tick_info_data
@@ -136,7 +136,7 @@ def test_get_tick_info_http_error(mock_http_error_response, core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_info()
         
@@ -154,7 +154,7 @@ def test_get_tick_info_request_exception(core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_info()
         
@@ -172,7 +172,7 @@ def test_get_tick_info_timeout(core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_info()
         
@@ -192,7 +192,7 @@ def test_get_tick_quorum_vote_success(mock_quorum_vote_response, sample_quorum_v
     Verifies that the function returns the expected quorum vote data when the API
     responds successfully.
     """
-    with patch('requests.post', return_value=mock_quorum_vote_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_quorum_vote_response) as mock_post:
         result = core_client.get_tick_quorum_vote(sample_tick)
         
         assert result == sample_quorum_vote_data
@@ -223,7 +223,7 @@ def test_get_tick_quorum_vote_http_error(mock_http_error_response, core_client,
     """
     Test the get_tick_quorum_vote method for handling an HTTP error response.
     """
-    with patch('requests.post', return_value=mock_http_error_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_http_error_response) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_quorum_vote(sample_tick)
         
@@ -241,7 +241,7 @@ def test_get_tick_quorum_vote_request_exception(core_client, sample_tick):
     """
     Test the get_tick_quorum_vote method for handling a network-related exception.
     """
-    with patch('requests.post', side_effect=requests.RequestException("Network error")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.RequestException("Network error")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_quorum_vote(sample_tick)
         
@@ -259,7 +259,7 @@ def test_get_tick_quorum_vote_timeout(core_client, sample_tick):
     """
     Test the get_tick_quorum_vote method for handling a timeout exception.
     """
-    with patch('requests.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_quorum_vote(sample_tick)
         
@@ -282,7 +282,7 @@ def test_get_tick_transactions_success(mock_tick_transactions_response, sample_t
     Verifies that the function returns the expected transactions when the API
     responds successfully.
     """
-    with patch('requests.post', return_value=mock_tick_transactions_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_tick_transactions_response) as mock_post:
         result = core_client.get_tick_transactions(sample_tick)
         
         assert result == sample_tick_transactions_data
@@ -313,7 +313,7 @@ def test_get_tick_transactions_http_error(mock_http_error_response, core_client,
     """
     Test the get_tick_transactions method for handling an HTTP error response.
     """
-    with patch('requests.post', return_value=mock_http_error_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_http_error_response) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_transactions(sample_tick)
         
@@ -331,7 +331,7 @@ def test_get_tick_transactions_request_exception(core_client, sample_tick):
     """
     Test the get_tick_transactions method for handling a network-related exception.
     """
-    with patch('requests.post', side_effect=requests.RequestException("Network error")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.RequestException("Network error")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_transactions(sample_tick)
         
@@ -349,7 +349,7 @@ def test_get_tick_transactions_timeout(core_client, sample_tick):
     """
     Test the get_tick_transactions method for handling a timeout exception.
     """
-    with patch('requests.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_tick_transactions(sample_tick)
         
@@ -17,7 +17,7 @@ def test_get_active_bets_success(mock_active_bets_response, sample_active_bets_d
     Verifies that the function returns the expected list of active bet IDs when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_active_bets_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_active_bets_response) as mock_get:
         result = core_client.get_active_bets()
         
         assert result == sample_active_bets_data
@@ -36,7 +36,7 @@ def test_get_active_bets_http_error(mock_http_error_response, core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets()
         
@@ -54,7 +54,7 @@ def test_get_active_bets_request_exception(core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets()
         
@@ -72,7 +72,7 @@ def test_get_active_bets_timeout(mock_timeout_response, core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets()
         
@@ -92,7 +92,7 @@ def test_get_active_bets_by_creator_success(mock_active_bets_by_creator_response
     Verifies that the function returns the expected list of active bet IDs for a specific creator
     when the API responds successfully.
     """
-    with patch('requests.get', return_value=mock_active_bets_by_creator_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_active_bets_by_creator_response) as mock_get:
         result = core_client.get_active_bets_by_creator(sample_creator_id)
         
         assert result == sample_active_bets_by_creator_data
@@ -121,7 +121,7 @@ def test_get_active_bets_by_creator_http_error(mock_http_error_response, core_cl
     """
     Test the get_active_bets_by_creator method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets_by_creator(sample_creator_id)
         
@@ -137,7 +137,7 @@ def test_get_active_bets_by_creator_request_exception(core_client, sample_creato
     """
     Test the get_active_bets_by_creator method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets_by_creator(sample_creator_id)
         
@@ -153,7 +153,7 @@ def test_get_active_bets_by_creator_timeout(mock_timeout_response, core_client,
     """
     Test the get_active_bets_by_creator method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_active_bets_by_creator(sample_creator_id)
         
@@ -174,7 +174,7 @@ def test_get_basic_info_success(mock_basic_info_response, sample_basic_info_data
     Verifies that the function returns the expected basic information when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_basic_info_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_basic_info_response) as mock_get:
         result = core_client.get_basic_info()
         
         assert result == sample_basic_info_data
@@ -193,7 +193,7 @@ def test_get_basic_info_http_error(mock_http_error_response, core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_basic_info()
         
@@ -211,7 +211,7 @@ def test_get_basic_info_request_exception(core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_basic_info()
         
@@ -229,7 +229,7 @@ def test_get_basic_info_timeout(mock_timeout_response, core_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_basic_info()
         
@@ -249,7 +249,7 @@ def test_get_bet_info_success(mock_bet_info_response, sample_bet_info_data, core
     Verifies that the function returns the expected bet information when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_bet_info_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_bet_info_response) as mock_get:
         result = core_client.get_bet_info(sample_bet_id)
         
         assert result == sample_bet_info_data
@@ -278,7 +278,7 @@ def test_get_bet_info_http_error(mock_http_error_response, core_client, sample_b
     """
     Test the get_bet_info method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_bet_info(sample_bet_id)
         
@@ -294,7 +294,7 @@ def test_get_bet_info_request_exception(core_client, sample_bet_id):
     """
     Test the get_bet_info method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_bet_info(sample_bet_id)
         
@@ -310,7 +310,7 @@ def test_get_bet_info_timeout(mock_timeout_response, core_client, sample_bet_id)
     """
     Test the get_bet_info method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_bet_info(sample_bet_id)
         
@@ -21,7 +21,7 @@ def test_get_qx_asset_ask_orders_success(mock_qx_ask_orders_response, sample_qx_
     Verifies that the function returns the expected ask orders when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_qx_ask_orders_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_qx_ask_orders_response) as mock_get:
         result = core_client.get_qx_asset_ask_orders(
             sample_qx_params['asset_name'],
             sample_qx_params['issuer_id'],
@@ -58,7 +58,7 @@ def test_get_qx_asset_ask_orders_http_error(mock_http_error_response, core_clien
     """
     Test the get_qx_asset_ask_orders method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_asset_ask_orders(
                 sample_qx_params['asset_name'],
@@ -82,7 +82,7 @@ def test_get_qx_asset_ask_orders_request_exception(core_client, sample_qx_params
     """
     Test the get_qx_asset_ask_orders method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_asset_ask_orders(
                 sample_qx_params['asset_name'],
@@ -106,7 +106,7 @@ def test_get_qx_asset_ask_orders_timeout(core_client, sample_qx_params):
     """
     Test the get_qx_asset_ask_orders method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_asset_ask_orders(
                 sample_qx_params['asset_name'],
@@ -135,7 +135,7 @@ def test_get_qx_asset_bid_orders_success(mock_qx_bid_orders_response, sample_qx_
     Verifies that the function returns the expected bid orders when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_qx_bid_orders_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_qx_bid_orders_response) as mock_get:
         result = core_client.get_qx_asset_bid_orders(
             sample_qx_params['asset_name'],
             sample_qx_params['issuer_id'],
@@ -172,7 +172,7 @@ def test_get_qx_asset_bid_orders_http_error(mock_http_error_response, core_clien
    """
    Test the get_qx_asset_bid_orders method for handling an HTTP error response.
    """
-   with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+   with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
        with pytest.raises(QubiPy_Exceptions) as exc_info:
            core_client.get_qx_asset_bid_orders(
                sample_qx_params['asset_name'],
@@ -196,7 +196,7 @@ def test_get_qx_asset_bid_orders_request_exception(core_client, sample_qx_params
    """
    Test the get_qx_asset_bid_orders method for handling a network-related exception.
    """
-   with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+   with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
        with pytest.raises(QubiPy_Exceptions) as exc_info:
            core_client.get_qx_asset_bid_orders(
                sample_qx_params['asset_name'],
@@ -220,7 +220,7 @@ def test_get_qx_asset_bid_orders_timeout(core_client, sample_qx_params):
    """
    Test the get_qx_asset_bid_orders method for handling a timeout exception.
    """
-   with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+   with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
        with pytest.raises(QubiPy_Exceptions) as exc_info:
            core_client.get_qx_asset_bid_orders(
                sample_qx_params['asset_name'],
@@ -249,7 +249,7 @@ def test_get_qx_entity_ask_orders_success(mock_entity_ask_orders_response, sampl
     Verifies that the function returns the expected entity ask orders when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_entity_ask_orders_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_entity_ask_orders_response) as mock_get:
         result = core_client.get_qx_entity_ask_orders(sample_entity_id)
         
         assert result == sample_entity_ask_orders_data
@@ -279,7 +279,7 @@ def test_get_qx_entity_ask_orders_http_error(mock_http_error_response, core_clie
     """
     Test the get_qx_entity_ask_orders method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_ask_orders(sample_entity_id)
         
@@ -295,7 +295,7 @@ def test_get_qx_entity_ask_orders_request_exception(core_client, sample_entity_i
     """
     Test the get_qx_entity_ask_orders method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_ask_orders(sample_entity_id)
         
@@ -311,7 +311,7 @@ def test_get_qx_entity_ask_orders_timeout(core_client, sample_entity_id):
     """
     Test the get_qx_entity_ask_orders method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_ask_orders(sample_entity_id)
         
@@ -331,7 +331,7 @@ def test_get_qx_entity_bid_orders_success(mock_entity_bid_orders_response, sampl
     Verifies that the function returns the expected entity bid orders when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_entity_bid_orders_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_entity_bid_orders_response) as mock_get:
         result = core_client.get_qx_entity_bid_orders(sample_entity_id)
         
         assert result == sample_entity_bid_orders_data
@@ -349,7 +349,7 @@ def test_get_qx_entity_bid_orders_with_offset(mock_entity_bid_orders_response, s
     Test the get_qx_entity_bid_orders method with optional offset parameter.
     """
     offset = "0"
-    with patch('requests.get', return_value=mock_entity_bid_orders_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_entity_bid_orders_response) as mock_get:
         result = core_client.get_qx_entity_bid_orders(sample_entity_id, offset)
         
         assert result == sample_entity_bid_orders_data
@@ -376,7 +376,7 @@ def test_get_qx_entity_bid_orders_http_error(mock_http_error_response, core_clie
     """
     Test the get_qx_entity_bid_orders method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_bid_orders(sample_entity_id)
         
@@ -392,7 +392,7 @@ def test_get_qx_entity_bid_orders_request_exception(core_client, sample_entity_i
     """
     Test the get_qx_entity_bid_orders method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_bid_orders(sample_entity_id)
         
@@ -408,7 +408,7 @@ def test_get_qx_entity_bid_orders_timeout(core_client, sample_entity_id):
     """
     Test the get_qx_entity_bid_orders method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_entity_bid_orders(sample_entity_id)
         
@@ -430,7 +430,7 @@ def test_get_qx_fees_success(mock_qx_fees_response, sample_qx_fees_data, core_cl
     Verifies that the function returns the expected QX fees when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_qx_fees_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_qx_fees_response) as mock_get:
         result = core_client.get_qx_fees()
         
         assert result == sample_qx_fees_data
@@ -446,7 +446,7 @@ def test_get_qx_fees_http_error(mock_http_error_response, core_client):
     """
     Test the get_qx_fees method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_fees()
         
@@ -461,7 +461,7 @@ def test_get_qx_fees_request_exception(core_client):
     """
     Test the get_qx_fees method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_fees()
         
@@ -476,7 +476,7 @@ def test_get_qx_fees_timeout(core_client):
     """
     Test the get_qx_fees method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             core_client.get_qx_fees()
         
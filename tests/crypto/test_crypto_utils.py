@@ -0,0 +1,103 @@
+import array
+import ctypes
+import pytest
+from qubipy.crypto.utils import *
+
+""" CRYPTO UTILS TESTS """
+
+SEED = b'a' * 55
+
+@pytest.fixture(scope='module')
+def keys():
+    subseed = get_subseed_from_seed(SEED)
+    private_key = get_private_key_from_subseed(subseed)
+    public_key = get_public_key_from_private_key(private_key)
+    return subseed, private_key, public_key
+
+def test_buffers_give_the_same_results_as_bytes(keys):
+    """
+    Test that bytearrays, memoryviews and ctypes arrays are accepted wherever bytes are.
+    """
+    subseed, private_key, public_key = keys
+
+    assert get_subseed_from_seed(bytearray(SEED)) == subseed
+    assert get_private_key_from_subseed(memoryview(bytearray(subseed))) == private_key
+    assert get_public_key_from_private_key((ctypes.c_uint8 * 32).from_buffer_copy(private_key)) == public_key
+    assert get_identity_from_public_key(memoryview(public_key)) == get_identity_from_public_key(public_key)
+
+def test_out_buffers_are_written_in_place(keys):
+    """
+    Test that results are written into caller buffers, including slices of a larger buffer.
+    """
+    subseed, private_key, public_key = keys
+    arena = bytearray(160)
+    view = memoryview(arena)
+
+    get_private_key_from_subseed(subseed, out=view[0:32])
+    get_public_key_from_private_key(view[0:32], out=view[32:64])
+    get_public_key_from_identity(get_identity_from_public_key(public_key), out=view[64:96])
+    digest = kangaroo_twelve(b'message', 7, 32)
+    sign(subseed, view[32:64], digest, out=view[96:160])
+
+    assert arena[0:32] == private_key
+    assert arena[32:64] == arena[64:96] == public_key
+    assert verify(public_key, digest, view[96:160])
+
+def test_kangaroo_twelve_hashes_a_prefix_in_place():
+    """
+    Test that only the first input_byte_len bytes are hashed, whatever the buffer type.
+    """
+    data = bytes(range(200))
+    expected = kangaroo_twelve(data[:120], 120, 32)
+
+    assert kangaroo_twelve(data, 120, 32) == expected
+    assert kangaroo_twelve(bytearray(data), 120, 32) == expected
+    assert kangaroo_twelve(memoryview(data), 120, 32) == expected
+    assert kangaroo_twelve(memoryview(bytearray(data))[::1], 120, 32) == expected
+
+    out = bytearray(64)
+    assert kangaroo_twelve(data, 120, 64, out=out) is out
+    assert out[:32] == kangaroo_twelve(data, 120, 64)[:32]
+
+def test_large_buffers_are_hashed_in_place():
+    """
+    Test that large, strided and non-byte buffers hash like the same bytes.
+    """
+    data = bytes(range(256)) * 16
+    expected = kangaroo_twelve(data, len(data), 32)
+
+    assert kangaroo_twelve(bytearray(data), len(data), 32) == expected
+    assert kangaroo_twelve(memoryview(bytearray(data)).cast('I'), len(data), 32) == expected
+    assert kangaroo_twelve(array.array('B', data), len(data), 32) == expected
+    assert kangaroo_twelve(memoryview(bytearray(data * 2))[::2], len(data), 32) == kangaroo_twelve((data * 2)[::2], len(data), 32)
+
+def test_input_buffer_can_be_resized_after_a_call():
+    """
+    Test that no export of a bytearray outlives the call it was passed to.
+    """
+    data = bytearray(b'abc')
+    kangaroo_twelve(data, 3, 32)
+    data.extend(b'def')
+
+    assert len(data) == 6
+
+@pytest.mark.parametrize("call", [
+    lambda: kangaroo_twelve(b'abc', 4, 32),
+    lambda: kangaroo_twelve(b'abc', 3, 32, out=bytearray(16)),
+    lambda: kangaroo_twelve(b'abc', 3, 32, out=bytes(32)),
+    lambda: get_private_key_from_subseed(bytes(32), out=memoryview(bytearray(64))[::2]),
+])
+def test_invalid_buffers_raise(call):
+    """
+    Test that short inputs and short or read-only outputs are rejected instead of overflowing.
+    """
+    with pytest.raises(ValueError):
+        call()
+
+def test_get_tx_hash_from_digest(keys):
+    """
+    Test that the transaction hash is the lowercase identity of the digest.
+    """
+    digest = kangaroo_twelve(b'tx', 2, 32)
+
+    assert get_tx_hash_from_digest(bytearray(digest)) == get_identity_from_public_key(digest, True).encode()
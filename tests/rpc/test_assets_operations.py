@@ -16,7 +16,7 @@ def test_get_issued_assets_success(mock_issued_assets_response, sample_issued_as
     Verifies that the function returns the expected list of issued assets when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_issued_assets_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_issued_assets_response) as mock_get:
         result = rpc_client.get_issued_assets(sample_identity)
         
         assert result == sample_issued_assets_data
@@ -47,7 +47,7 @@ def test_get_issued_assets_http_error(mock_http_error_response, rpc_client, samp
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_issued_assets(sample_identity)
         
@@ -65,7 +65,7 @@ def test_get_issued_assets_request_exception(rpc_client, sample_identity):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_issued_assets(sample_identity)
         
@@ -83,7 +83,7 @@ def test_get_issued_assets_timeout(mock_timeout_response, rpc_client, sample_ide
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_issued_assets(sample_identity)
         
@@ -103,7 +103,7 @@ def test_get_owned_assets_success(mock_owned_assets_response, sample_owned_asset
     Verifies that the function returns the expected list of owned assets when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_owned_assets_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_owned_assets_response) as mock_get:
         result = rpc_client.get_owned_assets(sample_identity)
         
         assert result == sample_owned_assets_data
@@ -134,7 +134,7 @@ def test_get_owned_assets_http_error(mock_http_error_response, rpc_client, sampl
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_owned_assets(sample_identity)
         
@@ -152,7 +152,7 @@ def test_get_owned_assets_request_exception(rpc_client, sample_identity):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_owned_assets(sample_identity)
         
@@ -170,7 +170,7 @@ def test_get_owned_assets_timeout(mock_timeout_response, rpc_client, sample_iden
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_owned_assets(sample_identity)
         
@@ -190,7 +190,7 @@ def test_get_possessed_assets_success(mock_possessed_assets_response, sample_pos
     Verifies that the function returns the expected list of possessed assets when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_possessed_assets_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_possessed_assets_response) as mock_get:
         result = rpc_client.get_possessed_assets(sample_identity)
         
         assert result == sample_possessed_assets_data
@@ -221,7 +221,7 @@ def test_get_possessed_assets_http_error(mock_http_error_response, rpc_client, s
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_possessed_assets(sample_identity)
         
@@ -239,7 +239,7 @@ def test_get_possessed_assets_request_exception(rpc_client, sample_identity):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_possessed_assets(sample_identity)
         
@@ -257,7 +257,7 @@ def test_get_possessed_assets_timeout(mock_timeout_response, rpc_client, sample_
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_possessed_assets(sample_identity)
         
@@ -0,0 +1,154 @@
+import pytest
+import asyncio
+import inspect
+import warnings
+from unittest.mock import patch, Mock, AsyncMock
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.rpc.async_rpc_client import AsyncQubiPy_RPC
+from qubipy.transport.async_session import QubiPy_AsyncSession
+from ..conftest import *
+
+WALLET_ID = "EGOCTGJSNPNEJFSSCTOKAEBKMEEDGLXXVFFHUWHBFEHZOGLMEMAUQZOAVKAN"
+TX_ID = "ywgbsjnvpjavjgsdbbwhrrjgctmcnanxybugdroubhijserehrnkurgexuue"
+
+RESPONSE_KEYS = [
+    'latestTick', 'approvedTransactions', 'balance', 'hexDigest', 'transaction', 'transactionStatus',
+    'tickData', 'computors', 'responseData', 'tickInfo', 'issuedAssets', 'ownedAssets',
+    'possessedAssets', 'blockHeight', 'data', 'assets',
+]
+
+RPC_CALLS = [
+    ('get', 'get_latest_tick', ()),
+    ('post', 'broadcast_transaction', (b'\x01\x02\x03',)),
+    ('get', 'get_approved_transaction_for_tick', (17021024,)),
+    ('get', 'get_balance', (WALLET_ID,)),
+    ('get', 'get_rpc_status', ()),
+    ('get', 'get_chain_hash', (17021024,)),
+    ('get', 'get_quorum_tick_data', (17021024,)),
+    ('get', 'get_store_hash', (17021024,)),
+    ('get', 'get_transaction', (TX_ID,)),
+    ('get', 'get_transaction_status', (TX_ID,)),
+    ('get', 'get_tick_data', (17021024,)),
+    ('get', 'get_transfer_transactions_per_tick', (WALLET_ID, 17021000, 17021024)),
+    ('get', 'get_health_check', ()),
+    ('get', 'get_computors', (150,)),
+    ('post', 'query_smart_contract', ('1', '1', '0', '')),
+    ('get', 'get_tick_info', ()),
+    ('get', 'get_issued_assets', (WALLET_ID,)),
+    ('get', 'get_owned_assets', (WALLET_ID,)),
+    ('get', 'get_possessed_assets', (WALLET_ID,)),
+    ('get', 'get_block_height', ()),
+    ('get', 'get_latest_stats', ()),
+    ('get', 'get_rich_list', (1, 10)),
+    ('get', 'get_assets_issuances', (WALLET_ID, 'QX')),
+    ('get', 'get_assets_issuances_by_index', (1,)),
+    ('get', 'get_ownerships_assets', (None, 'QX')),
+    ('get', 'get_ownerships_assets_by_index', (1,)),
+    ('get', 'get_assets_possessions', (None, 'QX')),
+    ('get', 'get_assets_possessions_by_index', (1,)),
+    ('get', 'get_assets_owners_per_asset', (WALLET_ID, 'QX', 1, 10)),
+]
+
+@pytest.fixture
+def async_rpc_client():
+    return AsyncQubiPy_RPC(rpc_url=RPC_URL)
+
+def build_mock_response():
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.side_effect = lambda: {key: f'{key}-value' for key in RESPONSE_KEYS}
+    return response
+
+def test_async_client_exposes_every_rpc_method():
+    """
+    Test that every public method of QubiPy_RPC has a coroutine counterpart on AsyncQubiPy_RPC.
+    """
+    for name, member in inspect.getmembers(QubiPy_RPC, inspect.isfunction):
+        if name.startswith(('get_', 'broadcast_', 'query_')):
+            assert inspect.iscoroutinefunction(getattr(AsyncQubiPy_RPC, name)), name
+
+@pytest.mark.parametrize("http_method, method_name, args", RPC_CALLS)
+def test_async_rpc_matches_sync_client(http_method, method_name, args, rpc_client, async_rpc_client):
+    """
+    Test that each async method sends the same request and returns the same
+    result as its blocking counterpart.
+    """
+    sync_response = build_mock_response()
+    async_response = build_mock_response()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+
+        with patch(f'requests.Session.{http_method}', return_value=sync_response) as mock_sync:
+            expected = getattr(rpc_client, method_name)(*args)
+
+        with patch.object(QubiPy_AsyncSession, http_method, new_callable=AsyncMock, return_value=async_response) as mock_async:
+            result = asyncio.run(getattr(async_rpc_client, method_name)(*args))
+
+    assert result == expected
+    assert mock_async.call_args == mock_sync.call_args
+
+@pytest.mark.parametrize("method_name, args, expected_error", [
+    ('get_balance', ('invalid',), QubiPy_Exceptions.INVALID_ADDRESS_ID),
+    ('get_tick_data', (None,), QubiPy_Exceptions.INVALID_TICK_ERROR),
+    ('broadcast_transaction', (b'',), QubiPy_Exceptions.INVALID_TX_BYTES),
+    ('get_transfer_transactions_per_tick', (WALLET_ID, 'a', 'b'), QubiPy_Exceptions.INVALID_DATA_FORMAT),
+    ('get_rich_list', (1, 101), QubiPy_Exceptions.INVALID_PAGES),
+    ('get_assets_issuances_by_index', ('x',), QubiPy_Exceptions.INVALID_INDEX),
+])
+def test_async_rpc_validation(method_name, args, expected_error, async_rpc_client):
+    """
+    Test that the async client validates input before sending any request.
+    """
+    with patch.object(QubiPy_AsyncSession, 'get', new_callable=AsyncMock) as mock_get, \
+         patch.object(QubiPy_AsyncSession, 'post', new_callable=AsyncMock) as mock_post:
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            asyncio.run(getattr(async_rpc_client, method_name)(*args))
+
+    assert str(exc_info.value) == expected_error
+    mock_get.assert_not_called()
+    mock_post.assert_not_called()
+
+@pytest.mark.parametrize("error", [aiohttp.ClientConnectionError("Network error"), asyncio.TimeoutError()])
+def test_async_rpc_request_error(error, async_rpc_client):
+    """
+    Test that aiohttp errors and timeouts are raised as QubiPy_Exceptions.
+    """
+    with patch.object(QubiPy_AsyncSession, 'get', new_callable=AsyncMock, side_effect=error):
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            asyncio.run(async_rpc_client.get_latest_tick())
+
+    assert "Error when getting the last Tick" in str(exc_info.value)
+
+def test_async_broadcast_transaction_api_error(async_rpc_client):
+    """
+    Test that a 400 response to broadcast_transaction surfaces the API error code and message.
+    """
+    response = Mock()
+    response.status_code = 400
+    response.raise_for_status.side_effect = aiohttp.ClientResponseError(None, (), status=400)
+    response.json.return_value = {'code': 3, 'message': 'invalid transaction'}
+
+    with patch.object(QubiPy_AsyncSession, 'post', new_callable=AsyncMock, return_value=response):
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            asyncio.run(async_rpc_client.broadcast_transaction(b'\x01'))
+
+    assert str(exc_info.value) == "API Error 3: invalid transaction"
+
+def test_async_clients_share_session():
+    """
+    Test that a shared session is reused and left open when a client closes.
+    """
+    session = QubiPy_AsyncSession()
+    client = AsyncQubiPy_RPC(session=session)
+
+    async def run():
+        async with client:
+            assert client.session is session
+
+    with patch.object(QubiPy_AsyncSession, 'close', new_callable=AsyncMock) as mock_close:
+        asyncio.run(run())
+        mock_close.assert_not_called()
@@ -26,7 +26,7 @@ def test_get_latest_tick_success(mock_successful_response, rpc_client):
     - The raise_for_status and json methods are called once
     - The requests.get call is made with the correct URL, headers, and timeout
     """
-    with patch('requests.get', return_value=mock_successful_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_successful_response) as mock_get:
         result = rpc_client.get_latest_tick()
         
         assert result == 17021024
@@ -46,7 +46,7 @@ def test_get_latest_tick_http_error(mock_http_error_response, rpc_client):
     - The exception message contains "Error when getting the last Tick"
     - The requests.get call is made with the correct URL, headers, and timeout
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_tick()
         
@@ -65,7 +65,7 @@ def test_get_latest_tick_request_exception(rpc_client):
     - The exception message contains "Error when getting the last Tick: Network error"
     - The requests.get call is made with the correct URL, headers, and timeout
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_tick()
         
@@ -83,7 +83,7 @@ def test_get_latest_tick_timeout(mock_timeout_response, rpc_client):
     - The exception message contains "Error when getting the last Tick: Request timed out"
     - The requests.get call is made with the correct URL, headers, and timeout
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_tick()
         
@@ -98,7 +98,7 @@ def test_get_balance_success(mock_balance_response, sample_balance_data, rpc_cli
     
     Verifies that the function returns the expected balance when a valid wallet ID is provided.
     """
-    with patch('requests.get', return_value=mock_balance_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_balance_response) as mock_get:
         result = rpc_client.get_balance(sample_wallet_id)
         
         assert result == sample_balance_data
@@ -128,7 +128,7 @@ def test_get_balance_http_error(mock_http_error_response, rpc_client, sample_wal
     Simulates an HTTP error and verifies that the function raises a QubiPy_Exceptions
     exception with an appropriate message.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_balance(sample_wallet_id)
         
@@ -146,7 +146,7 @@ def test_get_balance_request_exception(rpc_client, sample_wallet_id):
     Simulates a network-related error and verifies that the function raises 
     a QubiPy_Exceptions exception with an appropriate message.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_balance(sample_wallet_id)
         
@@ -164,7 +164,7 @@ def test_get_balance_timeout(mock_timeout_response, rpc_client, sample_wallet_id
     Simulates a timeout error and verifies that the function raises a QubiPy_Exceptions 
     exception with an appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_balance(sample_wallet_id)
             
@@ -184,7 +184,7 @@ def test_get_rpc_status_success(mock_rpc_status_response, sample_rpc_status_data
     Verifies that the function returns the expected RPC status data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_rpc_status_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_rpc_status_response) as mock_get:
         result = rpc_client.get_rpc_status()
         
         assert result == sample_rpc_status_data
@@ -203,7 +203,7 @@ def test_get_rpc_status_http_error(mock_http_error_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rpc_status()
         
@@ -221,7 +221,7 @@ def test_get_rpc_status_request_exception(rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rpc_status()
         
@@ -239,7 +239,7 @@ def test_get_rpc_status_timeout(mock_timeout_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rpc_status()
         
@@ -259,7 +259,7 @@ def test_get_health_check_success(mock_health_check_response, sample_health_chec
     Verifies that the function returns the expected health check status when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_health_check_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_health_check_response) as mock_get:
         result = rpc_client.get_health_check()
         
         assert result == sample_health_check_data
@@ -278,7 +278,7 @@ def test_get_health_check_http_error(mock_http_error_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_health_check()
         
@@ -296,7 +296,7 @@ def test_get_health_check_request_exception(rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_health_check()
         
@@ -314,7 +314,7 @@ def test_get_health_check_timeout(mock_timeout_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_health_check()
         
@@ -334,7 +334,7 @@ def test_get_block_height_success(mock_block_height_response, sample_block_heigh
     Verifies that the function returns the expected block height data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_block_height_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_block_height_response) as mock_get:
         result = rpc_client.get_block_height()
         
         assert result == sample_block_height_data
@@ -353,7 +353,7 @@ def test_get_block_height_http_error(mock_http_error_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_block_height()
         
@@ -371,7 +371,7 @@ def test_get_block_height_request_exception(rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_block_height()
         
@@ -389,7 +389,7 @@ def test_get_block_height_timeout(mock_timeout_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_block_height()
         
@@ -409,7 +409,7 @@ def test_get_latest_stats_success(mock_latest_stats_response, sample_latest_stat
     Verifies that the function returns the expected latest statistics when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_latest_stats_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_latest_stats_response) as mock_get:
         result = rpc_client.get_latest_stats()
         
         assert result == sample_latest_stats_data
@@ -428,7 +428,7 @@ def test_get_latest_stats_http_error(mock_http_error_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_stats()
         
@@ -446,7 +446,7 @@ def test_get_latest_stats_request_exception(rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_stats()
         
@@ -464,7 +464,7 @@ def test_get_latest_stats_timeout(mock_timeout_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_latest_stats()
         
@@ -16,7 +16,7 @@ def test_get_chain_hash_success(mock_chain_hash_response, sample_chain_hash_data
     Verifies that the function returns the expected chain hash when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_chain_hash_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_chain_hash_response) as mock_get:
         result = rpc_client.get_chain_hash(sample_tick)
         
         assert result == sample_chain_hash_data
@@ -47,7 +47,7 @@ def test_get_chain_hash_http_error(mock_http_error_response, rpc_client, sample_
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_chain_hash(sample_tick)
         
@@ -65,7 +65,7 @@ def test_get_chain_hash_request_exception(rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_chain_hash(sample_tick)
         
@@ -83,7 +83,7 @@ def test_get_chain_hash_timeout(mock_timeout_response, rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_chain_hash(sample_tick)
         
@@ -103,7 +103,7 @@ def test_get_quorum_tick_data_success(mock_quorum_tick_data_response, sample_quo
     Verifies that the function returns the expected quorum tick data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_quorum_tick_data_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_quorum_tick_data_response) as mock_get:
         result = rpc_client.get_quorum_tick_data(sample_tick)
         
         assert result == sample_quorum_tick_data
@@ -134,7 +134,7 @@ def test_get_quorum_tick_data_http_error(mock_http_error_response, rpc_client, s
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_quorum_tick_data(sample_tick)
         
@@ -152,7 +152,7 @@ def test_get_quorum_tick_data_request_exception(rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_quorum_tick_data(sample_tick)
         
@@ -170,7 +170,7 @@ def test_get_quorum_tick_data_timeout(mock_timeout_response, rpc_client, sample_
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_quorum_tick_data(sample_tick)
         
@@ -190,7 +190,7 @@ def test_get_store_hash_success(mock_store_hash_response, sample_store_hash_data
     Verifies that the function returns the expected store hash when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_store_hash_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_store_hash_response) as mock_get:
         result = rpc_client.get_store_hash(sample_tick)
         
         assert result == sample_store_hash_data
@@ -221,7 +221,7 @@ def test_get_store_hash_http_error(mock_http_error_response, rpc_client, sample_
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_store_hash(sample_tick)
         
@@ -239,7 +239,7 @@ def test_get_store_hash_request_exception(rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_store_hash(sample_tick)
         
@@ -257,7 +257,7 @@ def test_get_store_hash_timeout(mock_timeout_response, rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_store_hash(sample_tick)
         
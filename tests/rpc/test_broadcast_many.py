@@ -0,0 +1,98 @@
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.rpc.async_rpc_client import AsyncQubiPy_RPC
+from qubipy.utils import get_tx_target_tick
+from ..conftest import *
+
+""" BROADCAST MANY TESTS """
+
+def make_tx(target_tick, nonce=0):
+    return bytes(64) + nonce.to_bytes(8, 'little') + target_tick.to_bytes(4, 'little') + bytes(4) + bytes(64)
+
+def test_get_tx_target_tick():
+    """
+    Test that the target tick is read from the transaction bytes.
+    """
+    assert get_tx_target_tick(make_tx(17056942)) == 17056942
+    assert get_tx_target_tick(b'\x01' * 10) is None
+
+def test_broadcast_many_flags_expired_ticks_before_sending(rpc_client):
+    """
+    Test that transactions whose target tick has passed are never sent, while the others are, in input order.
+    """
+    txs = [make_tx(205, 0), make_tx(100, 1), make_tx(205, 2), b'', make_tx(210, 3)]
+    sent = []
+
+    def fake_broadcast(tx):
+        sent.append(tx)
+        return {'peersBroadcasted': 3, 'encodedTransaction': 'x', 'transactionId': f'tx{tx[64]}'}
+
+    with patch.object(rpc_client, 'get_tick_info', return_value={'tick': 200}) as mock_tick_info, \
+         patch.object(rpc_client, 'broadcast_transaction', side_effect=fake_broadcast):
+        results = rpc_client.broadcast_many(txs)
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.ok for result in results] == [True, False, True, False, True]
+    assert results[1].expired and results[1].target_tick == 100
+    assert str(results[3].error) == QubiPy_Exceptions.INVALID_TX_BYTES
+    assert results[4].response['transactionId'] == 'tx3'
+    assert txs[1] not in sent and len(sent) == 3
+    assert mock_tick_info.call_count == 3
+
+def test_broadcast_many_bounded_in_flight(rpc_client):
+    """
+    Test that no more than max_in_flight broadcasts run at the same time and failures stay per transaction.
+    """
+    lock = threading.Lock()
+    state = {'current': 0, 'peak': 0}
+
+    def fake_broadcast(tx):
+        with lock:
+            state['current'] += 1
+            state['peak'] = max(state['peak'], state['current'])
+        time.sleep(0.002)
+        with lock:
+            state['current'] -= 1
+        if tx[64] == 7:
+            raise QubiPy_Exceptions('API Error 3: transaction rejected')
+        return {'peersBroadcasted': 1}
+
+    with patch.object(rpc_client, 'get_tick_info', return_value={'tick': 1}), patch.object(rpc_client, 'broadcast_transaction', side_effect=fake_broadcast):
+        results = rpc_client.broadcast_many([make_tx(500, nonce) for nonce in range(40)], max_in_flight=4)
+
+    assert 1 < state['peak'] <= 4
+    assert [result.ok for result in results].count(False) == 1
+    assert str(results[7].error) == 'API Error 3: transaction rejected'
+
+@pytest.mark.parametrize("txs, max_in_flight", [(None, 4), (make_tx(5), 4), ([make_tx(5)], 0)])
+def test_broadcast_many_invalid_arguments(rpc_client, txs, max_in_flight):
+    """
+    Test that a single transaction or an invalid window is rejected up front.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        rpc_client.broadcast_many(txs, max_in_flight)
+
+def test_async_broadcast_many():
+    """
+    Test that the async counterpart flags expired transactions and returns results in input order.
+    """
+    async def get_tick_info():
+        return {'tick': 300}
+
+    async def broadcast_transaction(tx):
+        await asyncio.sleep(0.001 * (10 - tx[64]))
+        return {'transactionId': f'tx{tx[64]}'}
+
+    async def run():
+        async with AsyncQubiPy_RPC(rpc_url=RPC_URL) as client:
+            with patch.object(client, 'get_tick_info', side_effect=get_tick_info), patch.object(client, 'broadcast_transaction', side_effect=broadcast_transaction):
+                return await client.broadcast_many([make_tx(301, nonce) for nonce in range(5)] + [make_tx(299, 9)], max_in_flight=2)
+
+    results = asyncio.run(run())
+
+    assert [result.response['transactionId'] for result in results[:5]] == [f'tx{nonce}' for nonce in range(5)]
+    assert results[5].expired
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import patch
+from qubipy import columnar
+from qubipy.columnar import *
+from qubipy.models import Transaction, Tick_Transfers
+from ..conftest import *
+
+""" COLUMNAR EXPORT TESTS """
+
+def test_transactions_to_columns_with_identity_table(sample_approved_transaction_data):
+    """
+    Test that transactions become typed columns with identities indexed into a shared table.
+    """
+    np = pytest.importorskip('numpy')
+    table = Identity_Table()
+    second = dict(sample_approved_transaction_data[0], sourceId=sample_approved_transaction_data[0]['destId'], amount='5')
+
+    columns = transactions_to_columns(sample_approved_transaction_data + [second], table=table)
+
+    assert columns['amount'].dtype == np.int64
+    assert columns['tick_number'].dtype == np.uint32
+    assert columns['source_id'].dtype == np.uint32
+    assert columns['amount'].tolist() == [47472785, 5]
+    assert columns['source_id'].tolist() == [0, 1]
+    assert columns['dest_id'].tolist() == [1, 1]
+    assert columns['identities'][columns['source_id'][0]].decode() == sample_approved_transaction_data[0]['sourceId']
+    assert len(table) == 2
+
+def test_transactions_to_columns_with_bytes_and_models(sample_approved_transaction_data):
+    """
+    Test that models are accepted and identities can be stored as fixed-width bytes.
+    """
+    np = pytest.importorskip('numpy')
+    transactions = [Transaction.from_dict(tx) for tx in sample_approved_transaction_data]
+
+    columns = transactions_to_columns(transactions, identities=IDENTITIES_BYTES)
+
+    assert 'identities' not in columns
+    assert columns['source_id'].dtype == np.dtype('S60')
+    assert columns['source_id'][0].decode() == sample_approved_transaction_data[0]['sourceId']
+    assert columns['tick_number'].tolist() == [17056942]
+
+def test_transfers_and_rich_list_share_a_table(sample_approved_transaction_data, sample_rich_list_data, sample_wallet_id):
+    """
+    Test that transfers are flattened in tick order and that the rich list reuses the same table.
+    """
+    pytest.importorskip('numpy')
+    table = Identity_Table()
+    response = {'transferTransactionsPerTick': [
+        {'tickNumber': 2, 'identity': sample_wallet_id, 'transactions': [dict(sample_approved_transaction_data[0], tickNumber=2)]},
+        {'tickNumber': 3, 'identity': sample_wallet_id, 'transactions': [dict(sample_approved_transaction_data[0], tickNumber=3)]},
+    ]}
+
+    transfers = transfers_to_columns(response, table=table)
+    models = transfers_to_columns([Tick_Transfers.from_dict(entry) for entry in response['transferTransactionsPerTick']], table=table)
+    rich_list = rich_list_to_columns({'richList': sample_rich_list_data}, table=table)
+
+    assert transfers['tick_number'].tolist() == [2, 3]
+    assert models['source_id'].tolist() == transfers['source_id'].tolist()
+    assert rich_list['balance'].tolist() == [10988257022786, 5638925835721]
+    assert rich_list['identity'][1] == transfers['source_id'][0]
+
+def test_to_arrow_dictionary_encodes_identities(sample_rich_list_data):
+    """
+    Test that the Arrow export turns identity indices into dictionary columns.
+    """
+    pytest.importorskip('numpy')
+    pa = pytest.importorskip('pyarrow')
+
+    batch = to_arrow(rich_list_to_columns(sample_rich_list_data))
+
+    assert batch.schema.field('balance').type == pa.int64()
+    assert pa.types.is_dictionary(batch.schema.field('identity').type)
+    assert batch.column('identity').to_pylist()[0] == sample_rich_list_data['entities'][0]['identity'].encode()
+
+def test_invalid_identities_mode(sample_rich_list_data):
+    """
+    Test that an unknown identities mode raises a ValueError.
+    """
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError):
+        rich_list_to_columns(sample_rich_list_data, identities='indices')
+
+def test_columnar_export_requires_numpy(sample_rich_list_data):
+    """
+    Test that a clear ImportError is raised when NumPy is not installed.
+    """
+    with patch.object(columnar, 'np', None):
+        with pytest.raises(ImportError):
+            rich_list_to_columns(sample_rich_list_data)
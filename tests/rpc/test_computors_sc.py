@@ -17,7 +17,7 @@ def test_get_computors_success(mock_computors_response, sample_computors_data, r
     Verifies that the function returns the expected computors data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_computors_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_computors_response) as mock_get:
         result = rpc_client.get_computors(sample_epoch)
         
         assert result == sample_computors_data
@@ -49,7 +49,7 @@ def test_get_computors_http_error(mock_http_error_response, rpc_client, sample_e
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_computors(sample_epoch)
         
@@ -67,7 +67,7 @@ def test_get_computors_request_exception(rpc_client, sample_epoch):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_computors(sample_epoch)
         
@@ -85,7 +85,7 @@ def test_get_computors_timeout(rpc_client, sample_epoch):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_computors(sample_epoch)
         
@@ -105,7 +105,7 @@ def test_query_smart_contract_success(mock_smart_contract_response, sample_smart
     Verifies that the function returns the expected smart contract response when the API
     responds successfully.
     """
-    with patch('requests.post', return_value=mock_smart_contract_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_smart_contract_response) as mock_post:
         result = rpc_client.query_smart_contract(
             sample_contract_params['contract_index'],
             sample_contract_params['input_type'],
@@ -156,7 +156,7 @@ def test_query_smart_contract_http_error(mock_http_error_response, rpc_client, s
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.post', return_value=mock_http_error_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_http_error_response) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.query_smart_contract(
                 sample_contract_params['contract_index'],
@@ -174,7 +174,7 @@ def test_query_smart_contract_request_exception(rpc_client, sample_contract_para
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.post', side_effect=requests.RequestException("Network error")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.RequestException("Network error")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.query_smart_contract(
                 sample_contract_params['contract_index'],
@@ -192,7 +192,7 @@ def test_query_smart_contract_timeout(rpc_client, sample_contract_params):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
+    with patch('requests.Session.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.query_smart_contract(
                 sample_contract_params['contract_index'],
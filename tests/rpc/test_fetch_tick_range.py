@@ -0,0 +1,146 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch
+import requests
+from qubipy.exceptions import QubiPy_Exceptions, QubiPy_Circuit_Open
+from ..conftest import *
+
+""" FETCH TICK RANGE TESTS """
+
+def test_fetch_tick_range_yields_in_tick_order(rpc_client):
+    """
+    Test that results are yielded in tick order even when later ticks complete first.
+    """
+    def fake_tick_data(tick):
+        time.sleep(0.001 * (10 - tick % 10))
+        return {'tickNumber': tick}
+
+    with patch.object(rpc_client, 'get_tick_data', side_effect=fake_tick_data):
+        results = list(rpc_client.fetch_tick_range(100, 129, max_workers=8))
+
+    assert [tick for tick, _ in results] == list(range(100, 130))
+    assert all(data == {'tickNumber': tick} for tick, data in results)
+
+def test_fetch_tick_range_bounded_concurrency(rpc_client):
+    """
+    Test that no more than max_workers requests are in flight at the same time.
+    """
+    lock = threading.Lock()
+    state = {'current': 0, 'peak': 0}
+
+    def fake_tick_data(tick):
+        with lock:
+            state['current'] += 1
+            state['peak'] = max(state['peak'], state['current'])
+        time.sleep(0.002)
+        with lock:
+            state['current'] -= 1
+        return {}
+
+    with patch.object(rpc_client, 'get_tick_data', side_effect=fake_tick_data):
+        assert len(list(rpc_client.fetch_tick_range(1, 40, max_workers=4))) == 40
+
+    assert state['peak'] <= 4
+
+def test_fetch_tick_range_retries_single_tick(rpc_client):
+    """
+    Test that a failing tick is retried on its own while the other ticks are fetched once.
+    """
+    calls = []
+
+    def fake_approved(tick):
+        calls.append(tick)
+        if tick == 12 and calls.count(12) < 3:
+            raise QubiPy_Exceptions("Failed to retrieve the approved transactions from the API")
+        return [{'tickNumber': tick}]
+
+    with patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=fake_approved), \
+         patch('qubipy.concurrency.time.sleep') as mock_sleep:
+        results = dict(rpc_client.fetch_tick_range(10, 14, what='approved_transactions', retries=3))
+
+    assert results[12] == [{'tickNumber': 12}]
+    assert calls.count(12) == 3
+    assert all(calls.count(tick) == 1 for tick in (10, 11, 13, 14))
+    assert mock_sleep.call_count == 2
+
+def test_fetch_tick_range_raises_after_retries(rpc_client):
+    """
+    Test that the error of a tick that keeps failing is raised after every previous tick was yielded.
+    """
+    def fake_tick_data(tick):
+        if tick == 3:
+            raise QubiPy_Exceptions("Failed to retrieve the tick data")
+        return {'tickNumber': tick}
+
+    yielded = []
+    with patch.object(rpc_client, 'get_tick_data', side_effect=fake_tick_data), \
+         patch('qubipy.concurrency.time.sleep'):
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            for tick, _ in rpc_client.fetch_tick_range(1, 5, retries=1):
+                yielded.append(tick)
+
+    assert yielded == [1, 2]
+    assert "Failed to retrieve the tick data" in str(exc_info.value)
+
+def test_fetch_tick_range_multiple_targets(rpc_client):
+    """
+    Test that requesting both tick data and approved transactions returns a dictionary per tick.
+    """
+    with patch.object(rpc_client, 'get_tick_data', return_value={'epoch': 150}), \
+         patch.object(rpc_client, 'get_approved_transaction_for_tick', return_value=[]):
+        results = list(rpc_client.fetch_tick_range(1, 2, what=('tick_data', 'approved_transactions')))
+
+    assert results == [
+        (1, {'tick_data': {'epoch': 150}, 'approved_transactions': []}),
+        (2, {'tick_data': {'epoch': 150}, 'approved_transactions': []}),
+    ]
+
+@pytest.mark.parametrize("start_tick, end_tick, what, expected_error", [
+    (None, 10, 'tick_data', QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK),
+    (10, 5, 'tick_data', QubiPy_Exceptions.INVALID_START_TICK_AND_END_TICK),
+    ('1', 5, 'tick_data', QubiPy_Exceptions.INVALID_DATA_FORMAT),
+    (1, 5, 'quorum', QubiPy_Exceptions.INVALID_FETCH_TARGET),
+    (1, 5, (), QubiPy_Exceptions.INVALID_FETCH_TARGET),
+])
+def test_fetch_tick_range_invalid_input(start_tick, end_tick, what, expected_error, rpc_client):
+    """
+    Test that invalid ranges and targets are rejected before any request is made.
+    """
+    with patch('requests.Session.get') as mock_get:
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            rpc_client.fetch_tick_range(start_tick, end_tick, what=what)
+
+    assert str(exc_info.value) == expected_error
+    mock_get.assert_not_called()
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = 'Not Found' if status == 404 else 'Service Unavailable'
+    response.url = RPC_URL
+    return response
+
+@pytest.mark.parametrize("status, attempts", [(404, 1), (400, 1), (503, 3), (429, 3)])
+def test_fetch_tick_range_does_not_retry_client_errors(rpc_client, status, attempts):
+    """
+    Test that 4xx answers fail at once while 5xx and 429 answers are retried.
+    """
+    with patch('requests.Session.get', return_value=http_error(status)) as mock_get, \
+         patch('qubipy.concurrency.time.sleep'):
+        with pytest.raises(QubiPy_Exceptions):
+            list(rpc_client.fetch_tick_range(10, 10, retries=2))
+
+    assert mock_get.call_count == attempts
+
+def test_fetch_tick_range_fails_fast_on_open_circuit(rpc_client):
+    """
+    Test that an open circuit is raised without sleeping or retrying.
+    """
+    with patch.object(rpc_client, 'get_tick_data', side_effect=QubiPy_Circuit_Open(RPC_URL, 'tick', 5.0)) as mock_tick_data, \
+         patch('qubipy.concurrency.time.sleep') as mock_sleep:
+        with pytest.raises(QubiPy_Circuit_Open):
+            list(rpc_client.fetch_tick_range(10, 10, retries=3))
+
+    assert mock_tick_data.call_count == 1
+    mock_sleep.assert_not_called()
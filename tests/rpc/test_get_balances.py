@@ -0,0 +1,133 @@
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions, QubiPy_Circuit_Open
+from qubipy.rpc.async_rpc_client import AsyncQubiPy_RPC
+from ..conftest import *
+
+""" GET BALANCES TESTS """
+
+WALLET_IDS = [chr(ord('A') + index) * 60 for index in range(20)]
+
+def test_get_balances_returns_mapping_in_input_order(rpc_client):
+    """
+    Test that balances are keyed by wallet ID in input order, with duplicates fetched once.
+    """
+    calls = []
+
+    def fake_balance(wallet_id):
+        calls.append(wallet_id)
+        time.sleep(0.001 * (ord(wallet_id[0]) % 5))
+        return {'id': wallet_id, 'balance': str(ord(wallet_id[0]))}
+
+    with patch.object(rpc_client, 'get_balance', side_effect=fake_balance):
+        balances, errors = rpc_client.get_balances(WALLET_IDS + WALLET_IDS[:3], max_workers=8)
+
+    assert list(balances) == WALLET_IDS
+    assert balances[WALLET_IDS[1]] == {'id': WALLET_IDS[1], 'balance': str(ord('B'))}
+    assert errors == {}
+    assert sorted(calls) == sorted(WALLET_IDS)
+
+def test_get_balances_bounded_concurrency(rpc_client):
+    """
+    Test that no more than max_workers balances are fetched at the same time.
+    """
+    lock = threading.Lock()
+    state = {'current': 0, 'peak': 0}
+
+    def fake_balance(wallet_id):
+        with lock:
+            state['current'] += 1
+            state['peak'] = max(state['peak'], state['current'])
+        time.sleep(0.002)
+        with lock:
+            state['current'] -= 1
+        return {'id': wallet_id}
+
+    with patch.object(rpc_client, 'get_balance', side_effect=fake_balance):
+        rpc_client.get_balances(WALLET_IDS, max_workers=3)
+
+    assert 1 < state['peak'] <= 3
+
+def test_get_balances_reports_errors_per_identity(rpc_client):
+    """
+    Test that invalid IDs are never requested and that failing wallets do not fail the batch.
+    """
+    calls = []
+
+    def fake_balance(wallet_id):
+        calls.append(wallet_id)
+        if wallet_id == WALLET_IDS[0]:
+            raise QubiPy_Exceptions('Failed to retrieve the balance data from the API: 500 Server Error')
+        if wallet_id == WALLET_IDS[1]:
+            raise QubiPy_Circuit_Open(RPC_URL, 'default', 10)
+        return {'id': wallet_id}
+
+    with patch.object(rpc_client, 'get_balance', side_effect=fake_balance), patch('qubipy.concurrency.time.sleep'):
+        balances, errors = rpc_client.get_balances(['not-a-wallet'] + WALLET_IDS[:3], retries=1)
+
+    assert list(balances) == [WALLET_IDS[2]]
+    assert str(errors['not-a-wallet']) == QubiPy_Exceptions.INVALID_ADDRESS_ID
+    assert isinstance(errors[WALLET_IDS[1]], QubiPy_Circuit_Open)
+    assert 'not-a-wallet' not in calls
+    assert calls.count(WALLET_IDS[0]) == 2
+
+@pytest.mark.parametrize("wallet_ids", [None, [], WALLET_IDS[0]])
+def test_get_balances_no_wallet_ids(rpc_client, wallet_ids):
+    """
+    Test that an empty input or a single string raises INVALID_ADDRESS_ID.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        rpc_client.get_balances(wallet_ids)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_ADDRESS_ID
+
+def test_async_get_balances_matches_sync_client():
+    """
+    Test that the async counterpart bounds concurrency and reports errors the same way.
+    """
+    state = {'current': 0, 'peak': 0}
+
+    async def fake_balance(wallet_id):
+        state['current'] += 1
+        state['peak'] = max(state['peak'], state['current'])
+        await asyncio.sleep(0.002)
+        state['current'] -= 1
+        if wallet_id == WALLET_IDS[0]:
+            raise QubiPy_Exceptions('Failed to retrieve the balance data from the API: 500 Server Error')
+        return {'id': wallet_id}
+
+    async def run():
+        async with AsyncQubiPy_RPC(rpc_url=RPC_URL) as client:
+            with patch.object(client, 'get_balance', side_effect=fake_balance):
+                return await client.get_balances(['not-a-wallet'] + WALLET_IDS, max_workers=4, retries=0)
+
+    balances, errors = asyncio.run(run())
+
+    assert list(balances) == WALLET_IDS[1:]
+    assert list(errors) == ['not-a-wallet', WALLET_IDS[0]]
+    assert 1 < state['peak'] <= 4
+
+def test_async_get_balances_fails_fast_on_open_circuit():
+    """
+    Test that the async bulk helper does not retry a wallet whose circuit is open.
+    """
+    calls = []
+
+    async def open_circuit(wallet_id):
+        calls.append(wallet_id)
+        raise QubiPy_Circuit_Open(RPC_URL, 'balance', 5.0)
+
+    async def run():
+        async with AsyncQubiPy_RPC(rpc_url=RPC_URL) as client:
+            with patch.object(client, 'get_balance', side_effect=open_circuit), patch('qubipy.concurrency.asyncio.sleep') as mock_sleep:
+                result = await client.get_balances(WALLET_IDS[:1], retries=3)
+                mock_sleep.assert_not_called()
+                return result
+
+    balances, errors = asyncio.run(run())
+
+    assert balances == {} and isinstance(errors[WALLET_IDS[0]], QubiPy_Circuit_Open)
+    assert len(calls) == 1
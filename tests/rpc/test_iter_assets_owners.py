@@ -0,0 +1,82 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.concurrency import Page_Cursor
+from ..conftest import *
+
+""" ITER ASSETS OWNERS TESTS """
+
+ISSUER = 'CFBMEMZOIDEXQAUXYYSZIURADQLAPWPMNJXQSNVQZAHYVOPYUKKJBJUCTVJL'
+
+def make_owners(total_pages, page_size):
+    """
+    Returns a fake get_assets_owners_per_asset and a record of the pages in flight.
+    """
+    lock = threading.Lock()
+    state = {'current': 0, 'peak': 0, 'calls': []}
+
+    def get_assets_owners_per_asset(issuer_identity, asset_name, page, size):
+        with lock:
+            state['current'] += 1
+            state['peak'] = max(state['peak'], state['current'])
+            state['calls'].append(page)
+        time.sleep(0.002)
+        with lock:
+            state['current'] -= 1
+        start = (page - 1) * size
+        return {
+            'pagination': {'totalRecords': total_pages * page_size, 'currentPage': page, 'totalPages': total_pages},
+            'owners': [{'identity': f'OWNER{index}', 'numberOfUnits': str(index + 1)} for index in range(start, start + size)]
+        }
+
+    return get_assets_owners_per_asset, state
+
+def test_iter_assets_owners_fetches_remaining_pages_in_parallel(rpc_client):
+    """
+    Test that every owner is yielded in page order and that the remaining pages run concurrently
+    within the limit.
+    """
+    get_owners, state = make_owners(total_pages=20, page_size=5)
+
+    with patch.object(rpc_client, 'get_assets_owners_per_asset', side_effect=get_owners):
+        owners = list(rpc_client.iter_assets_owners(ISSUER, 'CFB', page_size=5, max_workers=4))
+
+    assert [owner['identity'] for owner in owners] == [f'OWNER{index}' for index in range(100)]
+    assert state['calls'][0] == 1
+    assert sorted(state['calls']) == list(range(1, 21))
+    assert 1 < state['peak'] <= 4
+
+def test_iter_assets_owners_single_page(rpc_client):
+    """
+    Test that an asset with a single page costs a single request.
+    """
+    get_owners, state = make_owners(total_pages=1, page_size=100)
+
+    with patch.object(rpc_client, 'get_assets_owners_per_asset', side_effect=get_owners):
+        owners = list(rpc_client.iter_assets_owners(ISSUER, 'CFB'))
+
+    assert len(owners) == 100
+    assert state['calls'] == [1]
+
+def test_iter_assets_owners_is_lazy(rpc_client):
+    """
+    Test that nothing is requested until the iterator is consumed.
+    """
+    get_owners, state = make_owners(total_pages=3, page_size=2)
+
+    with patch.object(rpc_client, 'get_assets_owners_per_asset', side_effect=get_owners):
+        owners = rpc_client.iter_assets_owners(ISSUER, 'CFB', Page_Cursor(page=2, page_size=2))
+        assert state['calls'] == []
+        assert [owner['identity'] for owner in owners] == ['OWNER2', 'OWNER3', 'OWNER4', 'OWNER5']
+
+@pytest.mark.parametrize("issuer, asset_name", [(None, 'CFB'), (ISSUER, None)])
+def test_iter_assets_owners_missing_asset(rpc_client, issuer, asset_name):
+    """
+    Test that a missing issuer or asset name raises INVALID_IDENTITY_ASSET.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        rpc_client.iter_assets_owners(issuer, asset_name)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_IDENTITY_ASSET
@@ -0,0 +1,122 @@
+import pytest
+import threading
+import time
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.concurrency import Page_Cursor
+from qubipy.config import PAGE_NUMBER_MAX
+from ..conftest import *
+
+""" ITER RICH LIST TESTS """
+
+def make_rich_list(total_pages, page_size, epoch=150):
+    """
+    Returns a fake get_rich_list over `total_pages` pages whose entries are ranked 0, 1, 2...
+    """
+    calls = []
+
+    def get_rich_list(page, size):
+        assert size == page_size
+        calls.append(page)
+        time.sleep(0.001 * (10 - page % 10))
+        start = (page - 1) * page_size
+        return {
+            'pagination': {'totalRecords': total_pages * page_size, 'currentPage': page, 'totalPages': total_pages},
+            'epoch': epoch,
+            'richList': {'entities': [{'identity': f'ID{rank}', 'balance': str(10 ** 9 - rank)} for rank in range(start, start + page_size)]}
+        }
+
+    return get_rich_list, calls
+
+def test_iter_rich_list_yields_in_rank_order(rpc_client):
+    """
+    Test that every entry is yielded once, in rank order, across pages fetched concurrently.
+    """
+    get_rich_list, calls = make_rich_list(total_pages=25, page_size=4)
+
+    with patch.object(rpc_client, '_fetch_rich_list_page', side_effect=get_rich_list):
+        entries = list(rpc_client.iter_rich_list(page_size=4, max_workers=4))
+
+    assert [entry['identity'] for entry in entries] == [f'ID{rank}' for rank in range(100)]
+    assert sorted(calls) == list(range(1, 26))
+
+def test_iter_rich_list_prefetch_is_bounded(rpc_client):
+    """
+    Test that only a bounded window of pages is fetched ahead of the consumer.
+    """
+    get_rich_list, calls = make_rich_list(total_pages=200, page_size=2)
+
+    with patch.object(rpc_client, '_fetch_rich_list_page', side_effect=get_rich_list):
+        entries = rpc_client.iter_rich_list(page_size=2, max_workers=2)
+        next(entries)
+        next(entries)
+        next(entries)
+        time.sleep(0.05)
+        fetched = len(calls)
+        entries.close()
+
+    assert fetched <= 1 + 2 * 2 + 1
+
+def test_iter_rich_list_resumes_from_cursor(rpc_client):
+    """
+    Test that a persisted cursor resumes right after the last consumed entry.
+    """
+    get_rich_list, _ = make_rich_list(total_pages=5, page_size=3)
+    cursor = Page_Cursor(page_size=3)
+
+    with patch.object(rpc_client, '_fetch_rich_list_page', side_effect=get_rich_list):
+        first_run = []
+        for entry in rpc_client.iter_rich_list(cursor):
+            first_run.append(entry['identity'])
+            if len(first_run) == 7:
+                break
+
+        saved = cursor.to_dict()
+        second_run = [entry['identity'] for entry in rpc_client.iter_rich_list(Page_Cursor.from_dict(saved))]
+
+    assert saved == {'page': 3, 'offset': 0, 'page_size': 3, 'epoch': 150}
+    assert first_run + second_run[1:] == [f'ID{rank}' for rank in range(15)]
+    assert second_run[0] == first_run[-1]
+
+def test_iter_rich_list_rejects_stale_cursor(rpc_client):
+    """
+    Test that a cursor from another epoch is refused instead of exporting a mixed rich list.
+    """
+    get_rich_list, _ = make_rich_list(total_pages=2, page_size=3, epoch=151)
+
+    with patch.object(rpc_client, '_fetch_rich_list_page', side_effect=get_rich_list):
+        with pytest.raises(QubiPy_Exceptions) as exc_info:
+            list(rpc_client.iter_rich_list(Page_Cursor(page=2, page_size=3, epoch=150)))
+
+    assert str(exc_info.value) == QubiPy_Exceptions.STALE_CURSOR
+
+@pytest.mark.parametrize("cursor", [Page_Cursor(page=0), Page_Cursor(page_size=101), Page_Cursor(page='1')])
+def test_iter_rich_list_invalid_cursor(rpc_client, cursor):
+    """
+    Test that invalid pages are rejected before any request.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        rpc_client.iter_rich_list(cursor)
+
+def test_get_rich_list_keeps_the_page_limit(rpc_client):
+    """
+    Test that the public method still rejects page numbers above PAGE_NUMBER_MAX before any request.
+    """
+    with patch('requests.Session.get') as mock_get, pytest.raises(QubiPy_Exceptions) as exc_info:
+        rpc_client.get_rich_list(PAGE_NUMBER_MAX + 1, 100)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_PAGES
+    mock_get.assert_not_called()
+
+def test_iter_rich_list_walks_past_the_page_limit(rpc_client):
+    """
+    Test that the iterator reaches the pages beyond PAGE_NUMBER_MAX, from the start or from a cursor.
+    """
+    get_rich_list, calls = make_rich_list(total_pages=PAGE_NUMBER_MAX + 20, page_size=1)
+
+    with patch.object(rpc_client, '_fetch_rich_list_page', side_effect=get_rich_list):
+        entries = list(rpc_client.iter_rich_list(page_size=1))
+        resumed = list(rpc_client.iter_rich_list(Page_Cursor(page=PAGE_NUMBER_MAX + 5, page_size=1, epoch=150)))
+
+    assert len(entries) == PAGE_NUMBER_MAX + 20
+    assert [entry['identity'] for entry in resumed] == [f'ID{rank}' for rank in range(PAGE_NUMBER_MAX + 4, PAGE_NUMBER_MAX + 20)]
@@ -0,0 +1,146 @@
+import base64
+import pytest
+from unittest.mock import patch, Mock
+from qubipy.rpc.rpc_client import QubiPy_RPC
+from qubipy.core.core_client import QubiPy_Core
+from qubipy.cache.archive import Tick_Archive, ARCHIVE_TICK_DATA
+from qubipy.models import *
+from ..conftest import *
+
+""" TYPED MODELS TESTS """
+
+def make_response(data):
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = data
+    return response
+
+@pytest.fixture
+def models_client():
+    return QubiPy_RPC(rpc_url=RPC_URL, models=True)
+
+def test_models_are_off_by_default(rpc_client, mock_balance_response, sample_balance_data, sample_wallet_id):
+    """
+    Test that clients keep returning dictionaries unless created with models=True.
+    """
+    with patch('requests.Session.get', return_value=mock_balance_response):
+        assert rpc_client.get_balance(sample_wallet_id) == sample_balance_data
+
+def test_get_balance_returns_model(models_client, mock_balance_response, sample_wallet_id):
+    """
+    Test that balances are converted to a slotted Balance with integer amounts.
+    """
+    with patch('requests.Session.get', return_value=mock_balance_response):
+        balance = models_client.get_balance(sample_wallet_id)
+
+    assert isinstance(balance, Balance)
+    assert balance.balance == 20000000
+    assert balance.incoming_amount == 20783623007
+    assert balance.valid_for_tick == 17088186
+    assert not hasattr(balance, '__dict__')
+
+    with pytest.raises(AttributeError):
+        balance.balance = 0
+
+def test_approved_transactions_return_models(models_client, mock_approved_transaction_response, sample_approved_transaction_data, sample_tick):
+    """
+    Test that approved transactions are converted to a list of Transaction.
+    """
+    with patch('requests.Session.get', return_value=mock_approved_transaction_response):
+        transactions = models_client.get_approved_transaction_for_tick(sample_tick)
+
+    assert [tx.tx_id for tx in transactions] == [tx['txId'] for tx in sample_approved_transaction_data]
+    assert transactions[0].amount == 47472785
+    assert transactions[0].tick_number == 17056942
+    assert transactions[0].signature_hex == sample_approved_transaction_data[0]['signatureHex']
+
+def test_asset_records_keep_their_info(models_client, mock_possessed_assets_response, sample_identity):
+    """
+    Test that nested asset records are converted, keeping the tick and universe index of the record.
+    """
+    with patch('requests.Session.get', return_value=mock_possessed_assets_response):
+        possessions = models_client.get_possessed_assets(sample_identity)
+
+    possession = possessions[0]
+    assert isinstance(possession, Asset_Possession)
+    assert possession.number_of_units == 130510491365
+    assert possession.tick == 17089367
+    assert possession.universe_index == 12267530
+    assert possession.owned_asset.issued_asset.name == 'CFB'
+    assert possession.owned_asset.issued_asset.unit_of_measurement == (0, -48, 0, -48, 35, 24, 21)
+
+def test_transfer_transactions_per_tick_return_models(models_client, sample_wallet_id, sample_approved_transaction_data):
+    """
+    Test that transfers are grouped per tick as Tick_Transfers.
+    """
+    data = {'transferTransactionsPerTick': [{'tickNumber': 17056942, 'identity': sample_wallet_id, 'transactions': sample_approved_transaction_data}]}
+
+    with patch('requests.Session.get', return_value=make_response(data)):
+        transfers = models_client.get_transfer_transactions_per_tick(sample_wallet_id, 17056900, 17057000)
+
+    assert transfers[0].tick_number == 17056942
+    assert transfers[0].transactions[0].amount == 47472785
+
+def test_empty_responses_are_unchanged(models_client, sample_tick):
+    """
+    Test that an empty response is not turned into a model full of defaults.
+    """
+    with patch('requests.Session.get', return_value=make_response({'tickData': None})):
+        assert models_client.get_tick_data(sample_tick) is None
+
+def test_tick_data_with_archive_stores_raw_data(tmp_path, sample_tick):
+    """
+    Test that tick data archived through a models client can be read back by any client.
+    """
+    tick_data = {'computorIndex': 5, 'epoch': 150, 'tickNumber': sample_tick, 'timestamp': '2024-09-18T12:00:00Z',
+                 'varStruct': '', 'timeLock': 'AA==', 'transactionIds': ['abc'], 'contractFees': [], 'signatureHex': 'ff'}
+    archive = Tick_Archive(str(tmp_path / 'ticks.db'))
+    client = QubiPy_RPC(rpc_url=RPC_URL, archive=archive, models=True)
+
+    with patch('requests.Session.get', return_value=make_response({'tickData': tick_data})) as mock_get:
+        assert client.get_tick_data(sample_tick).transaction_ids == ('abc',)
+        assert client.get_tick_data(sample_tick).tick_number == sample_tick
+
+    assert mock_get.call_count == 1
+    assert archive.get(ARCHIVE_TICK_DATA, sample_tick) == tick_data
+
+    archive.put(ARCHIVE_TICK_DATA, sample_tick + 1, Tick_Data.from_dict(tick_data))
+    assert archive.get(ARCHIVE_TICK_DATA, sample_tick + 1) == tick_data
+
+def test_core_transactions_are_decoded_to_hex():
+    """
+    Test that the base64 input and signature of Core transactions are exposed as hex.
+    """
+    signature = bytes(range(64))
+    data = {'transactions': [{'sourceId': 'A' * 60, 'destId': 'B' * 60, 'amount': '1000', 'tick': 17230129, 'inputType': 2, 'inputSize': 2,
+                              'input': base64.b64encode(b'\x01\x02').decode(), 'signature': base64.b64encode(signature).decode(),
+                              'txId': 'c' * 60, 'digest': 'd' * 64}]}
+    core_client = QubiPy_Core(core_url=CORE_URL, models=True)
+
+    with patch('requests.Session.post', return_value=make_response(data)):
+        transactions = core_client.get_tick_transactions(17230129)
+
+    assert transactions[0].tick_number == 17230129
+    assert transactions[0].input_hex == '0102'
+    assert transactions[0].signature_hex == signature.hex()
+    assert transactions[0].digest == 'd' * 64
+
+def test_qx_orders_and_bets_return_models():
+    """
+    Test that Qx order books become lists of Qx_Order and bets lose their NUL padding.
+    """
+    core_client = QubiPy_Core(core_url=CORE_URL, models=True)
+    orders = {'orders': [{'entityId': 'A' * 60, 'price': '10', 'numberOfShares': '3'}]}
+    bet = {'id': 7, 'creatorId': 'A' * 60, 'description': 'Will it rain?\x00\x00', 'options': [{'description': 'yes\x00', 'state': 0}],
+           'oracles': [{'id': 'B' * 60, 'feePercentage': 50}], 'votes': [], 'minimumBetAmount': '10000', 'maximumBetSlotPerOption': 100,
+           'openTime': '24-09-18 00:00:00', 'closeTime': '24-09-19 00:00:00', 'endTime': '24-09-20 00:00:00'}
+
+    with patch('requests.Session.get', return_value=make_response(orders)):
+        assert core_client.get_qx_asset_ask_orders('CFB', 'A' * 60, '0') == [Qx_Order(price=10, number_of_shares=3, entity_id='A' * 60)]
+
+    with patch('requests.Session.get', return_value=make_response(bet)):
+        quottery_bet = core_client.get_bet_info(7)
+
+    assert quottery_bet.description == 'Will it rain?'
+    assert quottery_bet.options == (Bet_Option('yes', 0),)
+    assert quottery_bet.minimum_bet_amount == 10000
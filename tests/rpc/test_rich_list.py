@@ -15,7 +15,7 @@ def test_get_rich_list_success(mock_rich_list_response, sample_rich_list_data, r
     Verifies that the function returns the expected rich list when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_rich_list_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_rich_list_response) as mock_get:
         result = rpc_client.get_rich_list(sample_page, sample_page_size)
         
         
@@ -48,7 +48,7 @@ def test_get_rich_list_http_error(mock_http_error_response, rpc_client, sample_p
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rich_list(sample_page, sample_page_size)
         
@@ -67,7 +67,7 @@ def test_get_rich_list_request_exception(rpc_client, sample_page, sample_page_si
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rich_list(sample_page, sample_page_size)
         
@@ -86,7 +86,7 @@ def test_get_rich_list_timeout(mock_timeout_response, rpc_client, sample_page, s
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_rich_list(sample_page, sample_page_size)
         
@@ -0,0 +1,184 @@
+import pytest
+import requests
+import threading
+from unittest.mock import patch
+from qubipy.rpc.rpc_client import QubiPy_RPC
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.concurrency import Adaptive_Chunks, ordered_map
+from qubipy.models import Transaction
+from ..conftest import *
+
+""" SCAN TRANSFER TRANSACTIONS TESTS """
+
+IDENTITY = 'EGOCTGJSNPNEJFSSCTOKAEBKMEEDGLXXVFFHUWHBFEHZOGLMEMAUQZOAVKAN'
+
+def fail_with(error):
+    """
+    Raises `error` wrapped the way the client methods wrap transport errors.
+    """
+    try:
+        raise error
+    except requests.RequestException as E:
+        raise QubiPy_Exceptions(f'Failed to retrieve the transfer transactions: {str(E)}') from None
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f'{status} Error', response=response)
+
+def make_transfers(ticks, max_span=None, error=None):
+    """
+    Returns a fake get_transfer_transactions_per_tick with one transfer on each of `ticks`. Ranges wider
+    than `max_span` fail with `error`, a 504 server-side timeout by default.
+    """
+    lock = threading.Lock()
+    calls = []
+
+    def get_transfer_transactions_per_tick(identity, start_tick, end_tick):
+        with lock:
+            calls.append((start_tick, end_tick))
+        if max_span is not None and end_tick - start_tick + 1 > max_span:
+            fail_with(error if error is not None else http_error(504))
+        return {'transferTransactionsPerTick': [
+            {'tickNumber': tick, 'identity': identity, 'transactions': [{'txId': f'tx{tick}', 'tickNumber': tick, 'amount': '1'}]}
+            for tick in reversed(ticks) if start_tick <= tick <= end_tick
+        ]}
+
+    return get_transfer_transactions_per_tick, calls
+
+def test_scan_yields_transfers_in_tick_order(rpc_client):
+    """
+    Test that chunks fetched concurrently are merged in tick order.
+    """
+    ticks = list(range(1000, 5000, 37))
+    fake, calls = make_transfers(ticks)
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake):
+        transfers = list(rpc_client.scan_transfer_transactions(IDENTITY, 1000, 4999, chunk_size=250, min_chunk_size=50, max_chunk_size=250, max_workers=4))
+
+    assert [tx['tickNumber'] for tx in transfers] == ticks
+    assert len(calls) == 16
+
+def test_scan_splits_failing_chunks(rpc_client):
+    """
+    Test that a chunk failing server-side is split until it succeeds, without losing transfers, and
+    that only the chunks cut before the first failure keep the initial size.
+    """
+    ticks = list(range(1, 1001, 10))
+    fake, calls = make_transfers(ticks, max_span=100)
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake):
+        transfers = list(rpc_client.scan_transfer_transactions(IDENTITY, 1, 1000, chunk_size=400, min_chunk_size=50, max_workers=1))
+
+    assert [tx['txId'] for tx in transfers] == [f'tx{tick}' for tick in ticks]
+    assert sum(1 for start, end in calls if end - start + 1 > 200) <= 2
+
+def test_scan_splits_chunks_that_time_out(rpc_client):
+    """
+    Test that a chunk whose request timed out is split like a chunk answered with a 5xx.
+    """
+    ticks = list(range(1, 401, 10))
+    fake, calls = make_transfers(ticks, max_span=100, error=requests.exceptions.ReadTimeout('read timed out'))
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake):
+        transfers = list(rpc_client.scan_transfer_transactions(IDENTITY, 1, 400, chunk_size=400, min_chunk_size=50, max_workers=1))
+
+    assert [tx['txId'] for tx in transfers] == [f'tx{tick}' for tick in ticks]
+
+@pytest.mark.parametrize("error", [http_error(400), http_error(404), requests.exceptions.ConnectionError('refused')])
+def test_scan_raises_other_errors_at_once(rpc_client, error):
+    """
+    Test that errors a smaller chunk would not fix are raised at once, without splitting or retrying.
+    """
+    fake, calls = make_transfers([5], max_span=0, error=error)
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake), patch('qubipy.concurrency.time.sleep'):
+        with pytest.raises(QubiPy_Exceptions):
+            list(rpc_client.scan_transfer_transactions(IDENTITY, 1, 400, chunk_size=400, min_chunk_size=50, max_workers=1))
+
+    assert calls == [(1, 400)]
+
+def test_ordered_map_window_limits_the_items_pulled_ahead():
+    """
+    Test that at most `window` items are pulled before the first result, so lazily cut chunks are sized
+    with the feedback of the chunks already fetched.
+    """
+    pulled = []
+
+    def items():
+        for item in range(100):
+            pulled.append(item)
+            yield item
+
+    results = ordered_map(lambda item: item, items(), max_workers=4, window=4)
+    assert next(results) == (0, 0)
+    assert len(pulled) == 5
+    results.close()
+
+def test_scan_deduplicates_transactions(rpc_client):
+    """
+    Test that a transaction listed twice for the same tick is yielded once.
+    """
+    def fake(identity, start_tick, end_tick):
+        tx = {'txId': 'dup', 'tickNumber': 10}
+        return {'transferTransactionsPerTick': [{'tickNumber': 10, 'identity': identity, 'transactions': [tx, tx]}]}
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake):
+        assert list(rpc_client.scan_transfer_transactions(IDENTITY, 10, 10)) == [{'txId': 'dup', 'tickNumber': 10}]
+
+def test_scan_raises_when_smallest_chunk_fails(rpc_client):
+    """
+    Test that a chunk that still fails at the smallest size raises after its retries.
+    """
+    fake, calls = make_transfers([5], max_span=0)
+
+    with patch.object(rpc_client, 'get_transfer_transactions_per_tick', side_effect=fake), patch('qubipy.concurrency.time.sleep'):
+        with pytest.raises(QubiPy_Exceptions):
+            list(rpc_client.scan_transfer_transactions(IDENTITY, 1, 10, chunk_size=10, min_chunk_size=10, retries=2))
+
+    assert len(calls) == 4
+
+def test_scan_with_models():
+    """
+    Test that the scanner works with clients returning models.
+    """
+    client = QubiPy_RPC(rpc_url=RPC_URL, models=True)
+    data = {'transferTransactionsPerTick': [{'tickNumber': 7, 'identity': IDENTITY, 'transactions': [{'txId': 'a', 'tickNumber': 7, 'amount': '3'}]}]}
+
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = data
+        transfers = list(client.scan_transfer_transactions(IDENTITY, 7, 7))
+
+    assert isinstance(transfers[0], Transaction)
+    assert transfers[0].amount == 3
+
+def test_adaptive_chunks_grow_and_shrink():
+    """
+    Test that fast chunks double the size up to the maximum and failures halve it down to the minimum.
+    """
+    chunks = Adaptive_Chunks(1, 10 ** 6, size=100, min_size=10, max_size=400, target_seconds=2)
+
+    chunks.record_success(100, 0.1)
+    chunks.record_success(200, 0.1)
+    chunks.record_success(400, 0.1)
+    assert chunks.size == 400
+
+    chunks.record_success(400, 1.5)
+    assert chunks.size == 400
+
+    chunks.record_failure(400)
+    chunks.record_failure(200)
+    chunks.record_failure(100)
+    chunks.record_failure(50)
+    chunks.record_failure(25)
+    assert chunks.size == 12
+    chunks.record_failure(12)
+    assert chunks.size == 10
+
+@pytest.mark.parametrize("identity, start_tick, end_tick", [('bad', 1, 10), (IDENTITY, None, 10), (IDENTITY, 10, 5)])
+def test_scan_invalid_arguments(rpc_client, identity, start_tick, end_tick):
+    """
+    Test that invalid identities and tick ranges are rejected up front.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        rpc_client.scan_transfer_transactions(identity, start_tick, end_tick)
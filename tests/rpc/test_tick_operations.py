@@ -16,7 +16,7 @@ def test_get_tick_info_success(mock_tick_rpc_response, sample_rpc_tick_info_data
     Verifies that the function returns the expected tick information when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_tick_rpc_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_tick_rpc_response) as mock_get:
         result = rpc_client.get_tick_info()
         
         assert result == sample_rpc_tick_info_data
@@ -35,7 +35,7 @@ def test_get_tick_info_http_error(mock_http_error_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_info()
         
@@ -53,7 +53,7 @@ def test_get_tick_info_request_exception(rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_info()
         
@@ -71,7 +71,7 @@ def test_get_tick_info_timeout(mock_timeout_response, rpc_client):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_info()
         
@@ -92,7 +92,7 @@ def test_get_tick_data_success(mock_tick_data_response, sample_tick_data, rpc_cl
     Verifies that the function returns the expected tick data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_tick_data_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_tick_data_response) as mock_get:
         result = rpc_client.get_tick_data(sample_tick)
         
         assert result == sample_tick_data
@@ -123,7 +123,7 @@ def test_get_tick_data_http_error(mock_http_error_response, rpc_client, sample_t
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_data(sample_tick)
         
@@ -141,7 +141,7 @@ def test_get_tick_data_request_exception(rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_data(sample_tick)
         
@@ -159,7 +159,7 @@ def test_get_tick_data_timeout(mock_timeout_response, rpc_client, sample_tick):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_tick_data(sample_tick)
         
@@ -18,7 +18,7 @@ def test_get_transaction_success(mock_transaction_response, sample_transaction_d
     Verifies that the function returns the expected transaction data when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_transaction_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_transaction_response) as mock_get:
         result = rpc_client.get_transaction(sample_tx_id)
         
         assert result == sample_transaction_data
@@ -49,7 +49,7 @@ def test_get_transaction_http_error(mock_http_error_response, rpc_client, sample
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction(sample_tx_id)
         
@@ -67,7 +67,7 @@ def test_get_transaction_request_exception(rpc_client, sample_tx_id):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction(sample_tx_id)
         
@@ -85,7 +85,7 @@ def test_get_transaction_timeout(rpc_client, sample_tx_id):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction(sample_tx_id)
         
@@ -105,7 +105,7 @@ def test_get_transaction_status_success(mock_transaction_status_response, sample
     Verifies that the function returns the expected transaction status when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_transaction_status_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_transaction_status_response) as mock_get:
         result = rpc_client.get_transaction_status(sample_tx_id)
         
         assert result == sample_transaction_status_data
@@ -136,7 +136,7 @@ def test_get_transaction_status_http_error(mock_http_error_response, rpc_client,
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the API responds with an HTTP error.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction_status(sample_tx_id)
         
@@ -154,7 +154,7 @@ def test_get_transaction_status_request_exception(rpc_client, sample_tx_id):
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when a network-related error occurs.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction_status(sample_tx_id)
         
@@ -172,7 +172,7 @@ def test_get_transaction_status_timeout(mock_timeout_response, rpc_client, sampl
     Verifies that the function raises a QubiPy_Exceptions exception with an
     appropriate message when the request times out.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transaction_status(sample_tx_id)
         
@@ -192,7 +192,7 @@ def test_get_transfer_transactions_per_tick_success(mock_transfer_transactions_r
     Verifies that the function returns the expected transfer transactions when the API
     responds successfully.
     """
-    with patch('requests.get', return_value=mock_transfer_transactions_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_transfer_transactions_response) as mock_get:
         result = rpc_client.get_transfer_transactions_per_tick(
             sample_transfer_params['identity'],
             sample_transfer_params['start_tick'],
@@ -244,7 +244,7 @@ def test_get_transfer_transactions_per_tick_http_error(mock_http_error_response,
     """
     Test the get_transfer_transactions_per_tick method for handling an HTTP error response.
     """
-    with patch('requests.get', return_value=mock_http_error_response) as mock_get:
+    with patch('requests.Session.get', return_value=mock_http_error_response) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transfer_transactions_per_tick(
                 sample_transfer_params['identity'],
@@ -258,7 +258,7 @@ def test_get_transfer_transactions_per_tick_request_exception(rpc_client, sample
     """
     Test the get_transfer_transactions_per_tick method for handling a network-related exception.
     """
-    with patch('requests.get', side_effect=requests.RequestException("Network error")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.RequestException("Network error")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transfer_transactions_per_tick(
                 sample_transfer_params['identity'],
@@ -272,7 +272,7 @@ def test_get_transfer_transactions_per_tick_timeout(mock_timeout_response, rpc_c
     """
     Test the get_transfer_transactions_per_tick method for handling a timeout exception.
     """
-    with patch('requests.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
+    with patch('requests.Session.get', side_effect=requests.Timeout("Request timed out")) as mock_get:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.get_transfer_transactions_per_tick(
                 sample_transfer_params['identity'],
@@ -291,7 +291,7 @@ def test_broadcast_transaction_success(mock_broadcast_response, sample_broadcast
   Verifies that the function returns the expected bytearray response when the API
   successfully broadcasts the transaction.
   """
-  with patch('requests.post', return_value=mock_broadcast_response) as mock_post:
+  with patch('requests.Session.post', return_value=mock_broadcast_response) as mock_post:
       result = rpc_client.broadcast_transaction(sample_tx_bytes)
       
       assert result == sample_broadcast_response
@@ -331,7 +331,7 @@ def test_broadcast_transaction_http_error(mock_http_error_response, rpc_client,
     Test the broadcast_transaction method for handling an HTTP error response.
     """
     mock_http_error_response.status_code = 500
-    with patch('requests.post', return_value=mock_http_error_response) as mock_post:
+    with patch('requests.Session.post', return_value=mock_http_error_response) as mock_post:
         with pytest.raises(QubiPy_Exceptions) as exc_info:
             rpc_client.broadcast_transaction(sample_tx_bytes)
         
@@ -342,7 +342,7 @@ def test_broadcast_transaction_request_exception(rpc_client, sample_tx_bytes):
   """
   Test the broadcast_transaction method for handling a network-related exception.
   """
-  with patch('requests.post', side_effect=requests.RequestException("Network error")) as mock_post:
+  with patch('requests.Session.post', side_effect=requests.RequestException("Network error")) as mock_post:
       with pytest.raises(QubiPy_Exceptions) as exc_info:
           rpc_client.broadcast_transaction(sample_tx_bytes)
       
@@ -352,7 +352,7 @@ def test_broadcast_transaction_timeout(mock_timeout_response, rpc_client, sample
   """
   Test the broadcast_transaction method for handling a timeout exception.
   """
-  with patch('requests.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
+  with patch('requests.Session.post', side_effect=requests.Timeout("Request timed out")) as mock_post:
       with pytest.raises(QubiPy_Exceptions) as exc_info:
           rpc_client.broadcast_transaction(sample_tx_bytes)
       
@@ -370,7 +370,7 @@ def test_broadcast_transaction_400_error(rpc_client, sample_tx_bytes):
   }
   error_response.raise_for_status.side_effect = requests.HTTPError("400 Client Error")
   
-  with patch('requests.post', return_value=error_response) as mock_post:
+  with patch('requests.Session.post', return_value=error_response) as mock_post:
       with pytest.raises(QubiPy_Exceptions) as exc_info:
           rpc_client.broadcast_transaction(sample_tx_bytes)
       
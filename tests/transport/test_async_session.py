@@ -0,0 +1,140 @@
+import pytest
+import asyncio
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.cache.ttl import TTL_Cache
+from qubipy.transport.retry import Retry_Policy
+from qubipy.transport.async_session import QubiPy_AsyncSession, ASYNC_REQUEST_ERRORS
+
+""" ASYNC SESSION TESTS """
+
+async def echo(request):
+    if request.method == 'POST':
+        return web.json_response({'body': await request.json()})
+    return web.json_response({'query': dict(request.query)})
+
+async def fail(request):
+    return web.json_response({'code': 5}, status=503)
+
+async def garbage(request):
+    return web.Response(text='not json')
+
+def build_app(hits=None):
+    hits = hits if hits is not None else {}
+    hits.update(flaky=0, slow=0)
+    app = web.Application()
+
+    async def flaky(request):
+        hits['flaky'] += 1
+        if hits['flaky'] < 3:
+            return web.json_response({'code': 5}, status=503)
+        return web.json_response({'ok': True})
+
+    async def slow(request):
+        hits['slow'] += 1
+        await asyncio.sleep(0.05)
+        return web.json_response({'tick': hits['slow']})
+
+    app.router.add_get('/echo', echo)
+    app.router.add_post('/echo', echo)
+    app.router.add_get('/fail', fail)
+    app.router.add_get('/flaky', flaky)
+    app.router.add_get('/slow', slow)
+    app.router.add_get('/garbage', garbage)
+    return app
+
+def test_async_session_round_trip():
+    """
+    Test GET and POST requests against a local server, including dropping
+    query parameters whose value is None and reusing one pooled connection.
+    """
+    async def run():
+        async with TestServer(build_app()) as server, QubiPy_AsyncSession(pool_limit=4, pool_maxsize=2) as session:
+            response = await session.get(str(server.make_url('/echo')), params={'page': 1, 'pageSize': None}, timeout=5)
+            response.raise_for_status()
+            assert response.json() == {'query': {'page': '1'}}
+
+            response = await session.post(str(server.make_url('/echo')), json={'tick': 1}, timeout=5)
+            assert response.json() == {'body': {'tick': 1}}
+
+            connector = session._get_session().connector
+            assert connector.limit == 4
+            assert connector.limit_per_host == 2
+
+    asyncio.run(run())
+
+def test_async_session_raise_for_status():
+    """
+    Test that error status codes raise aiohttp.ClientResponseError after the body has been read.
+    """
+    async def run():
+        async with TestServer(build_app()) as server, QubiPy_AsyncSession() as session:
+            response = await session.get(str(server.make_url('/fail')))
+            assert response.json() == {'code': 5}
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                response.raise_for_status()
+            assert exc_info.value.status == 503
+
+    asyncio.run(run())
+
+@pytest.mark.parametrize("pool_limit, pool_maxsize", [(0, 10), (10, 0)])
+def test_async_session_invalid_pool_config(pool_limit, pool_maxsize):
+    """
+    Test that invalid pool sizes raise a QubiPy_Exceptions with INVALID_POOL_CONFIG.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        QubiPy_AsyncSession(pool_limit=pool_limit, pool_maxsize=pool_maxsize)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_POOL_CONFIG
+
+def test_async_session_retries_with_policy():
+    """
+    Test that a retry policy retries retryable status codes, and that the last response is returned once it is exhausted.
+    """
+    async def run():
+        hits = {}
+        policy = Retry_Policy(max_attempts=3, backoff_factor=0, jitter=False)
+        async with TestServer(build_app(hits)) as server, QubiPy_AsyncSession(retry=policy) as session:
+            response = await session.get(str(server.make_url('/flaky')))
+            assert response.json() == {'ok': True}
+            assert hits['flaky'] == 3
+
+            response = await session.get(str(server.make_url('/fail')))
+            assert response.status_code == 503
+
+    asyncio.run(run())
+
+def test_async_session_coalesces_cached_requests():
+    """
+    Test that concurrent identical GETs share one request and that the response is then served from the cache.
+    """
+    async def run():
+        hits = {}
+        cache = TTL_Cache({'/slow': 60})
+        async with TestServer(build_app(hits)) as server, QubiPy_AsyncSession(response_cache=cache) as session:
+            url = str(server.make_url('/slow'))
+            responses = await asyncio.gather(*(session.get(url) for _ in range(5)))
+            assert {response.json()['tick'] for response in responses} == {1}
+
+            assert (await session.get(url)).json() == {'tick': 1}
+            assert (await session.get(url, params={'page': 2})).json() == {'tick': 2}
+            assert hits['slow'] == 2
+
+    asyncio.run(run())
+
+def test_async_session_invalid_json_is_a_request_error():
+    """
+    Test that an invalid JSON body raises an error the async clients handle, without catching every ValueError.
+    """
+    async def run():
+        async with TestServer(build_app()) as server, QubiPy_AsyncSession() as session:
+            response = await session.get(str(server.make_url('/garbage')))
+            with pytest.raises(ASYNC_REQUEST_ERRORS):
+                response.json()
+
+    asyncio.run(run())
+    assert not issubclass(ValueError, ASYNC_REQUEST_ERRORS)
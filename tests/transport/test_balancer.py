@@ -0,0 +1,137 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from urllib3.exceptions import NewConnectionError
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.transport.balancer import Endpoint_Pool
+from qubipy.transport.session import QubiPy_Session
+from qubipy.rpc.rpc_client import QubiPy_RPC
+from qubipy.endpoints_rpc import BROADCAST_TRANSACTION, LATEST_TICK
+from ..conftest import *
+
+""" LOAD BALANCING AND FAILOVER TESTS """
+
+NODES = ['https://node-a.example/v1', 'https://node-b.example/v1', 'https://node-c.example/v1']
+
+def make_response(status_code, payload=None):
+    response = MagicMock(status_code=status_code, ok=status_code < 400)
+    response.json.return_value = payload or {}
+    return response
+
+def test_rpc_client_balances_requests_across_nodes():
+    """
+    Test that a client built with several URLs routes requests to the node with the lowest latency.
+    """
+    rpc_client = QubiPy_RPC(rpc_url=NODES)
+    pool = rpc_client.endpoints
+
+    assert rpc_client.rpc_url == NODES[0]
+    pool.record(pool.endpoints[0], 0.300, True)
+    pool.record(pool.endpoints[1], 0.020, True)
+    pool.record(pool.endpoints[2], 0.100, True)
+
+    with patch('requests.Session.request', return_value=make_response(200, {'latestTick': 7})) as mock_request:
+        assert rpc_client.get_latest_tick() == 7
+
+    assert mock_request.call_args.args[1] == f'{NODES[1]}{LATEST_TICK}'
+
+def test_unmeasured_nodes_are_tried_first():
+    """
+    Test that nodes without latency samples are preferred so every node gets measured.
+    """
+    pool = Endpoint_Pool(NODES)
+    pool.record(pool.endpoints[0], 0.01, True)
+    pool.record(pool.endpoints[2], 0.01, True)
+
+    assert pool.ranked()[0].url == NODES[1]
+
+def test_failover_to_next_node_on_error():
+    """
+    Test that a failing node is skipped for the same request and dropped after repeated failures.
+    """
+    session = QubiPy_Session()
+    pool = Endpoint_Pool(NODES, failure_threshold=2)
+    session.add_endpoint_pool(pool)
+    calls = []
+
+    def fake_transmit(method, url, *args, **kwargs):
+        calls.append(url)
+        if url.startswith(NODES[0]):
+            raise requests.ReadTimeout()
+        return make_response(200)
+
+    with patch.object(session, '_transmit', side_effect=fake_transmit):
+        for _ in range(3):
+            assert session.get(f'{NODES[0]}{LATEST_TICK}').status_code == 200
+
+    assert calls.count(f'{NODES[0]}{LATEST_TICK}') == 2
+    assert pool.endpoints[0].down_until > 0
+    assert pool.ranked()[-1].url == NODES[0]
+
+def test_failover_on_server_error():
+    """
+    Test that 5xx responses from one node fail over to another one.
+    """
+    session = QubiPy_Session()
+    session.add_endpoint_pool(Endpoint_Pool(NODES[:2]))
+    responses = [make_response(503), make_response(200)]
+
+    with patch.object(session, '_transmit', side_effect=responses) as mock_transmit:
+        assert session.get(f'{NODES[0]}{LATEST_TICK}').status_code == 200
+
+    assert mock_transmit.call_count == 2
+
+def test_broadcast_only_fails_over_when_never_sent():
+    """
+    Test that a broadcast is not replayed on another node once it may have reached the first one.
+    """
+    session = QubiPy_Session()
+    session.add_endpoint_pool(Endpoint_Pool(NODES[:2]))
+    url = f'{NODES[0]}{BROADCAST_TRANSACTION}'
+
+    with patch.object(session, '_transmit', side_effect=requests.ReadTimeout()) as mock_transmit:
+        with pytest.raises(requests.ReadTimeout):
+            session.post(url, json={})
+    assert mock_transmit.call_count == 1
+
+    refused = requests.ConnectionError(MagicMock(reason=NewConnectionError(None, 'refused')))
+    with patch.object(session, '_transmit', side_effect=[refused, make_response(200)]) as mock_transmit:
+        assert session.post(url, json={}).status_code == 200
+    assert mock_transmit.call_count == 2
+
+def test_check_endpoints_marks_unhealthy_nodes_down():
+    """
+    Test that the health check takes failing nodes out of rotation and measures the others.
+    """
+    session = QubiPy_Session()
+    pool = Endpoint_Pool(NODES[:2], health_endpoint='/healthcheck')
+    session.add_endpoint_pool(pool)
+
+    def fake_transmit(method, url, *args, **kwargs):
+        return make_response(500 if url.startswith(NODES[0]) else 200)
+
+    with patch.object(session, '_transmit', side_effect=fake_transmit):
+        session.check_endpoints()
+
+    assert pool.ranked()[0].url == NODES[1]
+    assert pool.endpoints[1].latency is not None
+    assert pool.endpoints[0].down_until > 0
+
+@pytest.mark.parametrize("urls", [[], [''], 'https://rpc.qubic.org/v1'])
+def test_invalid_endpoints(urls):
+    """
+    Test that empty endpoint lists raise a QubiPy_Exceptions with INVALID_ENDPOINTS.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        Endpoint_Pool(urls)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_ENDPOINTS
+
+def test_endpoints_require_qubipy_session():
+    """
+    Test that balancing across several URLs is refused with a plain requests session.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        QubiPy_RPC(rpc_url=NODES, session=requests.Session())
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_ENDPOINTS
@@ -0,0 +1,134 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from qubipy.exceptions import QubiPy_Exceptions, QubiPy_Circuit_Open
+from qubipy.transport.circuit import Circuit_Breaker, CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN, DEFAULT_GROUP
+from qubipy.transport.balancer import Endpoint_Pool
+from qubipy.transport.session import QubiPy_Session
+from qubipy.core.core_client import QubiPy_Core
+from qubipy.endpoints_rpc import TICK_DATA, LATEST_TICK
+from ..conftest import *
+
+""" CIRCUIT BREAKER TESTS """
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch('qubipy.transport.circuit.time.monotonic', side_effect=fake.monotonic):
+        yield fake
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    """
+    Test that a circuit opens after the failure threshold and that a success resets the count.
+    """
+    breaker = Circuit_Breaker(failure_threshold=3, recovery_timeout=10)
+    url = f'{CORE_URL}/core/getTickInfo'
+    circuit = breaker.acquire(url)
+
+    circuit.record_failure()
+    circuit.record_failure()
+    circuit.record_success()
+    circuit.record_failure()
+    circuit.record_failure()
+    assert breaker.state(url) == CIRCUIT_CLOSED
+
+    circuit.record_failure()
+    assert breaker.state(url) == CIRCUIT_OPEN
+
+    with pytest.raises(QubiPy_Circuit_Open) as exc_info:
+        breaker.acquire(url)
+    assert exc_info.value.retry_in == pytest.approx(10)
+    assert exc_info.value.group == DEFAULT_GROUP
+
+def test_half_open_allows_one_trial(clock):
+    """
+    Test that after the recovery timeout a single trial goes through, closing the circuit on success
+    and reopening it on failure.
+    """
+    breaker = Circuit_Breaker(failure_threshold=1, recovery_timeout=5, half_open_max_calls=1)
+    url = f'{CORE_URL}/core/getTickInfo'
+    breaker.acquire(url).record_failure()
+
+    clock.now += 5
+    assert breaker.state(url) == CIRCUIT_HALF_OPEN
+    trial = breaker.acquire(url)
+    with pytest.raises(QubiPy_Circuit_Open):
+        breaker.acquire(url)
+
+    trial.record_failure()
+    assert breaker.state(url) == CIRCUIT_OPEN
+
+    clock.now += 5
+    breaker.acquire(url).record_success()
+    assert breaker.state(url) == CIRCUIT_CLOSED
+    breaker.acquire(url)
+
+def test_circuits_are_per_base_url_and_group(clock):
+    """
+    Test that a failing endpoint group does not open the circuit of other groups or hosts.
+    """
+    breaker = Circuit_Breaker(failure_threshold=1, groups={'ticks': [TICK_DATA]})
+
+    breaker.acquire(f'{RPC_URL}/ticks/100/tick-data').record_failure()
+
+    assert breaker.state(f'{RPC_URL}/ticks/200/tick-data') == CIRCUIT_OPEN
+    assert breaker.state(f'{RPC_URL}{LATEST_TICK}') == CIRCUIT_CLOSED
+    assert breaker.state(f'{CORE_URL}/ticks/200/tick-data') == CIRCUIT_CLOSED
+
+def test_core_client_fails_fast_while_open():
+    """
+    Test that once the circuit is open, QubiPy_Core raises QubiPy_Circuit_Open without sending anything.
+    """
+    core_client = QubiPy_Core(circuit_breaker=Circuit_Breaker(failure_threshold=2, recovery_timeout=60))
+
+    with patch('requests.Session.request', side_effect=requests.ConnectTimeout('timed out')) as mock_request:
+        for _ in range(2):
+            with pytest.raises(QubiPy_Exceptions) as exc_info:
+                core_client.get_tick_info()
+            assert not isinstance(exc_info.value, QubiPy_Circuit_Open)
+
+        with pytest.raises(QubiPy_Circuit_Open):
+            core_client.get_tick_info()
+
+    assert mock_request.call_count == 2
+
+def test_server_errors_count_as_failures():
+    """
+    Test that 5xx responses open the circuit while 4xx responses do not.
+    """
+    breaker = Circuit_Breaker(failure_threshold=2)
+    session = QubiPy_Session(circuit_breaker=breaker)
+    url = f'{RPC_URL}{LATEST_TICK}'
+
+    with patch('requests.Session.request', return_value=MagicMock(status_code=404)):
+        for _ in range(3):
+            session.get(url)
+    assert breaker.state(url) == CIRCUIT_CLOSED
+
+    with patch('requests.Session.request', return_value=MagicMock(status_code=503)):
+        session.get(url)
+        session.get(url)
+    assert breaker.state(url) == CIRCUIT_OPEN
+
+def test_balancer_skips_open_circuits():
+    """
+    Test that a node whose circuit is open is skipped in favour of the next node.
+    """
+    nodes = ['https://node-a.example/v1', 'https://node-b.example/v1']
+    breaker = Circuit_Breaker(failure_threshold=1)
+    session = QubiPy_Session(circuit_breaker=breaker)
+    session.add_endpoint_pool(Endpoint_Pool(nodes))
+    breaker.acquire(f'{nodes[0]}{LATEST_TICK}').record_failure()
+
+    with patch('requests.Session.request', return_value=MagicMock(status_code=200)) as mock_request:
+        session.get(f'{nodes[0]}{LATEST_TICK}')
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args.args[1] == f'{nodes[1]}{LATEST_TICK}'
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+import pytest
+import aiohttp
+from unittest.mock import MagicMock
+from qubipy.transport.hedging import Hedge_Policy
+from qubipy.transport.balancer import Endpoint_Pool
+from qubipy.transport.session import QubiPy_Session
+from qubipy.transport.async_session import QubiPy_AsyncSession
+from qubipy.endpoints_rpc import LATEST_TICK
+from ..conftest import *
+
+""" HEDGED REQUESTS TESTS """
+
+NODES = ['https://node-a.example/v1', 'https://node-b.example/v1']
+
+BALANCE_URL = f'{NODES[0]}/balances/{"A" * 60}'
+
+def make_session(slow_node, hedge):
+    session = QubiPy_Session(hedge=hedge)
+    pool = Endpoint_Pool(NODES)
+    pool.record(pool.endpoints[0], 0.01, True)
+    pool.record(pool.endpoints[1], 0.02, True)
+    session.add_endpoint_pool(pool)
+    release = threading.Event()
+    calls = []
+
+    def fake_transmit(method, url, *args, **kwargs):
+        calls.append(url)
+        if slow_node is not None and url.startswith(slow_node):
+            release.wait(2)
+        return MagicMock(status_code=200, url=url)
+
+    session._transmit = fake_transmit
+    return session, calls, release
+
+def test_hedge_wins_when_first_node_is_slow():
+    """
+    Test that a duplicate is sent to the second node after the hedge delay and its answer is returned.
+    """
+    hedge = Hedge_Policy(initial_delay=0.02, min_delay=0)
+    session, calls, release = make_session(NODES[0], hedge)
+
+    response = session.get(BALANCE_URL)
+    release.set()
+
+    assert response.url.startswith(NODES[1])
+    assert [url[:len(NODES[0])] for url in calls] == NODES
+    assert hedge.stats == {'requests': 1, 'fired': 1, 'won': 1}
+    session.close()
+
+def test_no_hedge_when_first_node_is_fast():
+    """
+    Test that no duplicate is sent when the first node answers within the hedge delay.
+    """
+    hedge = Hedge_Policy(initial_delay=1)
+    session, calls, _ = make_session(None, hedge)
+
+    assert session.get(BALANCE_URL).url.startswith(NODES[0])
+    assert len(calls) == 1
+    assert hedge.stats == {'requests': 1, 'fired': 0, 'won': 0}
+    session.close()
+
+def test_no_hedge_without_two_healthy_nodes():
+    """
+    Test that reads are sent once without a pool, or when only one node of the pool is in rotation.
+    """
+    hedge = Hedge_Policy(initial_delay=0.01, min_delay=0)
+    session, calls, release = make_session(NODES[0], hedge)
+    session.endpoint_pools[0].mark_down(session.endpoint_pools[0].endpoints[1])
+    release.set()
+
+    assert session.get(BALANCE_URL).url.startswith(NODES[0])
+    assert len(calls) == 1
+
+    session.endpoint_pools = []
+    assert session.get(f'{RPC_URL}/balances/{"A" * 60}').url.startswith(RPC_URL)
+    assert len(calls) == 2
+    assert hedge.stats == {'requests': 0, 'fired': 0, 'won': 0}
+    session.close()
+
+def test_hedge_fails_over_when_both_nodes_fail():
+    """
+    Test that a read fails over to the remaining nodes when both hedged requests fail.
+    """
+    hedge = Hedge_Policy(initial_delay=1)
+    session = QubiPy_Session(hedge=hedge)
+    nodes = NODES + ['https://node-c.example/v1']
+    pool = Endpoint_Pool(nodes)
+    for index, endpoint in enumerate(pool.endpoints):
+        pool.record(endpoint, 0.01 * (index + 1), True)
+    session.add_endpoint_pool(pool)
+    calls = []
+
+    def fake_transmit(method, url, *args, **kwargs):
+        calls.append(url[:len(NODES[0])])
+        return MagicMock(status_code=503 if not url.startswith(nodes[2]) else 200, url=url)
+
+    session._transmit = fake_transmit
+
+    assert session.get(BALANCE_URL).url.startswith(nodes[2])
+    assert sorted(calls[:2]) == NODES and calls[2:] == [nodes[2][:len(NODES[0])]]
+    assert hedge.stats == {'requests': 1, 'fired': 1, 'won': 0}
+    session.close()
+
+def test_only_configured_reads_are_hedged():
+    """
+    Test that endpoints outside the policy, and non-GET requests, are sent once.
+    """
+    hedge = Hedge_Policy()
+
+    assert hedge.applies('GET', BALANCE_URL)
+    assert hedge.applies('GET', f'{RPC_URL}/ticks/15000000/tick-data')
+    assert hedge.applies('GET', f'{RPC_URL}/transactions/{"a" * 60}')
+    assert not hedge.applies('GET', f'{RPC_URL}{LATEST_TICK}')
+    assert not hedge.applies('POST', BALANCE_URL)
+
+def test_hedge_delay_uses_latency_percentile():
+    """
+    Test that the delay is the configured percentile of recent latencies once enough were measured.
+    """
+    hedge = Hedge_Policy(percentile=90, initial_delay=0.5, min_delay=0.001, min_samples=10)
+
+    for latency in range(1, 10):
+        hedge.record_latency(latency / 100)
+    assert hedge.delay() == 0.5
+
+    hedge.record_latency(0.10)
+    assert hedge.delay() == pytest.approx(0.09)
+
+def test_async_hedge_cancels_the_slow_request():
+    """
+    Test that the async session returns the hedge's answer and cancels the slow request.
+    """
+    hedge = Hedge_Policy(initial_delay=0.02, min_delay=0)
+    session = QubiPy_AsyncSession(hedge=hedge)
+    session.add_endpoint_pool(Endpoint_Pool(NODES))
+    cancelled = []
+
+    async def fake_transmit(method, url, **kwargs):
+        if url.startswith(NODES[0]):
+            try:
+                await asyncio.sleep(2)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        return MagicMock(status_code=200, url=url)
+
+    session._transmit = fake_transmit
+
+    async def run():
+        response = await session.request('GET', BALANCE_URL)
+        await asyncio.sleep(0)
+        return response
+
+    started = time.monotonic()
+    response = asyncio.run(run())
+
+    assert time.monotonic() - started < 1
+    assert response.url.startswith(NODES[1])
+    assert cancelled == [BALANCE_URL]
+    assert hedge.stats == {'requests': 1, 'fired': 1, 'won': 1}
+
+def test_async_hedge_fails_over_when_both_nodes_fail():
+    """
+    Test that the async session fails over to the remaining nodes when both hedged requests fail,
+    and does not hedge without a pool.
+    """
+    hedge = Hedge_Policy(initial_delay=1)
+    session = QubiPy_AsyncSession(hedge=hedge)
+    nodes = NODES + ['https://node-c.example/v1']
+    session.add_endpoint_pool(Endpoint_Pool(nodes))
+    calls = []
+
+    async def fake_transmit(method, url, **kwargs):
+        calls.append(url)
+        if url.startswith(nodes[2]) or url.startswith(RPC_URL):
+            return MagicMock(status_code=200, url=url)
+        raise aiohttp.ClientConnectionError()
+
+    session._transmit = fake_transmit
+
+    response = asyncio.run(session.request('GET', BALANCE_URL))
+
+    assert response.url.startswith(nodes[2])
+    assert len(calls) == 3
+
+    asyncio.run(session.request('GET', f'{RPC_URL}/balances/{"A" * 60}'))
+    assert len(calls) == 4
+    assert hedge.stats == {'requests': 1, 'fired': 1, 'won': 0}
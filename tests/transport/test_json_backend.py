@@ -0,0 +1,83 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from qubipy import json_backend
+from qubipy.json_backend import set_json_decoder, get_json_decoder, decode_json, JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON
+from qubipy.transport.session import QubiPy_Session, QubiPy_Response
+from qubipy.rpc.rpc_client import QubiPy_RPC
+from qubipy.exceptions import QubiPy_Exceptions
+from ..conftest import *
+
+""" JSON BACKEND TESTS """
+
+@pytest.fixture(autouse=True)
+def restore_decoder():
+    yield
+    set_json_decoder(None)
+
+def make_response(content, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+def test_default_decoder_prefers_orjson():
+    """
+    Test that orjson is used when installed and the stdlib otherwise.
+    """
+    if json_backend.orjson is not None:
+        assert get_json_decoder() is json_backend.orjson.loads
+    else:
+        assert get_json_decoder() is json_backend._stdlib_loads
+
+    assert decode_json(b'{"latestTick": 17021024}') == {'latestTick': 17021024}
+
+def test_custom_decoder_receives_raw_bytes():
+    """
+    Test that a plugged decoder is called with the raw response bytes.
+    """
+    received = []
+
+    def decoder(data):
+        received.append(data)
+        return json.loads(data)
+
+    set_json_decoder(decoder)
+    rpc_client = QubiPy_RPC()
+
+    with patch('requests.Session.request', return_value=make_response(b'{"latestTick": 17021024}')):
+        assert rpc_client.get_latest_tick() == 17021024
+
+    assert received == [b'{"latestTick": 17021024}']
+
+@pytest.mark.parametrize("backend", [JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON])
+def test_invalid_json_keeps_requests_error(backend):
+    """
+    Test that invalid bodies raise requests' JSONDecodeError whatever the backend, so the clients
+    keep turning them into QubiPy_Exceptions.
+    """
+    if backend == JSON_BACKEND_ORJSON and json_backend.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    set_json_decoder(backend)
+    session = QubiPy_Session()
+
+    with patch('requests.Session.request', return_value=make_response(b'<html>oops</html>')):
+        response = session.get(f'{RPC_URL}/latestTick')
+
+    assert isinstance(response, QubiPy_Response)
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        response.json()
+
+    with patch('requests.Session.request', return_value=make_response(b'<html>oops</html>')):
+        with pytest.raises(QubiPy_Exceptions):
+            QubiPy_RPC().get_latest_tick()
+
+def test_orjson_backend_requires_orjson():
+    """
+    Test that requesting orjson without it installed raises an ImportError.
+    """
+    with patch.object(json_backend, 'orjson', None):
+        with pytest.raises(ImportError):
+            set_json_decoder(JSON_BACKEND_ORJSON)
@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.transport.rate_limit import Rate_Limiter, Token_Bucket
+from qubipy.core.core_client import QubiPy_Core
+from qubipy.config import MONERO_URL
+from ..conftest import *
+
+""" RATE LIMITER TESTS """
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch('qubipy.transport.rate_limit.time.monotonic', side_effect=fake.monotonic), \
+         patch('qubipy.transport.rate_limit.time.sleep', side_effect=fake.sleep) as mock_sleep:
+        fake.mock_sleep = mock_sleep
+        yield fake
+
+def test_bucket_allows_burst_then_paces(clock):
+    """
+    Test that a full bucket lets `burst` requests through at once, then one every 1/rate seconds.
+    """
+    bucket = Token_Bucket(rate=10, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.mock_sleep.call_count == 0
+
+    bucket.acquire()
+    bucket.acquire()
+    assert [call.args[0] for call in clock.mock_sleep.call_args_list] == pytest.approx([0.1, 0.1])
+
+def test_bucket_refills_while_idle(clock):
+    """
+    Test that tokens accumulate while idle, up to the burst size.
+    """
+    bucket = Token_Bucket(rate=2, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.mock_sleep.call_count == 0
+
+    bucket.acquire()
+    assert clock.mock_sleep.call_args.args[0] == pytest.approx(0.5)
+
+def test_bucket_async_waits_without_blocking(clock):
+    """
+    Test that async callers wait through asyncio.sleep instead of blocking the event loop.
+    """
+    bucket = Token_Bucket(rate=4, burst=1)
+
+    async def run():
+        with patch('qubipy.transport.rate_limit.asyncio.sleep') as mock_async_sleep:
+            await bucket.acquire_async()
+            await bucket.acquire_async()
+            return mock_async_sleep
+
+    mock_async_sleep = asyncio.run(run())
+
+    mock_async_sleep.assert_called_once()
+    assert mock_async_sleep.call_args.args[0] == pytest.approx(0.25)
+    assert clock.mock_sleep.call_count == 0
+
+def test_limiter_keeps_one_bucket_per_base_url():
+    """
+    Test that requests to the same host share a bucket while each host and override gets its own.
+    """
+    limiter = Rate_Limiter(rate=5, burst=5, limits={MONERO_URL: (1, 2)})
+
+    rpc_bucket = limiter.bucket_for(f'{RPC_URL}/latestTick')
+    assert limiter.bucket_for(f'{RPC_URL}/v1/status') is rpc_bucket
+    assert limiter.bucket_for(f'{CORE_URL}/v1/tick-info') is not rpc_bucket
+
+    monero_bucket = limiter.bucket_for(f'{MONERO_URL}/stats')
+    assert (monero_bucket.rate, monero_bucket.burst) == (1, 2)
+    assert (rpc_bucket.rate, rpc_bucket.burst) == (5, 5)
+
+@pytest.mark.parametrize("rate, burst", [(0, 5), (-1, 5), (5, 0), (5, 1.5), ("5", 5)])
+def test_invalid_rate_limit(rate, burst):
+    """
+    Test that non-positive rates and bursts raise a QubiPy_Exceptions with INVALID_RATE_LIMIT.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        Rate_Limiter(rate=rate, burst=burst)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_RATE_LIMIT
+
+def test_session_acquires_before_each_request():
+    """
+    Test that the session takes a token for the request's base URL before sending it,
+    including the Monero stats URL used by QubiPy_Core.
+    """
+    limiter = MagicMock(spec=Rate_Limiter)
+    core_client = QubiPy_Core(rate_limiter=limiter)
+
+    with patch('requests.Session.request', return_value=MagicMock(json=lambda: {'pool_blocks_found': 1}, raise_for_status=lambda: None)):
+        core_client.get_monero_mining_stats()
+
+    limiter.acquire.assert_called_once_with(f'{MONERO_URL}/stats')
@@ -0,0 +1,160 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from urllib3.exceptions import NewConnectionError, ProtocolError
+from qubipy.transport.retry import Retry_Policy, Retry_Budget
+from qubipy.transport.session import QubiPy_Session
+from qubipy.endpoints_rpc import BROADCAST_TRANSACTION, WALLET_BALANCE, LATEST_TICK
+from ..conftest import *
+
+""" RETRY POLICY TESTS """
+
+def make_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = MagicMock()
+    return response
+
+def connect_error():
+    return requests.ConnectionError(MagicMock(reason=NewConnectionError(None, 'refused')))
+
+def test_retry_recovers_from_transient_errors():
+    """
+    Test that connection errors and retryable status codes are retried until a request succeeds.
+    """
+    session = QubiPy_Session(retry=Retry_Policy(max_attempts=4))
+    responses = [requests.ReadTimeout(), make_response(503), make_response(200)]
+
+    with patch.object(session, '_send_once', side_effect=responses) as mock_send, \
+         patch('qubipy.transport.session.time.sleep') as mock_sleep:
+        response = session.get(f'{RPC_URL}{LATEST_TICK}')
+
+    assert response.status_code == 200
+    assert mock_send.call_count == 3
+    assert mock_sleep.call_count == 2
+
+def test_retry_gives_up_after_max_attempts():
+    """
+    Test that the last response is returned once every attempt was used.
+    """
+    session = QubiPy_Session(retry=Retry_Policy(max_attempts=3))
+
+    with patch.object(session, '_send_once', return_value=make_response(502)) as mock_send, \
+         patch('qubipy.transport.session.time.sleep'):
+        response = session.get(f'{RPC_URL}{LATEST_TICK}')
+
+    assert response.status_code == 502
+    assert mock_send.call_count == 3
+
+def test_retry_ignores_non_retryable_status():
+    """
+    Test that client errors such as 404 are returned immediately.
+    """
+    session = QubiPy_Session(retry=Retry_Policy())
+
+    with patch.object(session, '_send_once', return_value=make_response(404)) as mock_send:
+        assert session.get(f'{RPC_URL}{LATEST_TICK}').status_code == 404
+
+    assert mock_send.call_count == 1
+
+def test_broadcast_not_retried_after_reaching_server():
+    """
+    Test that a broadcast is not retried when the server may already have received it.
+    """
+    session = QubiPy_Session(retry=Retry_Policy(max_attempts=5))
+    url = f'{RPC_URL}{BROADCAST_TRANSACTION}'
+
+    with patch.object(session, '_send_once', side_effect=requests.ReadTimeout()) as mock_send:
+        with pytest.raises(requests.ReadTimeout):
+            session.post(url, json={'encodedTransaction': 'AAAA'})
+    assert mock_send.call_count == 1
+
+    with patch.object(session, '_send_once', side_effect=requests.ConnectionError(ProtocolError('reset'))) as mock_send:
+        with pytest.raises(requests.ConnectionError):
+            session.post(url, json={'encodedTransaction': 'AAAA'})
+    assert mock_send.call_count == 1
+
+    with patch.object(session, '_send_once', return_value=make_response(503)) as mock_send:
+        assert session.post(url, json={'encodedTransaction': 'AAAA'}).status_code == 503
+    assert mock_send.call_count == 1
+
+def test_broadcast_retried_when_never_sent():
+    """
+    Test that a broadcast is retried when the connection could not be established or the server answered 429.
+    """
+    session = QubiPy_Session(retry=Retry_Policy(max_attempts=5))
+    url = f'{RPC_URL}{BROADCAST_TRANSACTION}'
+    responses = [connect_error(), requests.ConnectTimeout(), make_response(429), make_response(200)]
+
+    with patch.object(session, '_send_once', side_effect=responses) as mock_send, \
+         patch('qubipy.transport.session.time.sleep'):
+        assert session.post(url, json={'encodedTransaction': 'AAAA'}).status_code == 200
+
+    assert mock_send.call_count == 4
+
+def test_retry_after_header():
+    """
+    Test that Retry-After delays are honoured, and that waits longer than backoff_max stop retrying.
+    """
+    policy = Retry_Policy(backoff_factor=0.1, backoff_max=10, jitter=False)
+
+    assert policy.backoff(1, make_response(429, {'Retry-After': '3'})) == 3
+    assert policy.backoff(1, make_response(429, {'Retry-After': '60'})) is None
+    assert policy.backoff(1, make_response(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.1
+    assert policy.backoff(1, make_response(503)) == 0.1
+
+def test_backoff_is_exponential_with_full_jitter():
+    """
+    Test that the backoff doubles per attempt, is capped, and is spread between zero and the cap with jitter.
+    """
+    policy = Retry_Policy(backoff_factor=0.5, backoff_max=3, jitter=False)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [0.5, 1, 2, 3]
+
+    jittered = Retry_Policy(backoff_factor=0.5, backoff_max=3)
+    with patch('qubipy.transport.retry.random.uniform', return_value=0.25) as mock_uniform:
+        assert jittered.backoff(3) == 0.25
+    mock_uniform.assert_called_once_with(0, 2)
+
+def test_retry_budget_limits_retries():
+    """
+    Test that once the budget is exhausted failed requests are no longer retried.
+    """
+    budget = Retry_Budget(ratio=0, min_per_second=0.1, window=10)
+    session = QubiPy_Session(retry=Retry_Policy(max_attempts=3, budget=budget))
+
+    with patch.object(session, '_send_once', return_value=make_response(503)) as mock_send, \
+         patch('qubipy.transport.session.time.sleep'):
+        session.get(f'{RPC_URL}{LATEST_TICK}')
+        session.get(f'{RPC_URL}{LATEST_TICK}')
+
+    assert mock_send.call_count == 3
+
+def test_retry_budget_grows_with_traffic():
+    """
+    Test that every request earns a fraction of a retry.
+    """
+    budget = Retry_Budget(ratio=0.5, min_per_second=0, window=10)
+
+    assert budget.try_acquire() is False
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+def test_per_endpoint_policies():
+    """
+    Test that endpoint overrides apply to matching URLs, share the parent budget and can disable retries.
+    """
+    balance_policy = Retry_Policy(max_attempts=6)
+    policy = Retry_Policy(endpoints={WALLET_BALANCE: balance_policy, LATEST_TICK: None})
+
+    assert policy.for_url(f'{RPC_URL}/v1/balances/{"A" * 60}') is balance_policy
+    assert balance_policy.budget is policy.budget
+    assert policy.for_url(f'{RPC_URL}{LATEST_TICK}') is None
+    assert policy.for_url(f'{RPC_URL}/v1/status') is policy
+
+    session = QubiPy_Session(retry=policy)
+    with patch.object(session, '_send_once', side_effect=requests.ReadTimeout()) as mock_send:
+        with pytest.raises(requests.ReadTimeout):
+            session.get(f'{RPC_URL}{LATEST_TICK}')
+    assert mock_send.call_count == 1
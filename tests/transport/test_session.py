@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.transport.session import QubiPy_Session
+from ..conftest import *
+
+""" POOLED SESSION TESTS """
+
+def test_session_mounts_pooled_adapter():
+    """
+    Test that the session mounts an adapter configured with the requested pool sizes
+    for both HTTP and HTTPS.
+    """
+    session = QubiPy_Session(pool_connections=3, pool_maxsize=7)
+
+    for prefix in ('https://', 'http://'):
+        adapter = session.get_adapter(f'{prefix}rpc.qubic.org')
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+
+    session.close()
+
+@pytest.mark.parametrize("pool_connections, pool_maxsize", [(0, 10), (10, 0), ("10", 10)])
+def test_session_invalid_pool_config(pool_connections, pool_maxsize):
+    """
+    Test that invalid pool sizes raise a QubiPy_Exceptions with INVALID_POOL_CONFIG.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        QubiPy_Session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_POOL_CONFIG
+
+def test_session_recycles_idle_connections():
+    """
+    Test that pooled connections are dropped once the session has been idle
+    longer than the keep-alive lifetime, and kept otherwise.
+    """
+    session = QubiPy_Session(keep_alive=30)
+    poolmanager = session.get_adapter(RPC_URL).poolmanager
+
+    with patch.object(poolmanager, 'clear') as mock_clear, \
+         patch('requests.Session.request', return_value=None):
+        session.get(RPC_URL)
+        mock_clear.assert_not_called()
+
+        session._last_used -= 31
+        session.get(RPC_URL)
+        mock_clear.assert_called_once()
+
+def test_session_keep_alive_disabled():
+    """
+    Test that a keep_alive of None never recycles pooled connections.
+    """
+    session = QubiPy_Session(keep_alive=None)
+    poolmanager = session.get_adapter(RPC_URL).poolmanager
+
+    with patch.object(poolmanager, 'clear') as mock_clear, \
+         patch('requests.Session.request', return_value=None):
+        session._last_used -= 10_000
+        session.get(RPC_URL)
+        mock_clear.assert_not_called()
+
+""" CLIENT LIFECYCLE TESTS """
+
+def test_clients_share_session():
+    """
+    Test that a session passed to both clients is reused and left open on close().
+    """
+    session = QubiPy_Session()
+    rpc = QubiPy_RPC(session=session)
+    core = QubiPy_Core(session=session)
+
+    assert rpc.session is session
+    assert core.session is session
+
+    with patch.object(session, 'close') as mock_close:
+        rpc.close()
+        core.close()
+        mock_close.assert_not_called()
+
+def test_client_context_manager_closes_owned_session():
+    """
+    Test that leaving the context manager closes the session owned by the client.
+    """
+    with patch('qubipy.transport.session.QubiPy_Session.close') as mock_close:
+        with QubiPy_RPC() as rpc:
+            assert isinstance(rpc.session, QubiPy_Session)
+        mock_close.assert_called_once()
+
+        with QubiPy_Core() as core:
+            assert isinstance(core.session, QubiPy_Session)
+        assert mock_close.call_count == 2
@@ -0,0 +1,92 @@
+import pytest
+from qubipy.crypto.utils import get_public_key_from_identity, kangaroo_twelve, verify
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.tx.builder import Tx_Builder
+from qubipy.tx.signer import Signer
+from qubipy.tx.utils import build_batch, BATCH_PROCESSES
+from qubipy.utils import get_tx_target_tick
+
+""" BATCH BUILDER TESTS """
+
+SEED = 'a' * 55
+
+@pytest.fixture(scope='module')
+def signer():
+    return Signer(SEED)
+
+@pytest.fixture(scope='module')
+def destinations():
+    return [Signer(letter * 55).identity for letter in 'bcdefg']
+
+def test_build_batch_matches_single_builds(signer, destinations):
+    """
+    Test that every transaction of a batch is the one Tx_Builder builds alone, in input order.
+    """
+    txs = [(destinations[i % len(destinations)], 1000 + i, 17056942 + i, 0, None) for i in range(50)]
+
+    built = build_batch(signer, txs, max_workers=4)
+
+    assert len(built) == 50
+    for (dest_id, amount, target_tick, _, _), (signed_tx, tx_id) in zip(txs, built):
+        expected = (Tx_Builder()
+                    .set_source_public_key(signer.public_key)
+                    .set_destination_public_key(get_public_key_from_identity(dest_id))
+                    .set_amount(amount)
+                    .set_target_tick(target_tick)
+                    .set_input_type(0)
+                    .set_input_size(0)
+                    .build(signer))
+        assert (signed_tx, tx_id) == (bytes(expected[1]), expected[3])
+        assert get_tx_target_tick(signed_tx) == target_tick
+
+def test_build_batch_signs_payload(signer, destinations):
+    """
+    Test that the payload follows the header, sets the input size and is covered by the signature.
+    """
+    payload = bytes(range(16))
+
+    [(signed_tx, tx_id)] = build_batch(SEED, [(destinations[0], 0, 100, 2, payload)], max_workers=1)
+
+    assert len(signed_tx) == 80 + len(payload) + 64
+    assert int.from_bytes(signed_tx[76:78], 'little') == 2
+    assert int.from_bytes(signed_tx[78:80], 'little') == len(payload)
+    assert signed_tx[80:96] == payload
+    assert verify(signer.public_key, kangaroo_twelve(signed_tx, 96, 32), signed_tx[96:])
+
+def test_build_batch_on_processes(signer, destinations):
+    """
+    Test that the process pool returns the same transactions as the thread pool.
+    """
+    txs = [(destinations[i % len(destinations)], i, 500 + i, 0, b'') for i in range(20)]
+
+    assert build_batch(signer, txs, max_workers=2, executor=BATCH_PROCESSES) == build_batch(signer, txs, max_workers=3)
+
+def test_build_batch_empty(signer):
+    """
+    Test that an empty batch starts no pool.
+    """
+    assert build_batch(signer, []) == []
+
+@pytest.mark.parametrize("tx", [
+    ('B' * 60, 1, 100, 0),
+    ('B' * 59, 1, 100, 0, None),
+    ('B' * 60, -1, 100, 0, None),
+    ('B' * 60, 1, 0, 0, None),
+    ('B' * 60, 1, 100, 70000, None),
+    ('B' * 60, 1, 100, 0, 'payload'),
+    ('B' * 60, 1, 100, 0, bytes(1025)),
+])
+def test_build_batch_invalid_tx(signer, tx):
+    """
+    Test that a malformed transaction rejects the whole batch before anything is signed.
+    """
+    with pytest.raises(QubiPy_Exceptions, match='Every transaction of a batch'):
+        build_batch(signer, [tx])
+
+@pytest.mark.parametrize("max_workers, executor", [(0, 'thread'), (2, 'fiber')])
+def test_build_batch_invalid_pool(signer, destinations, max_workers, executor):
+    """
+    Test that an invalid number of workers or executor is rejected.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        build_batch(signer, [(destinations[0], 1, 100, 0, None)], max_workers, executor)
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import patch, Mock
+from qubipy.crypto.utils import get_subseed_from_seed, get_private_key_from_subseed, get_public_key_from_private_key, get_identity_from_public_key, get_public_key_from_identity, kangaroo_twelve, verify
+from qubipy.tx.builder import Tx_Builder
+from qubipy.tx.signer import Signer
+from qubipy.tx.utils import create_tx
+
+""" SIGNER TESTS """
+
+SEED = 'a' * 55
+
+def make_builder(public_key, destination_public_key, target_tick=17056942):
+    return (Tx_Builder()
+            .set_source_public_key(public_key)
+            .set_destination_public_key(destination_public_key)
+            .set_amount(1000)
+            .set_target_tick(target_tick)
+            .set_input_type(0)
+            .set_input_size(0))
+
+def test_signer_derives_keys_once():
+    """
+    Test that the signer holds the keys derived from the seed.
+    """
+    subseed = get_subseed_from_seed(SEED.encode())
+    private_key = get_private_key_from_subseed(subseed)
+    public_key = get_public_key_from_private_key(private_key)
+
+    signer = Signer(SEED)
+
+    assert (signer.subseed, signer.private_key, signer.public_key) == (subseed, private_key, public_key)
+    assert signer.identity == get_identity_from_public_key(public_key)
+    assert SEED not in repr(signer) and subseed.hex() not in repr(signer)
+
+def test_invalid_seed_raises():
+    """
+    Test that a seed that is not 55 lowercase letters is rejected.
+    """
+    with pytest.raises(ValueError):
+        Signer('A' * 55)
+
+def test_build_with_signer_matches_build_with_seed():
+    """
+    Test that a Signer produces the same signed transaction as the seed, without deriving keys again.
+    """
+    signer = Signer(SEED)
+    destination = get_public_key_from_identity(Signer('b' * 55).identity)
+
+    expected = make_builder(signer.public_key, destination).build(SEED)
+
+    with patch('qubipy.tx.signer.get_subseed_from_seed') as mock_subseed:
+        built = make_builder(signer.public_key, destination).build(signer)
+
+    mock_subseed.assert_not_called()
+    assert built == expected
+
+    tx, signed_tx, signature, tx_hash = built
+    assert verify(signer.public_key, kangaroo_twelve(signed_tx, 80, 32), signature)
+    assert len(tx_hash) == 60
+
+def test_create_tx_accepts_signer():
+    """
+    Test that create_tx signs with the keys of a Signer.
+    """
+    signer = Signer(SEED)
+    destination_id = Signer('b' * 55).identity
+
+    with patch('qubipy.tx.utils.QubiPy_RPC.get_latest_tick', return_value=100):
+        expected = create_tx(SEED, destination_id, 1000, 105)
+        with patch('qubipy.tx.signer.get_subseed_from_seed') as mock_subseed:
+            assert create_tx(signer, destination_id, 1000, 105) == expected
+
+    mock_subseed.assert_not_called()
+
+def test_create_tx_closes_its_client():
+    """
+    Test that create_tx closes the client it opens, and reuses the one it is given.
+    """
+    destination_id = Signer('b' * 55).identity
+
+    with patch('qubipy.tx.utils.QubiPy_RPC.get_latest_tick', return_value=100), patch('qubipy.tx.utils.QubiPy_RPC.close') as mock_close:
+        create_tx(SEED, destination_id, 1000, 105)
+
+    mock_close.assert_called_once()
+
+    rpc_client = Mock()
+    rpc_client.get_latest_tick.return_value = 100
+
+    with patch('qubipy.tx.utils.QubiPy_RPC') as mock_rpc:
+        create_tx(SEED, destination_id, 1000, 105, rpc_client=rpc_client)
+
+    mock_rpc.assert_not_called()
+    rpc_client.get_latest_tick.assert_called_once()
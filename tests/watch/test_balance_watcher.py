@@ -0,0 +1,220 @@
+import pytest
+import asyncio
+import requests
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.watch.balances import Balance_Watcher, Async_Balance_Watcher, Balance_Change
+from ..conftest import *
+
+""" BALANCE WATCHER TESTS """
+
+ALICE = 'A' * 60
+BOB = 'B' * 60
+CAROL = 'C' * 60
+DAVE = 'D' * 60
+
+class FakeNetwork:
+    """
+    A ledger whose balances only change through the transfers registered for a tick.
+    """
+    def __init__(self, tick=100):
+        self.tick = tick
+        self.processed_tick = tick
+        self.ledger = {ALICE: 1000, BOB: 1000, CAROL: 1000, DAVE: 1000}
+        self.last_transfer = {identity: 0 for identity in self.ledger}
+        self.transfers = {}
+        self.empty_ticks = set()
+        self.approved_calls = []
+        self.balance_calls = []
+
+    def transfer(self, tick, source, dest, amount):
+        self.transfers.setdefault(tick, []).append({'sourceId': source, 'destId': dest, 'amount': str(amount), 'tickNumber': tick})
+        self.ledger[source] -= amount
+        self.ledger[dest] += amount
+        self.last_transfer[source] = self.last_transfer[dest] = tick
+
+    def get_tick_info(self):
+        return {'tick': self.tick, 'duration': 1, 'epoch': 150, 'initialTick': 1}
+
+    def get_approved_transaction_for_tick(self, tick):
+        self.approved_calls.append(tick)
+        if tick in self.empty_ticks:
+            response = requests.Response()
+            response.status_code = 404
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as E:
+                raise QubiPy_Exceptions(f"Failed to retrieve the approved transactions from the API: {str(E)}") from None
+        if tick > self.processed_tick:
+            raise QubiPy_Exceptions('Failed to retrieve approved transactions: 404 Client Error')
+        return self.transfers.get(tick, [])
+
+    def get_balances(self, wallet_ids, max_workers=16):
+        self.balance_calls.append(set(wallet_ids))
+        return {wallet_id: {'id': wallet_id, 'balance': str(self.ledger[wallet_id]), 'validForTick': self.tick,
+                            'latestIncomingTransferTick': self.last_transfer[wallet_id],
+                            'latestOutgoingTransferTick': self.last_transfer[wallet_id]} for wallet_id in wallet_ids}, {}
+
+class AsyncFakeNetwork(FakeNetwork):
+    async def get_tick_info(self):
+        return FakeNetwork.get_tick_info(self)
+
+    async def get_approved_transaction_for_tick(self, tick):
+        return FakeNetwork.get_approved_transaction_for_tick(self, tick)
+
+    async def get_balances(self, wallet_ids, max_workers=16):
+        return FakeNetwork.get_balances(self, wallet_ids, max_workers)
+
+def test_watcher_only_rereads_touched_wallets():
+    """
+    Test that after the snapshot only wallets appearing in approved transactions are re-read.
+    """
+    network = FakeNetwork()
+    changes = []
+    watcher = Balance_Watcher(network, [ALICE, BOB, CAROL], callback=changes.append)
+
+    assert watcher.poll() == []
+    assert network.balance_calls == [{ALICE, BOB, CAROL}]
+
+    network.transfer(102, ALICE, DAVE, 300)
+    network.tick = network.processed_tick = 103
+    watcher.poll()
+
+    assert network.balance_calls[-1] == {ALICE}
+    assert changes == [Balance_Change(ALICE, 103, changes[0].previous, changes[0].current)]
+    assert changes[0].delta == -300
+
+    network.tick = network.processed_tick = 110
+    assert watcher.poll() == []
+    assert len(network.balance_calls) == 2
+
+def test_watcher_waits_for_unprocessed_ticks():
+    """
+    Test that ticks whose transactions are not available yet are replayed at the next poll.
+    """
+    network = FakeNetwork()
+    watcher = Balance_Watcher(network, [ALICE, BOB])
+    watcher.poll()
+
+    network.transfer(103, BOB, ALICE, 10)
+    network.tick, network.processed_tick = 105, 102
+    assert watcher.poll() == []
+    assert watcher.last_tick == 102
+
+    network.processed_tick = 105
+    changes = watcher.poll()
+    assert sorted(change.identity for change in changes) == [ALICE, BOB]
+    assert all(change.tick == 105 for change in changes)
+
+def test_watcher_replays_past_empty_ticks():
+    """
+    Test that an empty or skipped tick in the middle of a replayed range counts as having no transactions,
+    so the ticks after it are replayed at once and not requested again.
+    """
+    network = FakeNetwork()
+    watcher = Balance_Watcher(network, [ALICE, BOB])
+    watcher.poll()
+
+    network.empty_ticks.add(101)
+    network.transfer(103, BOB, ALICE, 10)
+    network.tick = network.processed_tick = 105
+    changes = watcher.poll()
+
+    assert sorted(change.identity for change in changes) == [ALICE, BOB]
+    assert watcher.last_tick == 105
+    assert sorted(network.approved_calls) == [101, 102, 103, 104, 105]
+
+    network.tick = network.processed_tick = 106
+    watcher.poll()
+    assert sorted(network.approved_calls) == [101, 102, 103, 104, 105, 106]
+
+def test_watcher_waits_for_the_current_empty_tick():
+    """
+    Test that a 404 for the tick in progress is not taken as an empty tick.
+    """
+    network = FakeNetwork()
+    watcher = Balance_Watcher(network, [ALICE])
+    watcher.poll()
+
+    network.empty_ticks.add(103)
+    network.tick = network.processed_tick = 103
+    watcher.poll()
+
+    assert watcher.last_tick == 102
+
+def test_watcher_full_refresh_catches_unexplained_changes():
+    """
+    Test that a periodic full refresh reports changes no transaction explained.
+    """
+    network = FakeNetwork()
+    watcher = Balance_Watcher(network, [ALICE, BOB], full_refresh_ticks=50)
+    watcher.poll()
+
+    network.ledger[BOB] += 5
+    network.last_transfer[BOB] = 120
+    network.tick = network.processed_tick = 149
+    assert watcher.poll() == []
+
+    network.tick = network.processed_tick = 150
+    changes = watcher.poll()
+    assert [change.identity for change in changes] == [BOB]
+    assert network.balance_calls[-1] == {ALICE, BOB}
+
+def test_watcher_long_gap_triggers_full_refresh():
+    """
+    Test that a gap longer than max_tick_gap is not replayed tick by tick.
+    """
+    network = FakeNetwork()
+    watcher = Balance_Watcher(network, [ALICE], max_tick_gap=10)
+    watcher.poll()
+
+    network.tick = network.processed_tick = 500
+    watcher.poll()
+
+    assert watcher.last_tick == 500
+    assert network.balance_calls[-1] == {ALICE}
+
+def test_watcher_rejects_invalid_wallets():
+    """
+    Test that invalid wallet IDs are rejected up front.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        Balance_Watcher(FakeNetwork(), [ALICE, 'not-a-wallet'])
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_ADDRESS_ID
+
+def test_async_watcher_iterates_changes():
+    """
+    Test that the asyncio watcher yields changes through its async iterator.
+    """
+    network = AsyncFakeNetwork()
+    watcher = Async_Balance_Watcher(network, [ALICE, BOB], interval=0)
+
+    async def run():
+        changes = watcher.__aiter__()
+        await watcher.poll()
+        network.transfer(101, ALICE, BOB, 7)
+        network.tick = network.processed_tick = 101
+        return [await changes.__anext__(), await changes.__anext__()]
+
+    changes = asyncio.run(run())
+
+    assert sorted((change.identity, change.delta) for change in changes) == [(ALICE, -7), (BOB, 7)]
+
+def test_async_watcher_replays_past_empty_ticks():
+    """
+    Test that the asyncio watcher also replays past empty or skipped ticks as having no transactions.
+    """
+    network = AsyncFakeNetwork()
+    watcher = Async_Balance_Watcher(network, [ALICE, BOB])
+
+    async def run():
+        await watcher.poll()
+        network.empty_ticks.update({101, 102})
+        network.transfer(104, ALICE, BOB, 3)
+        network.tick = network.processed_tick = 106
+        return await watcher.poll()
+
+    changes = asyncio.run(run())
+
+    assert sorted((change.identity, change.delta) for change in changes) == [(ALICE, -3), (BOB, 3)]
+    assert watcher.last_tick == 106
@@ -0,0 +1,107 @@
+import pytest
+import asyncio
+import itertools
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.rpc.async_rpc_client import AsyncQubiPy_RPC
+from qubipy.watch.ticks import Tick_Pacer
+from ..conftest import *
+
+""" FOLLOW TICKS TESTS """
+
+def test_follow_ticks_yields_each_tick_once_in_order(rpc_client):
+    """
+    Test that ticks skipped between polls are back-filled and repeated polls yield nothing twice.
+    """
+    latest = iter([100, 100, 103, 103, 104, 110])
+
+    with patch.object(rpc_client, 'get_latest_tick', side_effect=lambda: next(latest)), patch('qubipy.watch.ticks.time.sleep') as mock_sleep:
+        ticks = list(itertools.islice(rpc_client.follow_ticks(), 11))
+
+    assert ticks == list(range(100, 111))
+    assert mock_sleep.call_count == 5
+
+def test_follow_ticks_backfills_from_start_tick(rpc_client):
+    """
+    Test that following from an older tick first yields every tick up to the latest one.
+    """
+    with patch.object(rpc_client, 'get_latest_tick', return_value=50), patch('qubipy.watch.ticks.time.sleep'):
+        assert list(itertools.islice(rpc_client.follow_ticks(start_tick=45), 6)) == [45, 46, 47, 48, 49, 50]
+
+def test_follow_ticks_hydrates_ticks(rpc_client):
+    """
+    Test that hydrated ticks come with their data, fetched through fetch_tick_range.
+    """
+    latest = iter([7, 9])
+
+    with patch.object(rpc_client, 'get_latest_tick', side_effect=lambda: next(latest)), \
+         patch.object(rpc_client, 'get_tick_data', side_effect=lambda tick: {'tickNumber': tick}), \
+         patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=lambda tick: [{'tickNumber': tick}]), \
+         patch('qubipy.watch.ticks.time.sleep'):
+        ticks = list(itertools.islice(rpc_client.follow_ticks(hydrate=['tick_data', 'approved_transactions']), 3))
+
+    assert [tick for tick, _ in ticks] == [7, 8, 9]
+    assert ticks[1][1] == {'tick_data': {'tickNumber': 8}, 'approved_transactions': [{'tickNumber': 8}]}
+
+@pytest.mark.parametrize("kwargs", [{'hydrate': 'balances'}, {'hydrate': []}, {'start_tick': -5}, {'start_tick': '100'}])
+def test_follow_ticks_invalid_arguments(rpc_client, kwargs):
+    """
+    Test that invalid arguments are rejected when the follower is created.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        rpc_client.follow_ticks(**kwargs)
+
+def test_pacer_adapts_to_tick_interval():
+    """
+    Test that the delay follows the observed interval and backs off while no tick appears, and that
+    polls delivering a backlog of ticks, and the poll after them, are not sampled.
+    """
+    pacer = Tick_Pacer(initial_interval=1.0, min_delay=0.1, max_delay=8, decay=1.0)
+
+    pacer.observe(1, now=0)
+    pacer.observe(1, now=2)
+    assert pacer.delay() == pytest.approx(2)
+
+    pacer.observe(4, now=4)
+    assert pacer.delay() == pytest.approx(2)
+
+    pacer.observe(1, now=20)
+    assert pacer.delay() == pytest.approx(2)
+    pacer.observe(1, now=20.5)
+    assert pacer.delay() == pytest.approx(0.5)
+
+    pacer.observe(0)
+    assert pacer.delay() == pytest.approx(0.125)
+    pacer.observe(0)
+    pacer.observe(0)
+    assert pacer.delay() == pytest.approx(0.5)
+
+    for _ in range(10):
+        pacer.observe(0)
+    assert pacer.delay() == 8
+
+def test_async_follow_ticks_hydrates_in_order():
+    """
+    Test that the async iterator back-fills and hydrates ticks in order.
+    """
+    latest = iter([20, 20, 25])
+
+    async def get_latest_tick():
+        return next(latest)
+
+    async def get_tick_data(tick):
+        await asyncio.sleep(0.001 * (30 - tick))
+        return {'tickNumber': tick}
+
+    async def run():
+        async with AsyncQubiPy_RPC(rpc_url=RPC_URL) as client:
+            with patch.object(client, 'get_latest_tick', side_effect=get_latest_tick), \
+                 patch.object(client, 'get_tick_data', side_effect=get_tick_data), \
+                 patch('qubipy.watch.ticks.asyncio.sleep'):
+                results = []
+                async for tick, data in client.follow_ticks(start_tick=18, hydrate='tick_data', max_workers=2):
+                    results.append((tick, data['tickNumber']))
+                    if tick == 25:
+                        return results
+
+    assert asyncio.run(run()) == [(tick, tick) for tick in range(18, 26)]
@@ -0,0 +1,144 @@
+import pytest
+import asyncio
+import requests
+import threading
+from unittest.mock import patch
+from qubipy.exceptions import QubiPy_Exceptions
+from qubipy.core.core_client import QubiPy_Core
+from qubipy.rpc.async_rpc_client import AsyncQubiPy_RPC
+from qubipy.watch.transactions import Transaction_Tracker, Async_Transaction_Tracker, Transaction_Status
+from ..conftest import *
+
+""" TRANSACTION TRACKER TESTS """
+
+def approved(tick, tx_ids):
+    return [{'txId': tx_id, 'tickNumber': tick, 'amount': '1'} for tx_id in tx_ids]
+
+def test_tracker_resolves_each_tick_with_one_request(rpc_client):
+    """
+    Test that a thousand transactions spread over two ticks cost two requests once the ticks have passed.
+    """
+    tracker = Transaction_Tracker(rpc_client)
+    included = {100: {f'tx{index}' for index in range(0, 500, 2)}, 101: {f'tx{index}' for index in range(500, 1000)}}
+    futures = {f'tx{index}': tracker.track(f'tx{index}', 100 if index < 500 else 101) for index in range(1000)}
+
+    with patch.object(rpc_client, 'get_latest_tick', return_value=100), patch.object(rpc_client, 'get_approved_transaction_for_tick') as mock_approved:
+        assert tracker.poll() == 0
+    mock_approved.assert_not_called()
+
+    with patch.object(rpc_client, 'get_latest_tick', return_value=102), \
+         patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=lambda tick: approved(tick, included[tick])) as mock_approved:
+        assert tracker.poll() == 1000
+
+    assert mock_approved.call_count == 2
+    assert futures['tx2'].result(timeout=0) == Transaction_Status('tx2', 100, True)
+    assert futures['tx3'].result(timeout=0).included is False
+    assert futures['tx700'].result(timeout=0).included is True
+    assert len(tracker) == 0
+
+def test_tracker_with_core_client_reports_money_flew():
+    """
+    Test that the Core client resolves ticks that are over with getTickTransactionsStatus.
+    """
+    core_client = QubiPy_Core(core_url=CORE_URL)
+    tracker = Transaction_Tracker(core_client=core_client)
+    future = tracker.track('txa', 200)
+    status = {'transactionsStatus': [{'txId': 'txa', 'moneyFlew': False}]}
+
+    with patch.object(core_client, 'get_tick_info', return_value={'tick': 200}), patch.object(core_client, 'get_tick_transactions_status', return_value=status) as mock_status:
+        tracker.poll()
+        mock_status.assert_not_called()
+
+    with patch.object(core_client, 'get_tick_info', return_value={'tick': 201}), patch.object(core_client, 'get_tick_transactions_status', return_value=status):
+        tracker.poll()
+
+    assert future.result(timeout=0) == Transaction_Status('txa', 200, True, False)
+
+def test_tracker_fails_futures_after_retries(rpc_client):
+    """
+    Test that a tick that keeps failing is retried at later polls, then fails its futures.
+    """
+    tracker = Transaction_Tracker(rpc_client, retries=2)
+    future = tracker.track('txa', 100)
+    error = QubiPy_Exceptions('Failed to retrieve approved transactions: 500 Server Error')
+
+    with patch.object(rpc_client, 'get_latest_tick', return_value=101), patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=error):
+        tracker.poll()
+        tracker.poll()
+        assert not future.done()
+        tracker.poll()
+
+    assert future.exception(timeout=0) is error
+    assert tracker.pending_ticks == []
+
+def test_tracker_background_thread(rpc_client):
+    """
+    Test that a started tracker completes futures on its own.
+    """
+    with patch.object(rpc_client, 'get_latest_tick', return_value=101), \
+         patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=lambda tick: approved(tick, ['txa'])):
+        with Transaction_Tracker(rpc_client, interval=0.01) as tracker:
+            assert tracker.track('txa', 100).result(timeout=2).included is True
+
+@pytest.mark.parametrize("status", [400, 404])
+def test_tracker_resolves_empty_and_skipped_ticks(rpc_client, status):
+    """
+    Test that a tick the server reports as empty or skipped resolves its transactions as not included,
+    without retries, while other errors are still retried.
+    """
+    def get_approved_transaction_for_tick(tick):
+        response = requests.Response()
+        response.status_code = status if tick == 100 else 500
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as E:
+            raise QubiPy_Exceptions(f"Failed to retrieve the approved transactions from the API: {str(E)}") from None
+
+    tracker = Transaction_Tracker(rpc_client, retries=1)
+    empty, failing = tracker.track('txa', 100), tracker.track('txb', 101)
+
+    with patch.object(rpc_client, 'get_latest_tick', return_value=102), \
+         patch.object(rpc_client, 'get_approved_transaction_for_tick', side_effect=get_approved_transaction_for_tick):
+        assert tracker.poll() == 1
+
+    assert empty.result(timeout=0) == Transaction_Status('txa', 100, False)
+    assert not failing.done()
+    assert tracker.pending_ticks == [101]
+
+@pytest.mark.parametrize("tx_id, target_tick", [(None, 100), ('txa', 0), ('txa', '100')])
+def test_tracker_invalid_arguments(rpc_client, tx_id, target_tick):
+    """
+    Test that invalid transaction IDs and ticks are rejected.
+    """
+    with pytest.raises(QubiPy_Exceptions):
+        Transaction_Tracker(rpc_client).track(tx_id, target_tick)
+
+def test_tracker_needs_a_client():
+    """
+    Test that a tracker without any client is rejected.
+    """
+    with pytest.raises(QubiPy_Exceptions) as exc_info:
+        Transaction_Tracker()
+
+    assert str(exc_info.value) == QubiPy_Exceptions.INVALID_TRACKER_SOURCE
+
+def test_async_tracker_completes_asyncio_futures():
+    """
+    Test that the asyncio tracker completes awaitable futures.
+    """
+    async def get_latest_tick():
+        return 301
+
+    async def get_approved_transaction_for_tick(tick):
+        return approved(tick, ['txa'])
+
+    async def run():
+        async with AsyncQubiPy_RPC(rpc_url=RPC_URL) as client:
+            tracker = Async_Transaction_Tracker(client)
+            futures = [tracker.track('txa', 300), tracker.track('txb', 300)]
+            with patch.object(client, 'get_latest_tick', side_effect=get_latest_tick), \
+                 patch.object(client, 'get_approved_transaction_for_tick', side_effect=get_approved_transaction_for_tick):
+                await tracker.poll()
+            return await asyncio.gather(*futures)
+
+    assert asyncio.run(run()) == [Transaction_Status('txa', 300, True), Transaction_Status('txb', 300, False)]